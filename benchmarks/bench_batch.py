@@ -0,0 +1,60 @@
+"""
+Throughput benchmark of BatchGame against a loop over Game objects.
+
+Requires numpy. Run from the repository root:
+    python -m benchmarks.bench_batch
+"""
+
+import random
+import time
+
+import numpy as np
+
+from game.core.batch import MOVES, BatchGame
+from game.core.game import Game
+
+BATCH_SIZES = (1, 64, 1024, 8192)
+STEPS = 50
+SIZE = 4
+
+
+def bench_games(count: int) -> float:
+    """Return board steps per second of a Python loop over count games."""
+    random.seed(count)
+    games = [Game(SIZE) for _ in range(count)]
+    for game in games:
+        game.insert_new_tile()
+    moves = [random.choice(MOVES) for _ in range(STEPS * count)]
+
+    start = time.perf_counter()
+    for step in range(STEPS):
+        for idx, game in enumerate(games):
+            if game.step(moves[step * count + idx])[0]:
+                game.insert_new_tile()
+            if not game.can_move():
+                games[idx] = game = Game(SIZE)
+                game.insert_new_tile()
+    return STEPS * count / (time.perf_counter() - start)
+
+
+def bench_batch(count: int) -> float:
+    """Return board steps per second of one BatchGame of count boards."""
+    batch = BatchGame(count, SIZE, rng=count)
+    moves = np.random.default_rng(count).integers(0, 4, size=(STEPS, count))
+
+    start = time.perf_counter()
+    for step in range(STEPS):
+        batch.step(moves[step])
+    return STEPS * count / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'boards':>8}{'Game loop':>16}{'BatchGame':>16}{'speedup':>10}")
+    for count in BATCH_SIZES:
+        games = bench_games(count)
+        batch = bench_batch(count)
+        print(f"{count:>8}{games:>14,.0f}/s{batch:>14,.0f}/s{batch / games:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
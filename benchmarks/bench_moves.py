@@ -0,0 +1,134 @@
+"""
+Per-move micro benchmark for the 2048 engines.
+
+Run from the repository root:
+    python -m benchmarks.bench_moves
+"""
+
+import collections
+import contextlib
+import random
+import time
+
+from benchmarks.reference import ReferenceGame
+from game.core.bitboard import BitboardGame
+from game.core.compact import CompactGame
+from game.core.game import Game
+from game.core.tables import TableGame
+
+GRID = [
+    [2, 0, 4, 2],
+    [0, 4, 4, 8],
+    [2, 2, 0, 16],
+    [0, 0, 2, 2],
+]
+MOVES = ("move_left", "move_right", "move_up", "move_down")
+MOVE_LITERALS = {"move_left": "l", "move_right": "r", "move_up": "u", "move_down": "d"}
+NUMBER = 20_000
+"""Moves timed per repeat, across all directions."""
+REPEAT = 5
+SEQUENCE_SEED = 2048
+LARGE_SIZE = 64
+LARGE_STEPS = 400
+
+
+def move_sequence(seed: int = SEQUENCE_SEED) -> list[str]:
+    """Return the moves of a game played from GRID until no move is possible.
+
+    Spawns draw from the global random module seeded with seed, and every
+    move changes the grid; all engines draw spawns the same way, so replaying
+    the moves with the same seed yields the same game on each of them.
+    """
+    random.seed(seed)
+    choices = random.Random(seed)
+    game = Game(size=len(GRID))
+    game.grid = [row[:] for row in GRID]
+    moves = []
+    while game.can_move():
+        directions = list(MOVES)
+        choices.shuffle(directions)
+        # The first direction that changes the grid; unchanged moves are no-ops
+        move = next(move for move in directions if game.step(MOVE_LITERALS[move])[0])
+        moves.append(move)
+        game.insert_new_tile()
+    return moves
+
+
+def bench_engine(engine_cls: type, headless: bool = False) -> dict[str, float]:
+    """Return the best time per move in microseconds for every direction.
+
+    Replays move_sequence() on a live game, spawns included, and times every
+    move on its own, so the grid setter never enters the measurement.
+    With headless=True moves go through the logic-only Game.step().
+    """
+    moves = move_sequence()
+    games = max(1, NUMBER // len(moves))
+    counts = collections.Counter(moves)
+    game = engine_cls(size=len(GRID))
+    perf_counter = time.perf_counter
+    best = dict.fromkeys(MOVES, float("inf"))
+    for _ in range(REPEAT):
+        totals = dict.fromkeys(MOVES, 0.0)
+        for _ in range(games):
+            random.seed(SEQUENCE_SEED)
+            game.grid = [row[:] for row in GRID]
+            for move in moves:
+                if headless:
+                    literal = MOVE_LITERALS[move]
+                    start = perf_counter()
+                    game.step(literal)
+                else:
+                    method = getattr(game, move)
+                    start = perf_counter()
+                    method()
+                totals[move] += perf_counter() - start
+                game.insert_new_tile()
+        for move in MOVES:
+            per_move = totals[move] / (counts[move] * games) * 1e6
+            best[move] = min(best[move], per_move)
+    return best
+
+
+def bench_large_board(engine_cls: type) -> float:
+    """Return the time per headless step plus spawn in microseconds
+    on a half filled LARGE_SIZE x LARGE_SIZE board.
+    """
+    random.seed(LARGE_SIZE)
+    game = engine_cls(size=LARGE_SIZE)
+    for _ in range(LARGE_SIZE * LARGE_SIZE // 2):
+        game.insert_new_tile()
+
+    start = time.perf_counter()
+    for i in range(LARGE_STEPS):
+        game.step("lrud"[i % 4])
+        with contextlib.suppress(IndexError):
+            game.insert_new_tile()
+    return (time.perf_counter() - start) / LARGE_STEPS * 1e6
+
+
+def main():
+    # Speedups are relative to the frozen original mover, not to today's Game
+    engines = (ReferenceGame, Game, BitboardGame, TableGame, CompactGame)
+    all_results = {engine_cls: bench_engine(engine_cls) for engine_cls in engines}
+    baseline = all_results[ReferenceGame]
+    print(f"{'engine':<16}" + "".join(f"{move:>12}" for move in MOVES))
+    for engine_cls, results in all_results.items():
+        print(
+            f"{engine_cls.__name__:<16}"
+            + "".join(f"{results[move]:>10.2f}us" for move in MOVES)
+        )
+        print(
+            f"{'  speedup':<16}"
+            + "".join(f"{baseline[move] / results[move]:>11.1f}x" for move in MOVES)
+        )
+
+    results = bench_engine(Game, headless=True)
+    print(f"{'Game.step':<16}" + "".join(f"{results[m]:>10.2f}us" for m in MOVES))
+
+    print(f"\n{LARGE_SIZE}x{LARGE_SIZE} step + spawn")
+    for engine_cls in (Game, CompactGame):
+        print(f"{engine_cls.__name__:<16}{bench_large_board(engine_cls):>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
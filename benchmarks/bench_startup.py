@@ -0,0 +1,53 @@
+"""
+Interpreter startup benchmark for the headless and GUI import paths.
+
+Every sample is a fresh interpreter, as a new pool worker would be.
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+IMPORT_PATHS = {
+    "python": "pass",
+    "game.core.game": "from game.core.game import Game",
+    "game (lazy)": "import game",
+    "game.Game": "from game import Game",
+    "game GUI": "from game import Controller, Renderer",
+}
+REPEAT = 10
+
+
+def bench_import(statement: str) -> tuple[float, bool]:
+    """Return the best startup time in milliseconds of an interpreter running
+    the statement, and whether pygame ended up being imported.
+    """
+    code = f"{statement}\nimport sys\nprint('pygame' in sys.modules)"
+    best = float("inf")
+    loads_pygame = False
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+        )
+        best = min(best, time.perf_counter() - start)
+        loads_pygame = result.stdout.strip().endswith("True")
+    return best * 1e3, loads_pygame
+
+
+def main():
+    print(f"{'import path':<16}{'startup':>12}{'pygame':>8}")
+    for name, statement in IMPORT_PATHS.items():
+        startup, loads_pygame = bench_import(statement)
+        print(f"{name:<16}{startup:>10.1f}ms{'yes' if loads_pygame else 'no':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
-from game.core.game import Game
-from game.core.states import GameState
-from game.input.controller import Controller
-from game.rendering.renderer import Renderer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from game.core.game import Game
+    from game.core.states import GameState
+    from game.input.controller import Controller
+    from game.rendering.renderer import Renderer
 
 __all__ = [
     "Game",
@@ -9,3 +13,25 @@ __all__ = [
     "Controller",
     "Renderer",
 ]
+
+# Module defining every exported name. They are imported on first access, so
+# headless code importing game.core never loads pygame through this package.
+_EXPORTS = {
+    "Game": "game.core.game",
+    "GameState": "game.core.states",
+    "Controller": "game.input.controller",
+    "Renderer": "game.rendering.renderer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
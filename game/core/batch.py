@@ -0,0 +1,259 @@
+"""
+NumPy engine stepping many independent boards in lockstep.
+
+Requires the optional numpy dependency (pip install .[numpy]).
+"""
+
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from game.core.board import Board
+from game.core.game import SPAWN_TWO_PROBABILITY
+from game.core.tables import RowTable, get_row_table
+from game.core.types import MoveLiteral
+
+MOVES: tuple[MoveLiteral, ...] = ("l", "r", "u", "d")
+"""Move of every code accepted by BatchGame.shift() and BatchGame.step()."""
+
+MAX_TABLE_SIZE = 4
+"""Largest board size shifted through row tables; larger tables are slow to build."""
+
+_MOVE_CODES = {move: code for code, move in enumerate(MOVES)}
+
+
+class BatchStep(NamedTuple):
+    """Result of BatchGame.step(), one entry per board.
+
+    final_scores and final_max_tiles hold the score and largest tile of the
+    boards that finished (done) before they were reset, 0 elsewhere.
+    """
+    changed: np.ndarray
+    rewards: np.ndarray
+    done: np.ndarray
+    final_scores: np.ndarray
+    final_max_tiles: np.ndarray
+
+
+def _orient(cells: np.ndarray, move: MoveLiteral) -> np.ndarray:
+    """Return a view of (M, size, size) boards whose rows run in the direction
+    of the move, i.e. tiles move towards column 0.
+    """
+    if move == "l":
+        return cells
+    if move == "r":
+        return cells[:, :, ::-1]
+    if move == "u":
+        return cells.transpose(0, 2, 1)
+    return cells.transpose(0, 2, 1)[:, :, ::-1]
+
+
+class _TableShift:
+    """NumPy views of a row table, shifting all rows with a single gather."""
+    def __init__(self, table: RowTable):
+        self.base = table.base
+        self.shifted = np.frombuffer(table.shifted, dtype=np.uint8).reshape(
+            table.rows, table.size
+        )
+        self.score = np.frombuffer(table.score, dtype=np.uint32)
+        # Weight of every cell in the base-k row index
+        self.weights = table.base ** np.arange(table.size - 1, -1, -1, dtype=np.int64)
+
+    def __call__(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        fits = (rows < self.base).all(axis=1)
+        idx = np.where(fits, rows @ self.weights, 0)
+        packed = self.shifted[idx]
+        scores = self.score[idx].astype(np.int64)
+        if not fits.all():
+            # Rows holding an exponent outside the table
+            packed[~fits], scores[~fits] = _shift_rows(rows[~fits])
+        return packed, scores
+
+
+def _shift_rows(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Shift (R, size) exponent rows towards column 0 with merge logic.
+
+    Return the new rows and the score gained by every row.
+    """
+    # Stable sort on emptiness packs the tiles to the front, keeping their order
+    order = np.argsort(rows == 0, axis=1, kind="stable")
+    packed = np.take_along_axis(rows, order, axis=1)
+    scores = np.zeros(len(rows), dtype=np.int64)
+
+    # Merge left to right; the tiles after a merge move one cell down, so a
+    # merged tile is never compared again within the same move
+    for j in range(rows.shape[1] - 1):
+        merging = (packed[:, j] != 0) & (packed[:, j] == packed[:, j + 1])
+        if not merging.any():
+            continue
+        merged = packed[merging]
+        scores[merging] += np.left_shift(2, merged[:, j].astype(np.int64))
+        merged[:, j] += 1
+        merged[:, j + 1 : -1] = merged[:, j + 2 :]
+        merged[:, -1] = 0
+        packed[merging] = merged
+    return packed, scores
+
+
+class BatchGame:
+    """
+    N independent 2048 boards advanced together with vectorized NumPy code.
+    Stores the log2 exponents of all grids in one (N, size, size) uint8 array
+    (0 is an empty cell). Every step applies one move per board, spawns on the
+    boards that changed and resets the boards that cannot move any more.
+    Boards up to MAX_TABLE_SIZE shift all their rows through one gather from
+    the row table of tables.TableGame.
+    Given the same draws, every board evolves exactly like a Game would.
+    """
+    def __init__(
+        self,
+        count: int,
+        size: int = 4,
+        rng: np.random.Generator | int | None = None,
+        initial_tiles: int = 1,
+        auto_reset: bool = True,
+    ):
+        """
+        :param count: Number of boards
+        :param size: Grid dimension (size x size)
+        :param rng: NumPy generator (or its seed) drawing the spawns
+        :param initial_tiles: Tiles spawned on a new or reset board
+        :param auto_reset: Reset the boards that cannot move after a step
+        """
+        self.count = count
+        self.size = size
+        self.rng = np.random.default_rng(rng)
+        self.initial_tiles = initial_tiles
+        self.auto_reset = auto_reset
+        self.cells = np.zeros((count, size, size), dtype=np.uint8)
+        self.scores = np.zeros(count, dtype=np.int64)
+        self._shift_rows = (
+            _TableShift(get_row_table(size)) if size <= MAX_TABLE_SIZE else _shift_rows
+        )
+        self.reset()
+
+    def reset(self, where: np.ndarray | None = None) -> None:
+        """Clear the selected boards (all by default) and spawn initial tiles."""
+        where = self._mask(where)
+        self.cells[where] = 0
+        self.scores[where] = 0
+        for _ in range(self.initial_tiles):
+            self.insert_new_tiles(where)
+
+    def board(self, idx: int) -> Board:
+        """Return an immutable snapshot of a board."""
+        return Board(self.size, self.cells[idx].tobytes())
+
+    def set_board(self, idx: int, board: Board) -> None:
+        """Load a board into slot idx."""
+        if board.size != self.size:
+            raise ValueError(f"Expected a {self.size}x{self.size} board.")
+        self.cells[idx] = np.frombuffer(board.cells, dtype=np.uint8).reshape(
+            self.size, self.size
+        )
+
+    @property
+    def max_tiles(self) -> np.ndarray:
+        """Largest tile value of every board."""
+        max_exps = self.cells.max(axis=(1, 2)).astype(np.int64)
+        return np.where(max_exps > 0, np.left_shift(1, max_exps), 0)
+
+    def can_move(self) -> np.ndarray:
+        """Return for every board whether at least one move is possible."""
+        cells = self.cells
+        return (
+            (cells == 0).any(axis=(1, 2))
+            | (cells[:, :, 1:] == cells[:, :, :-1]).any(axis=(1, 2))
+            | (cells[:, 1:, :] == cells[:, :-1, :]).any(axis=(1, 2))
+        )
+
+    def shift(
+        self, moves: np.ndarray | Sequence[MoveLiteral] | str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Shift every board in the direction of its move, without spawning.
+
+        moves holds one move per board, as a move literal or its index in MOVES.
+        Return changed and the score gained by merges, per board.
+        """
+        codes = self._codes(moves)
+        changed = np.zeros(self.count, dtype=bool)
+        rewards = np.zeros(self.count, dtype=np.int64)
+        size = self.size
+
+        for code, move in enumerate(MOVES):
+            selected = np.flatnonzero(codes == code)
+            if not len(selected):
+                continue
+            old = self.cells[selected]
+            new = old.copy()
+            oriented = _orient(new, move)
+            rows, scores = self._shift_rows(oriented.reshape(-1, size))
+            oriented[...] = rows.reshape(-1, size, size)
+
+            self.cells[selected] = new
+            changed[selected] = (new != old).any(axis=(1, 2))
+            rewards[selected] = scores.reshape(-1, size).sum(axis=1)
+
+        self.scores += rewards
+        return changed, rewards
+
+    def insert_new_tiles(self, where: np.ndarray | None = None) -> None:
+        """Create a new tile (2 or 4) in a random empty cell of the selected boards.
+
+        Boards without an empty cell are skipped.
+        """
+        where = self._mask(where)
+        empty_counts = (self.cells == 0).sum(axis=(1, 2))
+        where &= empty_counts > 0
+        selected = np.flatnonzero(where)
+        ranks = self.rng.integers(0, empty_counts[selected])
+        draws = self.rng.random(len(selected))
+        self.place_tiles(selected, ranks, draws)
+
+    def place_tiles(
+        self, selected: np.ndarray, ranks: np.ndarray, draws: np.ndarray
+    ) -> None:
+        """Spawn a tile on every selected board from explicit random draws.
+
+        The tile goes to the ranks-th empty cell in row-major order and is
+        a 2 if the draw is below SPAWN_TWO_PROBABILITY, else a 4. That is the
+        mapping Game.insert_new_tile() applies to rng.randrange(empty_count)
+        and rng.random().
+        """
+        selected = np.asarray(selected, dtype=np.intp)
+        flat = self.cells.reshape(self.count, -1)
+        empty_ranks = np.cumsum(flat[selected] == 0, axis=1)
+        # First cell where the running count of empty cells exceeds the rank
+        idx = np.argmax(empty_ranks > np.asarray(ranks)[:, None], axis=1)
+        exps = np.where(np.asarray(draws) < SPAWN_TWO_PROBABILITY, 1, 2)
+        flat[selected, idx] = exps
+
+    def step(self, moves: np.ndarray | Sequence[MoveLiteral] | str) -> BatchStep:
+        """Apply one move per board, spawn a tile on every changed board and
+        detect finished boards, resetting them if auto_reset is enabled.
+        """
+        changed, rewards = self.shift(moves)
+        self.insert_new_tiles(changed)
+
+        done = ~self.can_move()
+        final_scores = np.where(done, self.scores, 0)
+        final_max_tiles = np.where(done, self.max_tiles, 0)
+        if self.auto_reset and done.any():
+            self.reset(done)
+        return BatchStep(changed, rewards, done, final_scores, final_max_tiles)
+
+    def _mask(self, where: np.ndarray | None) -> np.ndarray:
+        if where is None:
+            return np.ones(self.count, dtype=bool)
+        return np.array(where, dtype=bool)
+
+    def _codes(self, moves: np.ndarray | Sequence[MoveLiteral] | str) -> np.ndarray:
+        codes = np.asarray(list(moves) if isinstance(moves, str) else moves)
+        if codes.dtype.kind in "US":
+            codes = np.array([_MOVE_CODES[move] for move in codes.tolist()])
+        if codes.shape != (self.count,):
+            raise ValueError(f"Expected one move per board ({self.count}).")
+        if codes.size and not ((codes >= 0) & (codes < len(MOVES))).all():
+            raise ValueError(f"Move codes must be between 0 and {len(MOVES) - 1}.")
+        return codes
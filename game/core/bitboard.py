@@ -0,0 +1,296 @@
+import functools
+import random
+
+from game.core.types import MoveLiteral
+
+CELL_BITS = 4
+CELL_MASK = (1 << CELL_BITS) - 1
+MAX_EXPONENT = CELL_MASK
+"""Largest exponent a cell can hold (2 ** 15 = 32768)."""
+
+
+class _RowTables:
+    """Precomputed row transitions for a single board size.
+
+    A row is the packed exponents of one board line, cell 0 in the lowest nibble.
+    Every table is indexed by the packed row and describes a shift towards
+    cell 0 ("left") or towards the last cell ("right"). The column tables hold
+    the same results spread into column 0 of a board, so a shifted column is
+    placed back without a second transpose.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self.row_bits = size * CELL_BITS
+        self.row_mask = (1 << self.row_bits) - 1
+
+        rows = 1 << self.row_bits
+        self.left: list[int] = [0] * rows
+        self.right: list[int] = [0] * rows
+        self.up: list[int] = [0] * rows
+        self.down: list[int] = [0] * rows
+        self.left_bias: list[tuple[int, ...]] = [()] * rows
+        self.right_bias: list[tuple[int, ...]] = [()] * rows
+
+        for row in range(rows):
+            cells = [(row >> (CELL_BITS * i)) & CELL_MASK for i in range(size)]
+
+            new_cells, bias = self._shift_cells(cells)
+            self.left[row] = self._pack(new_cells)
+            self.up[row] = self._pack(new_cells, stride=size)
+            self.left_bias[row] = bias
+
+            new_cells, bias = self._shift_cells(cells[::-1])
+            self.right[row] = self._pack(new_cells[::-1])
+            self.down[row] = self._pack(new_cells[::-1], stride=size)
+            self.right_bias[row] = bias[::-1]
+
+    def _shift_cells(self, cells: list[int]) -> tuple[list[int], tuple[int, ...]]:
+        """Shift exponents towards index 0 with merge logic.
+
+        Return new exponents and per-cell displacement.
+        """
+        new_cells: list[int] = []
+        bias = [0] * self.size
+        mergeable = False
+        for idx, exp in enumerate(cells):
+            if exp == 0:
+                continue
+            if mergeable and new_cells[-1] == exp:
+                new_cells[-1] = exp + 1
+                mergeable = False
+            else:
+                new_cells.append(exp)
+                # A maxed out cell cannot grow any further, so it never merges.
+                mergeable = exp < MAX_EXPONENT
+            bias[idx] = idx - (len(new_cells) - 1)
+
+        new_cells += [0] * (self.size - len(new_cells))
+        return new_cells, tuple(bias)
+
+    @staticmethod
+    def _pack(cells: list[int], stride: int = 1) -> int:
+        packed = 0
+        for i, exp in enumerate(cells):
+            packed |= exp << (CELL_BITS * stride * i)
+        return packed
+
+
+# Transpose: cell (r, c) at nibble n*r + c moves to nibble n*c + r,
+# i.e. by (n - 1) * (c - r) nibbles. Cells sharing c - r move together.
+def _transpose_3x3(x: int) -> int:
+    return (
+        (x & 0xF000F000F)
+        | ((x & 0x000F000F0) << 8)
+        | ((x & 0x0F000F000) >> 8)
+        | ((x & 0x000000F00) << 16)
+        | ((x & 0x00F000000) >> 16)
+    )
+
+
+# The 4x4 case swaps 2x2 blocks of nibbles first and then 2x2 blocks of bytes.
+def _transpose_4x4(x: int) -> int:
+    a = (
+        (x & 0xF0F00F0FF0F00F0F)
+        | ((x & 0x0000F0F00000F0F0) << 12)
+        | ((x & 0x0F0F00000F0F0000) >> 12)
+    )
+    return (
+        (a & 0xFF00FF0000FF00FF)
+        | ((a & 0x00FF00FF00000000) >> 24)
+        | ((a & 0x00000000FF00FF00) << 24)
+    )
+
+
+_TRANSPOSE = {3: _transpose_3x3, 4: _transpose_4x4}
+
+
+@functools.cache
+def _get_row_tables(size: int) -> _RowTables:
+    """Build row tables lazily, once per board size and process."""
+    return _RowTables(size)
+
+
+class BitboardGame:
+    """
+    Alternative 2048 engine for small boards.
+    Packs the grid as log2 exponents into a single int (4 bits per cell)
+    and resolves moves with precomputed row tables and a bit-level transpose.
+    Exposes the same contract as Game.
+    """
+    SUPPORTED_SIZES = (3, 4)
+
+    def __init__(self, size: int = 4):
+        """
+        :param size: Grid dimension (size x size), either 3 or 4
+        """
+        if size not in self.SUPPORTED_SIZES:
+            raise ValueError(
+                f"BitboardGame supports sizes {self.SUPPORTED_SIZES}, got {size}."
+            )
+
+        self.size = size
+        self.board = 0
+        self._tables = _get_row_tables(size)
+        self._transpose = _TRANSPOSE[size]
+        self._row_shifts = tuple(self._tables.row_bits * r for r in range(size))
+        self._col_shifts = tuple(
+            (self._tables.row_bits * c, CELL_BITS * c) for c in range(size)
+        )
+
+    @property
+    def grid(self) -> list[list[int]]:
+        """Return the board unpacked into tile values (list[list[int]])."""
+        grid: list[list[int]] = []
+        for r in range(self.size):
+            row: list[int] = []
+            for c in range(self.size):
+                exp = (self.board >> (CELL_BITS * (self.size * r + c))) & CELL_MASK
+                row.append(1 << exp if exp else 0)
+            grid.append(row)
+        return grid
+
+    @grid.setter
+    def grid(self, grid: list[list[int]]) -> None:
+        board = 0
+        for r, row in enumerate(grid):
+            for c, value in enumerate(row):
+                board |= self._to_exponent(value) << (
+                    CELL_BITS * (self.size * r + c)
+                )
+        self.board = board
+
+    def insert_new_tile(self) -> tuple[int, int, int]:
+        """Create new tile (2 or 4) in random empty cell.
+
+        Return the value and coordinates of the inserted tile as (value, row, col).
+        """
+        empty_cells = [
+            idx
+            for idx in range(self.size * self.size)
+            if not (self.board >> (CELL_BITS * idx)) & CELL_MASK
+        ]
+        idx = random.choice(empty_cells)
+        exp = 1 if random.random() < 0.9 else 2
+        self.board |= exp << (CELL_BITS * idx)
+        return (1 << exp, *divmod(idx, self.size))
+
+    def can_move(self) -> bool:
+        """Return True if at least one move is possible.
+
+        A move is possible if there is an empty cell
+        or two adjacent tiles with the same value.
+        """
+        board = self.board
+        for idx in range(self.size * self.size):
+            if not (board >> (CELL_BITS * idx)) & CELL_MASK:
+                return True
+
+        # Without empty cells a row (column) changes in one direction
+        # exactly when it changes in the opposite one.
+        return (
+            self._shift_rows(board, self._tables.left)[0] != board
+            or self._shift_cols(board, self._tables.up)[0] != board
+        )
+
+    def check_victory(self) -> bool:
+        """Return True if the victory condition is reached.
+
+        Victory is achieved when at least one tile with value 2048 exists in the grid.
+        """
+        return any(
+            (self.board >> (CELL_BITS * idx)) & CELL_MASK == 11
+            for idx in range(self.size * self.size)
+        )
+
+    def get_score(self) -> int:
+        """Return the current game score.
+
+        The score is defined as the maximum tile value currently present on the grid.
+        """
+        max_exp = max(
+            (self.board >> (CELL_BITS * idx)) & CELL_MASK
+            for idx in range(self.size * self.size)
+        )
+        return 1 << max_exp if max_exp else 0
+
+    def move_left(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the left.
+
+        Return changed, bias_matrix and move type.
+        """
+        old = self.board
+        self.board, rows = self._shift_rows(old, self._tables.left)
+        bias_matrix = [list(self._tables.left_bias[row]) for row in rows]
+        return self.board != old, bias_matrix, "l"
+
+    def move_right(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the right.
+
+        Return changed, bias_matrix and move type.
+        """
+        old = self.board
+        self.board, rows = self._shift_rows(old, self._tables.right)
+        bias_matrix = [list(self._tables.right_bias[row]) for row in rows]
+        return self.board != old, bias_matrix, "r"
+
+    def move_up(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles upward.
+
+        Return changed, bias_matrix and move type.
+        """
+        old = self.board
+        self.board, cols = self._shift_cols(old, self._tables.up)
+        bias_matrix = list(
+            map(list, zip(*map(self._tables.left_bias.__getitem__, cols), strict=True))
+        )
+        return self.board != old, bias_matrix, "u"
+
+    def move_down(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles downward.
+
+        Return changed, bias_matrix and move type.
+        """
+        old = self.board
+        self.board, cols = self._shift_cols(old, self._tables.down)
+        bias_matrix = list(
+            map(list, zip(*map(self._tables.right_bias.__getitem__, cols), strict=True))
+        )
+        return self.board != old, bias_matrix, "d"
+
+    def _shift_rows(self, board: int, table: list[int]) -> tuple[int, list[int]]:
+        """Apply a row table to every row of the board.
+
+        Return the new board and the original packed rows.
+        """
+        row_mask = self._tables.row_mask
+        new_board = 0
+        rows: list[int] = []
+        for shift in self._row_shifts:
+            row = (board >> shift) & row_mask
+            rows.append(row)
+            new_board |= table[row] << shift
+        return new_board, rows
+
+    def _shift_cols(self, board: int, table: list[int]) -> tuple[int, list[int]]:
+        """Apply a column table to every column of the board.
+
+        Return the new board and the original columns packed as rows.
+        """
+        row_mask = self._tables.row_mask
+        transposed = self._transpose(board)
+        new_board = 0
+        cols: list[int] = []
+        for shift, col_shift in self._col_shifts:
+            col = (transposed >> shift) & row_mask
+            cols.append(col)
+            new_board |= table[col] << col_shift
+        return new_board, cols
+
+    @staticmethod
+    def _to_exponent(value: int) -> int:
+        if value == 0:
+            return 0
+        exp = value.bit_length() - 1
+        if value < 0 or value != 1 << exp or not 1 <= exp <= MAX_EXPONENT:
+            raise ValueError(f"Tile value {value} cannot be stored in a bitboard.")
+        return exp
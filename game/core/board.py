@@ -0,0 +1,70 @@
+from typing import Any
+
+# Tile value of every exponent a cell can hold; exponent 0 is an empty cell.
+_VALUES = (0, *(1 << exp for exp in range(1, 256)))
+
+
+class Board:
+    """
+    Immutable, hashable snapshot of a game grid.
+    Stores the log2 exponents of the tiles as bytes (one byte per cell,
+    row-major), so equality is a memcmp and the hash is computed only once.
+    """
+    __slots__ = ("size", "cells", "_hash", "__weakref__")
+
+    size: int
+    cells: bytes
+
+    def __init__(self, size: int, cells: bytes):
+        """
+        :param size: Grid dimension (size x size)
+        :param cells: Row-major tile exponents, 0 for empty cells
+        """
+        if len(cells) != size * size:
+            raise ValueError(f"Expected {size * size} cells, got {len(cells)}.")
+
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "cells", bytes(cells))
+        object.__setattr__(self, "_hash", hash((size, self.cells)))
+
+    @classmethod
+    def from_grid(cls, grid: list[list[int]]) -> "Board":
+        """Build a board from tile values (list[list[int]])."""
+        cells = bytearray()
+        for row in grid:
+            for value in row:
+                exp = value.bit_length() - 1
+                if value < 0 or value & (value - 1) or exp == 0 or exp > 255:
+                    raise ValueError(f"Tile value {value} is not a power of two.")
+                cells.append(exp if value else 0)
+        return cls(len(grid), bytes(cells))
+
+    def to_grid(self) -> list[list[int]]:
+        """Return the tile values as a new list[list[int]]."""
+        values = [_VALUES[exp] for exp in self.cells]
+        return [values[r * self.size : (r + 1) * self.size] for r in range(self.size)]
+
+    def __getitem__(self, pos: tuple[int, int]) -> int:
+        """Return the tile value at (row, col)."""
+        row, col = pos
+        return _VALUES[self.cells[row * self.size + col]]
+
+    def __reduce__(self):
+        return (Board, (self.size, self.cells))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("Board is immutable.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError("Board is immutable.")
+
+    def __eq__(self, other: Any):
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.size == other.size and self.cells == other.cells
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"Board.from_grid({self.to_grid()!r})"
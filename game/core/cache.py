@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache:
+    """
+    Size-bounded mapping that evicts the least recently used entry.
+    Counts hits and misses of get(), so the capacity can be tuned.
+    """
+    def __init__(self, capacity: int):
+        """
+        :param capacity: Maximum number of entries, 0 disables caching
+        """
+        if capacity < 0:
+            raise ValueError("Cache capacity must not be negative.")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value and mark it as recently used, or None."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if not self.capacity:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def __repr__(self):
+        return (
+            f"LRUCache(capacity={self.capacity}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
@@ -0,0 +1,130 @@
+"""
+Code generator for straight-line move functions.
+
+For a given board size and direction it emits Python source with every line
+and every cell spelled out (no loops, no rotations, no index arithmetic) and
+compiles it once per process. The generated functions implement Game.step()
+for games without history and keep all derived state of Game up to date.
+"""
+
+import functools
+from collections.abc import Callable
+
+from game.core.types import VICTORY_TILE, MoveLiteral
+from game.core.zobrist import ZOBRIST_SLOTS, get_zobrist_table
+
+MAX_UNROLLED_SIZE = 8
+"""Largest board size the generator covers; larger boards use the generic kernel."""
+
+StepFunction = Callable[..., tuple[bool, int]]
+
+
+def _line_cells(size: int, move: MoveLiteral) -> list[list[tuple[int, int]]]:
+    """Return the (row, col) of every line, starting where the tiles move to."""
+    rows = [[(r, c) for c in range(size)] for r in range(size)]
+    cols = [[(r, c) for r in range(size)] for c in range(size)]
+    return {
+        "l": rows,
+        "r": [row[::-1] for row in rows],
+        "u": cols,
+        "d": [col[::-1] for col in cols],
+    }[move]
+
+
+def _tuple(names: list[str]) -> str:
+    return ", ".join(names) + ("," if len(names) == 1 else "")
+
+
+def generate_step_source(size: int, move: MoveLiteral) -> str:
+    """Return the source of the unrolled step function for a size and move."""
+    olds = [f"o{i}" for i in range(size)]
+    news = [f"v{i}" for i in range(size)]
+    out = [
+        "def step(game):",
+        "    grid = game._grid",
+        f"    {_tuple([f'g{r}' for r in range(size)])} = grid",
+        "    empty = game._empty_mask",
+        "    zobrist = game._zobrist_hash",
+        "    max_tile = game._max_tile",
+        "    victory = game._victory_tiles",
+        "    touched = 0",
+        "    score = 0",
+    ]
+
+    for line in _line_cells(size, move):
+        out.append(f"    # line {line}")
+        reads = ", ".join(f"g{r}[{c}]" for r, c in line)
+        out.append(f"    {_tuple(olds)} = {reads}")
+        out.append(f"    {_tuple(news)} = {_tuple(olds)}")
+
+        # Compact the tiles towards cell 0; the suffix after j is compact already
+        for j in range(size - 2, -1, -1):
+            out.append(f"    if not v{j}:")
+            out.append(
+                f"        {_tuple(news[j:])} = {_tuple(news[j + 1:] + ['0'])}"
+            )
+
+        # Merge equal neighbours from cell 0 on, shifting the rest down
+        for j in range(size - 1):
+            out.append(f"    if v{j} and v{j} == v{j + 1}:")
+            out.append(f"        v{j} *= 2")
+            out.append(
+                f"        {_tuple(news[j + 1:])} = {_tuple(news[j + 2:] + ['0'])}"
+            )
+            out.append(f"        score += v{j}")
+            out.append(f"        if v{j} > max_tile:")
+            out.append(f"            max_tile = v{j}")
+            out.append(f"        if v{j} == {VICTORY_TILE}:")
+            out.append("            victory += 1")
+            out.append(f"        elif v{j} == {VICTORY_TILE * 2}:")
+            out.append("            victory -= 2")
+
+        changed = " or ".join(f"v{i} != o{i}" for i in range(size))
+        out.append(f"    if {changed}:")
+        for i, (r, c) in enumerate(line):
+            idx = r * size + c
+            bit = 1 << idx
+            key = idx * ZOBRIST_SLOTS
+            out += [
+                f"        if v{i} != o{i}:",
+                f"            g{r}[{c}] = v{i}",
+                f"            touched |= {bit}",
+                f"            if o{i}:",
+                f"                zobrist ^= keys[{key} + o{i}.bit_length()]",
+                "            else:",
+                f"                empty ^= {bit}",
+                f"            if v{i}:",
+                f"                zobrist ^= keys[{key} + v{i}.bit_length()]",
+                "            else:",
+                f"                empty ^= {bit}",
+            ]
+
+    out += [
+        "    if touched:",
+        "        game._empty_mask = empty",
+        "        game._touched_mask |= touched",
+        "        game._zobrist_hash = zobrist",
+        "        game._max_tile = max_tile",
+        "        game._victory_tiles = victory",
+        "        game._score += score",
+        "    return bool(touched), score",
+    ]
+    return "\n".join(out) + "\n"
+
+
+@functools.cache
+def get_step_functions(size: int) -> dict[MoveLiteral, StepFunction] | None:
+    """Compile the unrolled step functions of a board size, once per process.
+
+    Return None for sizes outside 2..MAX_UNROLLED_SIZE.
+    """
+    if not 2 <= size <= MAX_UNROLLED_SIZE:
+        return None
+
+    functions: dict[MoveLiteral, StepFunction] = {}
+    for move in ("l", "r", "u", "d"):
+        source = generate_step_source(size, move)
+        namespace = {"keys": get_zobrist_table(size)}
+        exec(compile(source, f"<2048 step {size}x{size} {move}>", "exec"), namespace)
+        functions[move] = namespace["step"]
+    return functions
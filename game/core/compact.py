@@ -0,0 +1,345 @@
+import functools
+import random
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from game.core.board import Board
+from game.core.game import SPAWN_TWO_PROBABILITY, VICTORY_TILE
+from game.core.types import MOVE_MASKS, MoveLiteral
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_Slice = tuple[int, int | None, int]
+
+# PyBUF_WRITABLE, the flag of buffer requests that need write access
+_PYBUF_WRITABLE = 0x0001
+
+# Two equal adjacent exponents; matching left to right without overlaps pairs
+# tiles up exactly like the merge rule does. DOTALL, as exponent 10 is b"\n".
+_PAIR = re.compile(rb"(.)\1", re.DOTALL)
+_MERGED = {bytes((exp, exp)): bytes((exp + 1,)) for exp in range(1, 255)}
+
+
+@functools.cache
+def _get_line_slices(size: int) -> dict[MoveLiteral, tuple[_Slice, ...]]:
+    """Return (start, stop, step) of every line, in the direction of each move.
+
+    Slicing the flat grid with them yields the line starting at the cell
+    the tiles move towards, without materializing a rotated grid.
+    """
+    last = size * size - 1
+
+    def reverse(start: int, step: int) -> _Slice:
+        stop = start - step
+        return start + step * (size - 1), (stop if stop >= 0 else None), -step
+
+    rows = tuple((r * size, (r + 1) * size, 1) for r in range(size))
+    cols = tuple((c, last + 1, size) for c in range(size))
+    return {
+        "l": rows,
+        "r": tuple(reverse(r * size, 1) for r in range(size)),
+        "u": cols,
+        "d": tuple(reverse(c, size) for c in range(size)),
+    }
+
+
+def _merge_pair(match: re.Match[bytes]) -> bytes:
+    return _MERGED[match.group()]
+
+
+def _merge_tiles(tiles: bytes) -> tuple[bytes, int]:
+    """Merge adjacent equal exponents of a packed line (no empty cells).
+
+    Return the merged exponents and the score gained by merges.
+    """
+    pairs = _PAIR.findall(tiles)
+    if not pairs:
+        return tiles, 0
+    return _PAIR.sub(_merge_pair, tiles), sum(2 << exp for (exp,) in pairs)
+
+
+class CompactGame:
+    """
+    2048 engine for large boards (e.g. 16x16 or 64x64).
+    Stores the log2 exponents of the grid in a single flat bytearray (one byte
+    per cell, row-major) and moves every line through an extended slice, so no
+    direction builds a rotated copy of the grid. Per-line flags remember which
+    lines a move left unchanged, so repeated moves skip them until a cell on
+    the line changes. Exposes the same contract as Game.
+    """
+    def __init__(self, size: int = 4):
+        """
+        :param size: Grid dimension (size x size)
+        """
+        self.size = size
+        self.score = 0
+        self.cells = bytearray(size * size)
+        self._slices = _get_line_slices(size)
+        self._reset_stable_flags()
+
+    @property
+    def grid(self) -> list[list[int]]:
+        """Return the board as tile values (list[list[int]])."""
+        values = [1 << exp if exp else 0 for exp in self.cells]
+        return [values[r * self.size : (r + 1) * self.size] for r in range(self.size)]
+
+    @grid.setter
+    def grid(self, grid: list[list[int]]) -> None:
+        self.board = Board.from_grid(grid)
+
+    @property
+    def board(self) -> Board:
+        """Immutable, hashable snapshot of the grid. Assigning it loads the grid."""
+        return Board(self.size, bytes(self.cells))
+
+    @board.setter
+    def board(self, board: Board) -> None:
+        if board.size != self.size:
+            raise ValueError(f"Expected a {self.size}x{self.size} board.")
+        self.cells[:] = board.cells
+        self._reset_stable_flags()
+
+    def view(self, readonly: bool = True) -> memoryview:
+        """Return a zero-copy (size, size) view of the tile exponents.
+
+        This is the portable zero-copy path; memoryview(game) needs Python
+        3.12+. The view follows every later move. After writing through a writable
+        view call invalidate(), so moves do not skip the changed lines.
+        """
+        view = memoryview(self.cells).cast("B", (self.size, self.size))
+        return view.toreadonly() if readonly else view
+
+    def invalidate(self) -> None:
+        """Forget which lines moves left unchanged, after external writes."""
+        self._reset_stable_flags()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol (Python 3.12+), memoryview(game) views the exponents."""
+        return self.view(readonly=not flags & _PYBUF_WRITABLE)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> "np.ndarray":
+        """NumPy protocol, np.asarray(game) is a read-only view of the exponents.
+
+        np.array(game) and dtype conversions return a writable copy instead.
+        """
+        import numpy as np
+
+        array = np.asarray(self.view())
+        if copy or (dtype is not None and np.dtype(dtype) != array.dtype):
+            if copy is False:
+                raise ValueError("Converting the exponents requires a copy.")
+            return array.astype(dtype if dtype is not None else array.dtype)
+        return array
+
+    @property
+    def max_tile(self) -> int:
+        """Largest tile value currently present on the grid."""
+        max_exp = max(self.cells)
+        return 1 << max_exp if max_exp else 0
+
+    def insert_new_tile(self) -> tuple[int, int, int]:
+        """Create new tile (2 or 4) in random empty cell.
+
+        Return the value and coordinates of the inserted tile as (value, row, col).
+        Draws the same random numbers as Game.insert_new_tile().
+        """
+        cells = self.cells
+        empty_count = cells.count(0)
+        if not empty_count:
+            raise IndexError("Cannot insert a tile into a full grid.")
+
+        # Locate the k-th empty cell in row-major order row by row
+        k = random.randrange(empty_count)
+        size = self.size
+        start = 0
+        while (row_empty := cells.count(0, start, start + size)) <= k:
+            k -= row_empty
+            start += size
+        idx = cells.find(0, start)
+        for _ in range(k):
+            idx = cells.find(0, idx + 1)
+
+        exp = 1 if random.random() < SPAWN_TWO_PROBABILITY else 2
+        cells[idx] = exp
+        row, col = divmod(idx, size)
+        self._stable_rows[row] = 0
+        self._stable_cols[col] = 0
+        return (1 << exp, row, col)
+
+    def can_move(self) -> bool:
+        """Return True if at least one move is possible.
+
+        A move is possible if there is an empty cell
+        or two adjacent tiles with the same value.
+        """
+        if 0 in self.cells:
+            return True
+
+        # Without empty cells a line changes in one direction
+        # exactly when it changes in the opposite one.
+        cells = self.cells
+        for start, stop, step in self._slices["l"] + self._slices["u"]:
+            line = cells[start:stop:step]
+            if any(a == b for a, b in zip(line, line[1:], strict=False)):
+                return True
+        return False
+
+    def check_victory(self) -> bool:
+        """Return True if the victory condition is reached.
+
+        Victory is achieved when at least one tile with value 2048 exists in the grid.
+        """
+        return VICTORY_TILE.bit_length() - 1 in self.cells
+
+    def get_score(self) -> int:
+        """Return the current game score.
+
+        The score is defined as the maximum tile value currently present on the grid.
+        """
+        return self.max_tile
+
+    def move_left(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the left.
+
+        Return changed, bias_matrix and move type.
+        """
+        changed, bias_matrix, _ = self._move("l")
+        return changed, bias_matrix, "l"
+
+    def move_right(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the right.
+
+        Return changed, bias_matrix and move type.
+        """
+        changed, bias_matrix, _ = self._move("r")
+        return changed, bias_matrix, "r"
+
+    def move_up(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles upward.
+
+        Return changed, bias_matrix and move type.
+        """
+        changed, bias_matrix, _ = self._move("u")
+        return changed, bias_matrix, "u"
+
+    def move_down(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles downward.
+
+        Return changed, bias_matrix and move type.
+        """
+        changed, bias_matrix, _ = self._move("d")
+        return changed, bias_matrix, "d"
+
+    def step(self, move: MoveLiteral) -> tuple[bool, int]:
+        """Shift tiles in the direction of the move without animation metadata.
+
+        Return changed and the score gained by merges.
+        """
+        changed, _, score = self._move(move, with_bias=False)
+        return changed, score
+
+    def _reset_stable_flags(self) -> None:
+        # Move flags of the directions known to leave a row (column) unchanged
+        self._stable_rows = bytearray(self.size)
+        self._stable_cols = bytearray(self.size)
+
+    def _move(
+        self, move: MoveLiteral, with_bias: bool = True
+    ) -> tuple[bool, list[list[int]], int]:
+        """Shift every line in the direction of the move with merge logic.
+
+        Return changed, bias matrix (empty unless with_bias)
+        and the score gained by merges.
+        """
+        size = self.size
+        cells = self.cells
+        flag = int(MOVE_MASKS[move])
+        if move in ("l", "r"):
+            stable, crossing_stable = self._stable_rows, self._stable_cols
+        else:
+            stable, crossing_stable = self._stable_cols, self._stable_rows
+        # Lines run backwards for "r" and "d", so are their crossing line indices
+        backward = move in ("r", "d")
+        bias_matrix = [[0] * size for _ in range(size)] if with_bias else []
+        changed = False
+        score = 0
+
+        for idx, (start, stop, step) in enumerate(self._slices[move]):
+            if stable[idx] & flag:
+                continue
+
+            line = cells[start:stop:step]
+            new_line, line_score = _merge_tiles(line.replace(b"\x00", b""))
+            new_line = new_line.ljust(size, b"\x00")
+            if new_line == line:
+                stable[idx] |= flag
+                continue
+
+            changed = True
+            score += line_score
+            cells[start:stop:step] = new_line
+            stable[idx] = 0
+
+            # Invalidate the crossing lines between the first and the last
+            # changed position
+            diff = int.from_bytes(line, "little") ^ int.from_bytes(new_line, "little")
+            lo = ((diff & -diff).bit_length() - 1) >> 3
+            hi = ((diff.bit_length() - 1) >> 3) + 1
+            if backward:
+                lo, hi = size - hi, size - lo
+            crossing_stable[lo:hi] = bytes(hi - lo)
+
+            if with_bias:
+                self._fill_bias(bias_matrix, start, step, line)
+
+        self.score += score
+        return changed, bias_matrix, score
+
+    def _fill_bias(
+        self, bias_matrix: list[list[int]], start: int, step: int, line: bytearray
+    ) -> None:
+        """Write the displacement of every tile of a line into the bias matrix."""
+        target = 0
+        last = 0
+        for pos, exp in enumerate(line):
+            if not exp:
+                continue
+            if exp == last:
+                bias = pos - target + 1
+                last = 0
+            else:
+                bias = pos - target
+                target += 1
+                last = exp
+            if bias:
+                r, c = divmod(start + step * pos, self.size)
+                bias_matrix[r][c] = bias
+
+
+def export_boards(
+    boards: Sequence[CompactGame | Board], out: "np.ndarray | None" = None
+) -> "np.ndarray":
+    """Copy the exponents of many boards into one (N, size, size) uint8 array.
+
+    Accepts CompactGame and Board objects of one size. Every board is a single
+    memcpy; pass a preallocated C-contiguous out array to reuse it across calls.
+    """
+    import numpy as np
+
+    size = boards[0].size if boards else 0
+    shape = (len(boards), size, size)
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif out.shape != shape or out.dtype != np.uint8 or not out.flags.c_contiguous:
+        raise ValueError(f"Expected a C-contiguous uint8 array of shape {shape}.")
+
+    buffer = memoryview(out).cast("B")
+    cell_count = size * size
+    for idx, board in enumerate(boards):
+        if board.size != size:
+            raise ValueError(f"Expected {size}x{size} boards only.")
+        start = idx * cell_count
+        buffer[start : start + cell_count] = board.cells
+    return out
@@ -1,36 +1,243 @@
-import copy
+import functools
 import itertools
 import random
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from game.core.board import Board
+from game.core.cache import LRUCache
+from game.core.codegen import get_step_functions
+from game.core.rng import RandomStreams
+from game.core.tables import shift_exponents
+from game.core.types import (
+    MOVE_MASKS,
+    VICTORY_TILE,
+    MoveEvent,
+    MoveLiteral,
+    MoveMask,
+)
+from game.core.zobrist import ZOBRIST_SLOTS, get_zobrist_table, zobrist_hash
+
+_Line = tuple[tuple[int, int, int, int], ...]
+_LEFT, _RIGHT, _UP, _DOWN = (int(mask) for mask in MoveMask)
+
+SPAWN_TWO_PROBABILITY = 0.9
+"""Probability that a spawned tile is a 2 rather than a 4."""
+
+MovePreview = tuple[Board, bool, int, tuple[tuple[int, ...], ...]]
+"""Result of Game.preview(): board, changed, score delta and bias matrix."""
+
+
+@functools.cache
+def _get_lines(size: int) -> dict[MoveLiteral, tuple[_Line, ...]]:
+    """Return the cells of every line, listed in the direction of each move.
+
+    Each cell is (row, col, bit, key), where bit is the cell's flag in the
+    empty-cell mask and key the offset of its Zobrist keys. The first cell
+    of a line is the one tiles move towards.
+    """
+    def cell(r: int, c: int) -> tuple[int, int, int, int]:
+        idx = r * size + c
+        return (r, c, 1 << idx, idx * ZOBRIST_SLOTS)
+
+    rows = [tuple(cell(r, c) for c in range(size)) for r in range(size)]
+    cols = [tuple(cell(r, c) for r in range(size)) for c in range(size)]
+    return {
+        "l": tuple(rows),
+        "r": tuple(row[::-1] for row in rows),
+        "u": tuple(cols),
+        "d": tuple(col[::-1] for col in cols),
+    }
+
+
+@functools.cache
+def _get_line_masks(size: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return the empty-cell mask bits covered by every row and every column."""
+    lines = _get_lines(size)
+    return (
+        tuple(sum(bit for _, _, bit, _ in row) for row in lines["l"]),
+        tuple(sum(bit for _, _, bit, _ in col) for col in lines["u"]),
+    )
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _shift_line(exps: tuple[int, ...]) -> tuple[tuple[int, ...], int]:
+    """Return the shifted exponents and merge score of a line, memoized."""
+    new_exps, _, score = shift_exponents(exps)
+    return tuple(new_exps), score
+
+
+@functools.cache
+def _get_flat_lines(size: int) -> dict[MoveLiteral, tuple[tuple[int, ...], ...]]:
+    """Return the flat cell indices of every line, like _get_lines()."""
+    return {
+        move: tuple(tuple(r * size + c for r, c, _, _ in line) for line in lines)
+        for move, lines in _get_lines(size).items()
+    }
+
+
+class _HistoryEntry:
+    """Cell changes of one move and its spawns, with the counters they affect.
+
+    Every change is packed into an int as key << 16 | old slot << 8 | new slot,
+    where key is the cell's Zobrist key offset and a slot is value.bit_length().
+    """
+    __slots__ = ("changes", "score", "max_before", "max_after")
 
-from game.core.types import MoveLiteral
+    def __init__(self, changes: list[int], score: int, max_before: int, max_after: int):
+        self.changes = changes
+        self.score = score
+        self.max_before = max_before
+        self.max_after = max_after
 
 
 class Game:
     """
     Encapsulates only the core 2048 game logic.
     Stores and updates the numerical game grid (list[list[int]]).
+    Derived state (e.g. the empty-cell mask) is kept up to date by the moves
+    and insert_new_tile(); assign a whole new grid rather than editing cells.
     """
-    def __init__(self, size: int = 4):
+    PREVIEW_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        size: int = 4,
+        preview_cache_size: int = PREVIEW_CACHE_SIZE,
+        history: bool = False,
+        rng: random.Random | None = None,
+    ):
         """
         :param size: Grid dimension (size x size)
+        :param preview_cache_size: Capacity of the preview() LRU cache
+        :param history: Record moves and spawns for undo() and redo()
+        :param rng: Generator of the spawns, e.g. RandomStreams(seed).stream(i);
+            the global random module if None
         """
         self.size = size
-        self.grid: list[list[int]] = [[0] * size for _ in range(size)]
+        self.rng = rng
+        self._score = 0
+        self._undo_stack: list[_HistoryEntry] | None = [] if history else None
+        # Unrolled step() functions of this size, None if the generator skips it
+        self._step_functions = get_step_functions(size)
+        # (zobrist_hash, move) -> MovePreview
+        self.preview_cache = LRUCache(preview_cache_size)
+        self.grid = [[0] * size for _ in range(size)]
+
+    @classmethod
+    def replay(
+        cls,
+        seed: Any,
+        stream_id: int,
+        moves: Iterable[MoveLiteral],
+        size: int = 4,
+        initial_tiles: int = 1,
+    ) -> "Game":
+        """Rebuild a game from its seed, random stream and moves.
+
+        The game spawns initial_tiles tiles (one, like the GUI) and then
+        a tile after every move that changed the grid, drawing from
+        RandomStreams(seed).stream(stream_id).
+        """
+        game = cls(size, rng=RandomStreams(seed).stream(stream_id))
+        for _ in range(initial_tiles):
+            game.insert_new_tile()
+        for move in moves:
+            if game.step(move)[0]:
+                game.insert_new_tile()
+        return game
+
+    @property
+    def grid(self) -> list[list[int]]:
+        """Numerical game grid. Assigning it rebuilds the derived state."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: list[list[int]]) -> None:
+        self._grid = grid
+        # Bit (row * size + col) is set for every empty cell
+        self._empty_mask = 0
+        for r, c in itertools.product(range(self.size), range(self.size)):
+            if grid[r][c] == 0:
+                self._empty_mask |= 1 << (r * self.size + c)
+
+        # Legal move flags of every row (LEFT/RIGHT) and column (UP/DOWN),
+        # refreshed lazily for the lines crossing cells touched since then.
+        self._row_moves = [0] * self.size
+        self._col_moves = [0] * self.size
+        self._legal_mask = 0
+        self._touched_mask = (1 << self.size * self.size) - 1
+
+        self._max_tile = max(max(row) for row in grid)
+        self._victory_tiles = sum(row.count(VICTORY_TILE) for row in grid)
+        self._zobrist_hash = zobrist_hash(grid)
+
+        # A new grid starts a new history
+        if self._undo_stack is not None:
+            self._undo_stack = []
+        self._redo_stack: list[_HistoryEntry] = []
+        # Spawns are recorded with the move before them, up to the next undo
+        self._history_open = False
+
+    @property
+    def board(self) -> Board:
+        """Immutable, hashable snapshot of the grid. Assigning it loads the grid."""
+        return Board.from_grid(self._grid)
+
+    @board.setter
+    def board(self, board: Board) -> None:
+        if board.size != self.size:
+            raise ValueError(f"Expected a {self.size}x{self.size} board.")
+        self.grid = board.to_grid()
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the grid, updated incrementally on every change.
+
+        Keys are seeded deterministically, so hashes are stable across processes.
+        """
+        return self._zobrist_hash
+
+    @property
+    def score(self) -> int:
+        """Cumulative score: the sum of the values of all tiles created by merges."""
+        return self._score
+
+    @property
+    def max_tile(self) -> int:
+        """Largest tile value currently present on the grid."""
+        return self._max_tile
 
     def insert_new_tile(self) -> tuple[int, int, int]:
         """Create new tile (2 or 4) in random empty cell.
 
         Return the value and coordinates of the inserted tile as (value, row, col).
         """
-        empty_cells = [
-            (i, j)
-            for i in range(self.size)
-            for j in range(self.size)
-            if self.grid[i][j] == 0
+        empty_count = self._empty_mask.bit_count()
+        if not empty_count:
+            raise IndexError("Cannot insert a tile into a full grid.")
+
+        rng = self.rng if self.rng is not None else random
+        # Pick the k-th empty cell in row-major order, drawing exactly the same
+        # random numbers as rng.choice() over a list of the empty cells.
+        idx = self._nth_set_bit(self._empty_mask, rng.randrange(empty_count))
+        self._empty_mask ^= 1 << idx
+        y, x = divmod(idx, self.size)
+        value = 2 if rng.random() < SPAWN_TWO_PROBABILITY else 4
+        self._grid[y][x] = value
+        self._touched_mask |= 1 << idx
+        self._zobrist_hash ^= get_zobrist_table(self.size)[
+            idx * ZOBRIST_SLOTS + value.bit_length()
         ]
-        y, x = random.choice(empty_cells)
-        self.grid[y][x] = 2 if random.random() < 0.9 else 4
-        return (self.grid[y][x], y, x)
+        if value > self._max_tile:
+            self._max_tile = value
+        if self._history_open:
+            entry = self._undo_stack[-1]
+            entry.changes.append(
+                (idx * ZOBRIST_SLOTS) << 16 | value.bit_length()
+            )
+            entry.max_after = self._max_tile
+        return (value, y, x)
 
     def can_move(self) -> bool:
         """Return True if at least one move is possible.
@@ -38,30 +245,34 @@ class Game:
         A move is possible if there is an empty cell
         or two adjacent tiles with the same value.
         """
-        for r, c in itertools.product(range(self.size), range(self.size)):
-            value = self.grid[r][c]
-            if value == 0:
-                return True
-            if c + 1 < self.size and value == self.grid[r][c + 1]:
-                return True
-            if r + 1 < self.size and value == self.grid[r + 1][c]:
-                return True
+        # Any empty cell next to a tile is a legal move; a fully empty grid
+        # counts as movable too.
+        return bool(self._empty_mask) or bool(self.legal_moves())
+
+    def legal_moves(self) -> MoveMask:
+        """Return the directions in which a move would change the grid.
 
-        return False
+        The mask is maintained incrementally: only the rows and columns crossing
+        cells changed since the last call are re-examined.
+        """
+        if self._touched_mask:
+            self._update_legal_moves()
+        return MoveMask(self._legal_mask)
 
     def check_victory(self) -> bool:
         """Return True if the victory condition is reached.
 
         Victory is achieved when at least one tile with value 2048 exists in the grid.
         """
-        return any(2048 in row for row in self.grid)
+        return self._victory_tiles > 0
 
     def get_score(self) -> int:
         """Return the current game score.
 
         The score is defined as the maximum tile value currently present on the grid.
+        See also the cumulative merge score.
         """
-        return max(max(row) for row in self.grid)
+        return self._max_tile
 
 
     def move_left(self) -> tuple[bool, list[list[int]], MoveLiteral]:
@@ -69,9 +280,7 @@ class Game:
 
         Return changed, bias_matrix and move type.
         """
-        old = copy.deepcopy(self.grid)
-        bias_matrix = self._shift_left()
-        changed = old != self.grid
+        changed, bias_matrix, _, _ = self._move("l")
         return changed, bias_matrix, "l"
 
 
@@ -80,14 +289,7 @@ class Game:
 
         Return changed, bias_matrix and move type.
         """
-        old = copy.deepcopy(self.grid)
-
-        self.grid = [row[::-1] for row in self.grid]
-        bias_matrix = self._shift_left()
-        self.grid = [row[::-1] for row in self.grid]
-        bias_matrix = [row[::-1] for row in bias_matrix]
-
-        changed = old != self.grid
+        changed, bias_matrix, _, _ = self._move("r")
         return changed, bias_matrix, "r"
 
 
@@ -96,14 +298,7 @@ class Game:
 
         Return changed, bias_matrix and move type.
         """
-        old = copy.deepcopy(self.grid)
-
-        self.grid = self._rotate_ccw(self.grid)
-        bias_matrix = self._shift_left()
-        self.grid = self._rotate_cw(self.grid)
-        bias_matrix = self._rotate_cw(bias_matrix)
-
-        changed = old != self.grid
+        changed, bias_matrix, _, _ = self._move("u")
         return changed, bias_matrix, "u"
 
 
@@ -112,112 +307,367 @@ class Game:
 
         Return changed, bias_matrix and move type.
         """
-        old = copy.deepcopy(self.grid)
+        changed, bias_matrix, _, _ = self._move("d")
+        return changed, bias_matrix, "d"
 
-        self.grid = self._rotate_cw(self.grid)
-        bias_matrix = self._shift_left()
-        self.grid = self._rotate_ccw(self.grid)
-        bias_matrix = self._rotate_ccw(bias_matrix)
 
-        changed = old != self.grid
-        return changed, bias_matrix, "d"
+    def move(self, move: MoveLiteral) -> tuple[bool, list[MoveEvent], int]:
+        """Shift tiles in the direction of the move.
 
+        Return changed, the move events and the score gained by merges.
+        The events list only the tiles that changed cells, in the order the
+        kernel moved them, so consumers scale with activity, not board area.
+        """
+        changed, _, events, score = self._move(move, with_bias=False, with_events=True)
+        return changed, events, score
 
-    @staticmethod
-    def _rotate_ccw(matrix: list[list[int]]):
-        """Rotate matrix 90° CCW."""
-        return [list(row) for row in zip(*matrix, strict=True)][::-1]
 
+    def preview(self, move: MoveLiteral) -> MovePreview:
+        """Return the outcome of a move without applying it.
 
-    @staticmethod
-    def _rotate_cw(matrix: list[list[int]]):
-        """Rotate matrix 90° CW."""
-        return [list(row)[::-1] for row in zip(*matrix, strict=True)]
+        Return the resulting board, changed, the score gained by merges and
+        the bias matrix (as tuples). Results are memoized in preview_cache,
+        keyed by the Zobrist hash of the grid and the move.
+        """
+        key = (self._zobrist_hash, move)
+        result = self.preview_cache.get(key)
+        if result is None:
+            clone = self._clone()
+            changed, bias_matrix, _, score = clone._move(move)
+            result = (
+                Board.from_grid(clone._grid),
+                changed,
+                score,
+                tuple(map(tuple, bias_matrix)),
+            )
+            self.preview_cache.put(key, result)
+        return result
+
+
+    def successors(
+        self, board: Board | None = None
+    ) -> Iterator[tuple[MoveLiteral, Board, int]]:
+        """Yield every afterstate of a position as (move, board, score delta).
+
+        Moves that would not change the board are skipped. Defaults to the
+        current grid. All four directions are resolved from one exponent
+        snapshot, and line shifts are memoized across lines and directions.
+        """
+        if board is None:
+            board = self.board
+            legal_mask = self.legal_moves()
+        else:
+            legal_mask = ~MoveMask(0)
+
+        cells = board.cells
+        for move, lines in _get_flat_lines(board.size).items():
+            if not legal_mask & MOVE_MASKS[move]:
+                continue
+
+            new_cells = bytearray(cells)
+            score = 0
+            changed = False
+            for line in lines:
+                exps = tuple(cells[idx] for idx in line)
+                new_exps, line_score = _shift_line(exps)
+                if new_exps != exps:
+                    changed = True
+                    score += line_score
+                    for idx, exp in zip(line, new_exps, strict=True):
+                        new_cells[idx] = exp
+            if changed:
+                yield move, Board(board.size, bytes(new_cells)), score
+
+
+    def spawn_outcomes(
+        self, board: Board | None = None
+    ) -> Iterator[tuple[Board, float, tuple[int, int, int]]]:
+        """Yield every tile spawn of a position as (board, probability, tile).
+
+        Matches insert_new_tile(): a uniformly chosen empty cell receives
+        a 2 or a 4. The tile is (value, row, col). Defaults to the current grid.
+        """
+        board = board if board is not None else self.board
+        cells = board.cells
+        empty_cells = [idx for idx, exp in enumerate(cells) if not exp]
+        if not empty_cells:
+            return
+
+        cell_probability = 1 / len(empty_cells)
+        outcomes = (
+            (1, 2, SPAWN_TWO_PROBABILITY * cell_probability),
+            (2, 4, (1 - SPAWN_TWO_PROBABILITY) * cell_probability),
+        )
+        for idx in empty_cells:
+            row, col = divmod(idx, board.size)
+            for exp, value, probability in outcomes:
+                new_cells = bytearray(cells)
+                new_cells[idx] = exp
+                yield (
+                    Board(board.size, bytes(new_cells)),
+                    probability,
+                    (value, row, col),
+                )
+
+
+    def undo(self) -> bool:
+        """Revert the last move together with the tiles spawned after it.
+
+        Runs in O(changed cells). Return False if there is nothing to undo.
+        Requires history=True.
+        """
+        if not self._undo_stack:
+            return False
 
+        entry = self._undo_stack.pop()
+        for change in reversed(entry.changes):
+            self._apply_change(change >> 16, change & 0xFF, (change >> 8) & 0xFF)
+        self._score -= entry.score
+        self._max_tile = entry.max_before
+        self._redo_stack.append(entry)
+        self._history_open = False
+        return True
 
-    def _shift_left(self) -> list[list[int]]:
-        """Shift all tiles to the left with merge logic.
 
-        Retrieve and return bias matrix.
-        """
-        new_grid: list[list[int]] = []
+    def redo(self) -> bool:
+        """Reapply the last undone move and its spawns.
 
-        for row in self.grid:
-            # Extract non-zero tiles with original indices
-            tiles: list[tuple[int, int]] = [
-                (idx, row[idx]) for idx in range(self.size) if row[idx] != 0
-            ]
+        Return False if there is nothing to redo. Any new move clears the redo stack.
+        """
+        if not self._redo_stack:
+            return False
+
+        entry = self._redo_stack.pop()
+        for change in entry.changes:
+            self._apply_change(change >> 16, (change >> 8) & 0xFF, change & 0xFF)
+        self._score += entry.score
+        self._max_tile = entry.max_after
+        self._undo_stack.append(entry)
+        self._history_open = False
+        return True
+
+
+    def step(self, move: MoveLiteral) -> tuple[bool, int]:
+        """Shift tiles in the direction of the move without animation metadata.
+
+        Logic-only counterpart of move_left/right/up/down for headless use:
+        no bias matrix is built. Return changed and the score gained by merges.
+        Uses the unrolled functions of game.core.codegen when they cover the
+        board size and no history is recorded.
+        """
+        if self._step_functions is not None and self._undo_stack is None:
+            return self._step_functions[move](self)
+        changed, _, _, score = self._move(move, with_bias=False)
+        return changed, score
 
-            # Merge tile values
-            compressed = [v for _, v in tiles]
-            new_row: list[int] = []
-            i = 0
-            while i < len(compressed):
-                if i < len(compressed) - 1 and compressed[i] == compressed[i + 1]:
-                    new_row.append(compressed[i] * 2)
-                    i += 2
-                else:
-                    new_row.append(compressed[i])
-                    i += 1
 
-            # Fill remaining cells with zeros
-            new_row += [0] * (self.size - len(new_row))
-            new_grid.append(new_row)
+    def _clone(self) -> "Game":
+        """Return an independent copy of the game state.
 
+        Copies the derived state as is instead of rebuilding it from the grid.
+        The clone shares the preview cache.
+        """
+        clone = object.__new__(Game)
+        clone.__dict__.update(self.__dict__)
+        clone._grid = [row[:] for row in self._grid]
+        clone._row_moves = self._row_moves[:]
+        clone._col_moves = self._col_moves[:]
+        clone._undo_stack = None
+        clone._redo_stack = []
+        clone._history_open = False
+        return clone
 
-        bias_matrix = self._get_bias_matrix()
-        self.grid = new_grid
 
-        return bias_matrix
+    @staticmethod
+    def _rotate_ccw(matrix: list[list[int]]):
+        """Rotate matrix 90° CCW."""
+        return [list(row) for row in zip(*matrix, strict=True)][::-1]
 
 
-    def _build_merge_groups(self, tiles: list[tuple[int, int]]
-    ) -> list[list[tuple[int, int]] | tuple[int, int]]:
-        """Build merge groups for a single row of tiles.
+    @staticmethod
+    def _rotate_cw(matrix: list[list[int]]):
+        """Rotate matrix 90° CW."""
+        return [list(row)[::-1] for row in zip(*matrix, strict=True)]
 
-        Each group is either a single tile (tuple)
-        or a pair of tiles to be merged (list of two tuples).
 
-        Example:
-            [(0, 2), (1, 2), (2, 4)] -> [[(0, 2), (1, 2)], (2, 4)]
+    @staticmethod
+    def _nth_set_bit(mask: int, n: int) -> int:
+        """Return the position of the n-th (0-based) lowest set bit of mask."""
+        lo, hi = 0, mask.bit_length() - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (mask & ((2 << mid) - 1)).bit_count() > n:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+
+    def _apply_change(self, key: int, old_slot: int, new_slot: int) -> None:
+        """Set a cell from one value slot to another, keeping derived state."""
+        idx = key // ZOBRIST_SLOTS
+        r, c = divmod(idx, self.size)
+        value = (1 << new_slot) >> 1
+        self._grid[r][c] = value
+
+        bit = 1 << idx
+        if value:
+            self._empty_mask &= ~bit
+        else:
+            self._empty_mask |= bit
+        self._touched_mask |= bit
+
+        zobrist_keys = get_zobrist_table(self.size)
+        if old_slot:
+            self._zobrist_hash ^= zobrist_keys[key + old_slot]
+        if new_slot:
+            self._zobrist_hash ^= zobrist_keys[key + new_slot]
+
+        victory_slot = VICTORY_TILE.bit_length()
+        self._victory_tiles += (new_slot == victory_slot) - (old_slot == victory_slot)
+
+
+    def _update_legal_moves(self) -> None:
+        """Recompute the legal move flags of the lines crossing touched cells."""
+        touched = self._touched_mask
+        self._touched_mask = 0
+        lines = _get_lines(self.size)
+        row_masks, col_masks = _get_line_masks(self.size)
+        for i in range(self.size):
+            if touched & row_masks[i]:
+                self._row_moves[i] = self._get_line_moves(lines["l"][i], _LEFT, _RIGHT)
+            if touched & col_masks[i]:
+                self._col_moves[i] = self._get_line_moves(lines["u"][i], _UP, _DOWN)
+
+        legal_mask = 0
+        for flags in self._row_moves:
+            legal_mask |= flags
+        for flags in self._col_moves:
+            legal_mask |= flags
+        self._legal_mask = legal_mask
+
+
+    def _get_line_moves(self, line: _Line, toward_start: int, toward_end: int) -> int:
+        """Return the flags of the directions in which the line can move.
+
+        A line can move towards its start if a tile follows an empty cell,
+        towards its end if an empty cell follows a tile, and both ways
+        if two adjacent tiles have the same value.
         """
-        merge_groups: list[list[tuple[int, int]] | tuple[int, int]] = []
-        i = 0
-        while i < len(tiles):
-            if i < len(tiles) - 1 and tiles[i][1] == tiles[i + 1][1]:
-                merge_groups.append([tiles[i], tiles[i + 1]])
-                i += 2
+        flags = 0
+        seen_empty = seen_tile = False
+        prev = 0
+        for r, c, _, _ in line:
+            value = self._grid[r][c]
+            if value:
+                if value == prev:
+                    return toward_start | toward_end
+                if seen_empty:
+                    flags |= toward_start
+                seen_tile = True
             else:
-                merge_groups.append(tiles[i])
-                i += 1
+                if seen_tile:
+                    flags |= toward_end
+                seen_empty = True
+            prev = value
+        return flags
 
-        return merge_groups
 
+    def _move(
+        self, move: MoveLiteral, with_bias: bool = True, with_events: bool = False
+    ) -> tuple[bool, list[list[int]], list[MoveEvent], int]:
+        """Shift all tiles in the direction of the move with merge logic.
 
-    def _get_bias_matrix(self) -> list[list[int]]:
-        """Compute the bias matrix for the current grid state.
+        Fused single pass: every line is walked once, starting from the cell
+        the tiles move towards, and new values are written in place.
+        Tiles that already sit in their final cell are not touched.
 
-        The bias matrix stores how many cells each tile moves during a left shift.
+        Return changed, the bias matrix (empty unless with_bias), the move
+        events (empty unless with_events) and the score gained by merges.
         """
-        bias_matrix: list[list[int]] = []
-        for row in self.grid:
-            # Extract non-zero tiles with original indices
-            tiles: list[tuple[int, int]] = [
-                (idx, row[idx]) for idx in range(self.size) if row[idx] != 0
-            ]
-
-            merge_groups = self._build_merge_groups(tiles)
-
-            # Compute displacement for each original index
-            bias_row = [0] * self.size
-            for new_col, group in enumerate(merge_groups):
-                if isinstance(group, tuple):
-                    old_col = group[0]
-                    bias_row[old_col] = old_col - new_col
+        grid = self._grid
+        empty_mask = self._empty_mask
+        max_tile = self._max_tile
+        zobrist_keys = get_zobrist_table(self.size)
+        zobrist = self._zobrist_hash
+        bias_matrix = [[0] * self.size for _ in range(self.size)] if with_bias else []
+        events: list[MoveEvent] = []
+        # Packed cell changes for the undo history, see _HistoryEntry
+        changes: list[int] | None = [] if self._undo_stack is not None else None
+        score = 0
+        # Cells whose value changed, in the layout of the empty-cell mask
+        touched = 0
+
+        for line in _get_lines(self.size)[move]:
+            # Index in the line where the next tile lands
+            target = 0
+            # Value of the last landed tile while it can still absorb a merge
+            last = 0
+            for pos, (r, c, bit, key) in enumerate(line):
+                value = grid[r][c]
+                if not value:
+                    continue
+
+                if value == last:
+                    # Merge into the previously landed tile
+                    tr, tc, target_bit, target_key = line[target - 1]
+                    grid[tr][tc] = value * 2
+                    grid[r][c] = 0
+                    empty_mask |= bit
+                    touched |= bit | target_bit
+                    slot = value.bit_length()
+                    zobrist ^= (
+                        zobrist_keys[key + slot]
+                        ^ zobrist_keys[target_key + slot]
+                        ^ zobrist_keys[target_key + slot + 1]
+                    )
+                    if with_bias:
+                        bias_matrix[r][c] = pos - target + 1
+                    if with_events:
+                        events.append(MoveEvent(r, c, tr, tc, value, True))
+                    if changes is not None:
+                        changes += (
+                            target_key << 16 | slot << 8 | slot + 1,
+                            key << 16 | slot << 8,
+                        )
+                    score += value * 2
+                    if value * 2 > max_tile:
+                        max_tile = value * 2
+                    if value == VICTORY_TILE // 2:
+                        self._victory_tiles += 1
+                    elif value == VICTORY_TILE:
+                        self._victory_tiles -= 2
+                    last = 0
                 else:
-                    for old_col, _ in group:
-                        bias_row[old_col] = old_col - new_col
-
-            bias_matrix.append(bias_row)
-
-        return bias_matrix
+                    if pos != target:
+                        tr, tc, target_bit, target_key = line[target]
+                        grid[tr][tc] = value
+                        grid[r][c] = 0
+                        empty_mask ^= bit | target_bit
+                        touched |= bit | target_bit
+                        slot = value.bit_length()
+                        zobrist ^= (
+                            zobrist_keys[key + slot] ^ zobrist_keys[target_key + slot]
+                        )
+                        if with_bias:
+                            bias_matrix[r][c] = pos - target
+                        if with_events:
+                            events.append(MoveEvent(r, c, tr, tc, value))
+                        if changes is not None:
+                            changes += (target_key << 16 | slot, key << 16 | slot << 8)
+                    target += 1
+                    last = value
+
+        if changes:
+            self._undo_stack.append(
+                _HistoryEntry(changes, score, self._max_tile, max_tile)
+            )
+            self._redo_stack.clear()
+            self._history_open = True
+
+        self._empty_mask = empty_mask
+        self._touched_mask |= touched
+        self._max_tile = max_tile
+        self._zobrist_hash = zobrist
+        self._score += score
+        return bool(touched), bias_matrix, events, score
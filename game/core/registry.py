@@ -0,0 +1,103 @@
+"""
+Registry sharing precomputed row tables with worker processes.
+
+The parent publishes every table once into a multiprocessing.shared_memory
+block. Workers attach to the blocks by name and register them with
+tables.get_row_table(), so the engines of all workers read the same physical
+pages instead of building or loading a private copy.
+"""
+
+import contextlib
+import os
+from collections.abc import Iterable
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+from game.core import tables
+from game.core.rules import STANDARD, Rules
+
+
+class SharedBlock(SharedMemory):
+    """
+    Shared memory block whose mapping outlives close() while views of it are
+    still alive (e.g. tables or arrays handed out); it is unmapped once they
+    are gone.
+    """
+    def close(self) -> None:
+        with contextlib.suppress(BufferError):
+            super().close()
+
+
+class TableHandle(NamedTuple):
+    """Picklable reference to a published row table."""
+    name: str
+    nbytes: int
+    size: int
+    base: int
+    rules_key: str
+
+
+class TableRegistry:
+    """
+    Owner of the shared memory blocks of the published tables.
+    Pass its handles to attach_tables() in every worker, e.g. through
+    game.sim.pool.warm_pool(), and close it once the workers are done.
+    """
+    def __init__(self):
+        self._blocks: dict[tuple[int, int, str], tuple[SharedMemory, TableHandle]] = {}
+
+    @property
+    def handles(self) -> tuple[TableHandle, ...]:
+        """Handles of every published table."""
+        return tuple(handle for _, handle in self._blocks.values())
+
+    def publish(
+        self,
+        size: int,
+        base: int | None = None,
+        rules: Rules = STANDARD,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> TableHandle:
+        """Publish the row table of a board size and rules, once.
+
+        The table is loaded (or built) in this process as get_row_table() does.
+        """
+        base = base if base is not None else tables.default_base(size)
+        key = (size, base, rules.key)
+        if key in self._blocks:
+            return self._blocks[key][1]
+
+        data = memoryview(tables.get_row_table(size, base, cache_dir, rules).buffer)
+        block = SharedMemory(create=True, size=data.nbytes)
+        block.buf[: data.nbytes] = data
+        handle = TableHandle(block.name, data.nbytes, size, base, rules.key)
+        self._blocks[key] = (block, handle)
+        return handle
+
+    def close(self) -> None:
+        """Free the blocks; attached workers keep their mappings until they exit."""
+        for block, _ in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "TableRegistry":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# Blocks attached by this process, kept open for the tables viewing them
+_attached: dict[str, SharedBlock] = {}
+
+
+def attach_tables(handles: Iterable[TableHandle]) -> None:
+    """Attach published tables and make get_row_table() return them."""
+    for handle in handles:
+        if handle.name in _attached:
+            continue
+        block = SharedBlock(handle.name)
+        table = tables.RowTable(block.buf[: handle.nbytes])
+        tables._row_tables[(handle.size, handle.base, handle.rules_key)] = table
+        _attached[handle.name] = block
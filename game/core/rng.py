@@ -0,0 +1,239 @@
+import hashlib
+import os
+import random
+from typing import Any
+
+MASK64 = (1 << 64) - 1
+
+# Jump polynomial of xoshiro256: advances the state by 2 ** 128 outputs.
+_JUMP = (0x180EC6D33CFD0ABA, 0xD5A61266F0C9392C, 0xA9582618E03FC9AA, 0x39ABDC4529B1661C)
+# Characteristic polynomial of the xoshiro256 state transition over GF(2),
+# bit k being the coefficient of x ** k; x ** (2 ** 128) modulo it is _JUMP.
+_CHARPOLY = int(
+    "10003c03c3f3ecb19"
+    "04b4edcf26259f850280002bcefd1a5e9d116f2bb0f0f001",
+    16,
+)
+_STATE_VERSION = "xoshiro256**-1"
+
+# _JUMP_POWERS[k] is the polynomial of a jump by 2 ** 128 * 2 ** k outputs
+_JUMP_POWERS = [sum(word << (64 * idx) for idx, word in enumerate(_JUMP))]
+
+
+def _mulmod(a: int, b: int) -> int:
+    """Multiply two GF(2) polynomials, given as bit masks, modulo _CHARPOLY."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a >> 256:
+            a ^= _CHARPOLY
+    return result
+
+
+def _stream_polynomial(stream_id: int) -> int:
+    """Return the polynomial of a jump by 2 ** 128 * stream_id outputs.
+
+    Squares the jump polynomial once per bit of stream_id, so any stream is
+    reached with O(log stream_id) polynomial products and a single jump.
+    """
+    poly = 1
+    k = 0
+    while stream_id:
+        if k == len(_JUMP_POWERS):
+            _JUMP_POWERS.append(_mulmod(_JUMP_POWERS[-1], _JUMP_POWERS[-1]))
+        if stream_id & 1:
+            poly = _mulmod(poly, _JUMP_POWERS[k])
+        stream_id >>= 1
+        k += 1
+    return poly
+
+
+def _splitmix64(x: int) -> tuple[int, int]:
+    """Return the next splitmix64 state and output for state x."""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    z = x
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x, z ^ (z >> 31)
+
+
+class Xoshiro256(random.Random):
+    """
+    Pure-Python xoshiro256** generator with the random.Random interface.
+    Every generator can hand out statistically independent substreams with
+    jumped(), each 2 ** 128 outputs apart. Outputs are produced in blocks of
+    block_size 64-bit words, which keeps the per-draw overhead low.
+    """
+    BLOCK_SIZE = 256
+
+    def __init__(self, seed: Any = None, block_size: int = BLOCK_SIZE):
+        """
+        :param seed: int, str or bytes seed; None seeds from os.urandom()
+        :param block_size: Number of 64-bit outputs drawn at once
+        """
+        if block_size < 1:
+            raise ValueError("Block size must be positive.")
+        self.block_size = block_size
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Initialize the state from an int, str or bytes seed (None: os.urandom)."""
+        if a is None:
+            a = int.from_bytes(os.urandom(32), "big")
+        elif isinstance(a, str | bytes | bytearray):
+            data = a.encode() if isinstance(a, str) else bytes(a)
+            a = int.from_bytes(hashlib.sha512(data).digest(), "big")
+        elif not isinstance(a, int):
+            raise TypeError(f"Unsupported seed type {type(a).__name__}.")
+
+        # Fold the whole seed into one word, then expand it with splitmix64
+        negative = a < 0
+        a = abs(a)
+        x = a & MASK64
+        while a := a >> 64:
+            x = _splitmix64(x)[1] ^ (a & MASK64)
+        if negative:
+            # Keep -n and n apart
+            x = _splitmix64(x)[1] ^ MASK64
+
+        state = []
+        for _ in range(4):
+            x, word = _splitmix64(x)
+            state.append(word)
+        self._state = state
+        # Pre-drawn outputs, consumed from the end
+        self._block: list[int] = []
+        self.gauss_next = None
+
+    def next64(self) -> int:
+        """Return the next 64-bit output."""
+        if not self._block:
+            self._fill_block()
+        return self._block.pop()
+
+    def random(self) -> float:
+        """Return the next float in [0, 1) with 53 random bits."""
+        if not self._block:
+            self._fill_block()
+        return (self._block.pop() >> 11) * (1.0 / (1 << 53))
+
+    def _randbelow(self, n: int) -> int:
+        """Return an int in [0, n), used by randrange() and choice().
+
+        Lemire's multiply-shift method: a single 64-bit output for any n
+        below 2 ** 64, with rejection keeping the result exactly uniform.
+        """
+        if n > MASK64:
+            return super()._randbelow(n)
+        product = self.next64() * n
+        if (product & MASK64) < n:
+            threshold = (MASK64 + 1 - n) % n
+            while (product & MASK64) < threshold:
+                product = self.next64() * n
+        return product >> 64
+
+    def getrandbits(self, k: int) -> int:
+        """Return an int with k random bits, built from whole 64-bit outputs."""
+        if k < 0:
+            raise ValueError("Number of bits must be non-negative.")
+        result = 0
+        produced = 0
+        while produced < k:
+            result |= self.next64() << produced
+            produced += 64
+        return result >> (produced - k) if produced else 0
+
+    def getstate(self) -> tuple:
+        return (_STATE_VERSION, tuple(self._state), tuple(self._block), self.gauss_next)
+
+    def setstate(self, state: tuple) -> None:
+        version, words, block, gauss_next = state
+        if version != _STATE_VERSION:
+            raise ValueError(f"Unsupported generator state {version!r}.")
+        self._state = list(words)
+        self._block = list(block)
+        self.gauss_next = gauss_next
+
+    def jumped(self) -> "Xoshiro256":
+        """Return a new generator for the next 2 ** 128 outputs of this one,
+        which then jumps past them.
+
+        Outputs already pre-drawn into the current block stay with this
+        generator, so calling jumped() repeatedly hands out non-overlapping
+        streams.
+        """
+        clone = Xoshiro256(0, self.block_size)
+        clone._state = list(self._state)
+        self._state = self._jump_state(self._state)
+        return clone
+
+    def _fill_block(self) -> None:
+        """Draw the next block_size outputs, stored in reverse for pop()."""
+        mask = MASK64
+        s0, s1, s2, s3 = self._state
+        block = [0] * self.block_size
+        for idx in range(self.block_size - 1, -1, -1):
+            x = s1 * 5 & mask
+            block[idx] = ((x << 7 | x >> 57) & mask) * 9 & mask
+            t = s1 << 17 & mask
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = (s3 << 45 | s3 >> 19) & mask
+        self._state = [s0, s1, s2, s3]
+        self._block = block
+
+    @staticmethod
+    def _jump_state(state: list[int], jump: int = _JUMP_POWERS[0]) -> list[int]:
+        """Return the state advanced by the jump polynomial (2 ** 128 outputs).
+
+        The result is the sum of the states after k steps over the
+        coefficients of x ** k in jump.
+        """
+        s0, s1, s2, s3 = state
+        j0 = j1 = j2 = j3 = 0
+        for bit in range(jump.bit_length()):
+            if jump >> bit & 1:
+                j0 ^= s0
+                j1 ^= s1
+                j2 ^= s2
+                j3 ^= s3
+            t = (s1 << 17) & MASK64
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= t
+            s3 = ((s3 << 45) | (s3 >> 19)) & MASK64
+        return [j0, j1, j2, j3]
+
+
+class RandomStreams:
+    """
+    Factory of independent, reproducible random streams.
+    Stream i is the seeded generator jumped ahead 2 ** 128 * i outputs, so
+    streams never overlap and the same (seed, stream_id) always yields the
+    same sequence. Reaching stream i takes O(log i) polynomial products, so
+    every game of a large run can have its own stream.
+    """
+    def __init__(self, seed: Any, block_size: int = Xoshiro256.BLOCK_SIZE):
+        """
+        :param seed: Seed shared by all streams
+        :param block_size: Block size of the generators handed out
+        """
+        self.seed = seed
+        self.block_size = block_size
+        self._state = Xoshiro256(seed)._state
+
+    def stream(self, stream_id: int) -> Xoshiro256:
+        """Return a fresh generator for the stream."""
+        if stream_id < 0:
+            raise ValueError("Stream ids must be non-negative.")
+        rng = Xoshiro256(0, self.block_size)
+        rng._state = Xoshiro256._jump_state(self._state, _stream_polynomial(stream_id))
+        return rng
@@ -0,0 +1,167 @@
+import random
+
+
+class Rules:
+    """
+    Declarative description of a 2048 rule variant.
+    Tiles are stored as exponents of tile_base (0 is an empty cell). A move
+    merges merge_count equal adjacent tiles into one tile of the next exponent;
+    tiles at or above max_exponent never merge. New tiles are drawn from the
+    spawns distribution of (exponent, probability) pairs.
+    The merge semantics are compiled into row tables (see tables.TableGame),
+    so variants run at the same table-driven speed as standard 2048.
+    """
+    def __init__(
+        self,
+        merge_count: int = 2,
+        max_exponent: int | None = None,
+        spawns: tuple[tuple[int, float], ...] = ((1, 0.9), (2, 0.1)),
+        tile_base: int | None = None,
+        victory_exponent: int = 11,
+    ):
+        """
+        :param merge_count: Number of equal tiles that merge into one
+        :param max_exponent: Merge cap, tiles with this exponent or more never merge
+        :param spawns: (exponent, probability) of every spawnable tile
+        :param tile_base: Tile value is tile_base ** exponent; defaults to merge_count
+        :param victory_exponent: Exponent of the tile that wins the game
+        """
+        if merge_count < 2:
+            raise ValueError("At least two tiles must take part in a merge.")
+        if not spawns or abs(sum(p for _, p in spawns) - 1) > 1e-9:
+            raise ValueError("Spawn probabilities must sum up to 1.")
+        if any(not 1 <= exp <= 255 for exp, _ in spawns):
+            raise ValueError("Spawn exponents must be between 1 and 255.")
+
+        self.merge_count = merge_count
+        self.max_exponent = max_exponent
+        self.spawns = tuple(spawns)
+        self.tile_base = tile_base if tile_base is not None else merge_count
+        self.victory_exponent = victory_exponent
+
+    @property
+    def key(self) -> str:
+        """Identifier of the table semantics, used to name cached row tables.
+
+        Only the merge semantics and the tile values that score them are part
+        of it; spawns and victory do not change the tables.
+        """
+        key = f"k{self.merge_count}-b{self.tile_base}"
+        if self.max_exponent is not None:
+            key += f"-c{self.max_exponent}"
+        return key
+
+    def value(self, exp: int) -> int:
+        """Return the tile value of an exponent (0 for an empty cell)."""
+        return self.tile_base ** exp if exp else 0
+
+    def exponent(self, value: int) -> int:
+        """Return the exponent of a tile value (0 for an empty cell)."""
+        if value == 0:
+            return 0
+        exp = 0
+        remainder = value
+        while remainder > 1 and remainder % self.tile_base == 0:
+            remainder //= self.tile_base
+            exp += 1
+        if remainder != 1 or exp == 0 or exp > 255:
+            raise ValueError(
+                f"Tile value {value} is not a power of {self.tile_base}."
+            )
+        return exp
+
+    def draw_spawn(self) -> int:
+        """Return the exponent of a new tile.
+
+        Draws a single random.random(); for the standard spawns this matches
+        Game.insert_new_tile() draw for draw.
+        """
+        r = random.random()
+        threshold = 0.0
+        for exp, probability in self.spawns[:-1]:
+            threshold += probability
+            if r < threshold:
+                return exp
+        return self.spawns[-1][0]
+
+    def shift_line(
+        self, cells: tuple[int, ...] | list[int]
+    ) -> tuple[list[int], list[int], int]:
+        """Shift a line of exponents towards index 0 with the variant's merges.
+
+        Return new exponents, per-cell displacement (bias row) and merge score,
+        like tables.shift_exponents() does for the standard rules.
+        """
+        new_cells: list[int] = []
+        bias = [0] * len(cells)
+        score = 0
+        # Source indices of equal tiles that may still merge, and their exponent
+        group: list[int] = []
+        group_exp = 0
+
+        def flush() -> None:
+            for src in group:
+                bias[src] = src - len(new_cells)
+                new_cells.append(group_exp)
+            group.clear()
+
+        for idx, exp in enumerate(cells):
+            if exp == 0:
+                continue
+            if exp != group_exp:
+                flush()
+                group_exp = exp
+            group.append(idx)
+
+            capped = self.max_exponent is not None and exp >= self.max_exponent
+            if capped:
+                flush()
+            elif len(group) == self.merge_count:
+                for src in group:
+                    bias[src] = src - len(new_cells)
+                new_cells.append(exp + 1)
+                score += self.value(exp + 1)
+                group.clear()
+                # The merged tile does not merge again within the same move
+                group_exp = 0
+        flush()
+
+        new_cells += [0] * (len(cells) - len(new_cells))
+        return new_cells, bias, score
+
+    def __eq__(self, other: object):
+        if not isinstance(other, Rules):
+            return NotImplemented
+        return (
+            self.merge_count == other.merge_count
+            and self.max_exponent == other.max_exponent
+            and self.spawns == other.spawns
+            and self.tile_base == other.tile_base
+            and self.victory_exponent == other.victory_exponent
+        )
+
+    def __hash__(self):
+        return hash((
+            self.merge_count,
+            self.max_exponent,
+            self.spawns,
+            self.tile_base,
+            self.victory_exponent,
+        ))
+
+    def __repr__(self):
+        return (
+            f"Rules(merge_count={self.merge_count}, max_exponent={self.max_exponent}, "
+            f"spawns={self.spawns}, tile_base={self.tile_base}, "
+            f"victory_exponent={self.victory_exponent})"
+        )
+
+
+STANDARD = Rules()
+"""Standard 2048: pairs merge, 2 (90%) or 4 (10%) spawns, 2048 wins."""
+
+CAPPED_2048 = Rules(max_exponent=11)
+"""Standard rules where 2048 tiles no longer merge."""
+
+TRIPLE_MERGE = Rules(merge_count=3, victory_exponent=7)
+"""Three equal tiles merge; tiles are powers of 3 and 2187 wins."""
@@ -0,0 +1,140 @@
+import functools
+import operator
+import weakref
+from collections.abc import Callable
+
+from game.core.board import Board
+from game.core.game import Game
+from game.core.types import MoveLiteral
+
+TRANSFORM_COUNT = 8
+"""Number of symmetries of a square board (the dihedral group D4)."""
+
+_MOVE_VECTORS: dict[MoveLiteral, tuple[int, int]] = {
+    "l": (0, -1),
+    "r": (0, 1),
+    "u": (-1, 0),
+    "d": (1, 0),
+}
+_VECTOR_MOVES = {vector: move for move, vector in _MOVE_VECTORS.items()}
+
+
+class _SymmetryTables:
+    """Cell permutations and move mappings of all 8 transforms for one size.
+
+    Transform t mirrors the board left-right if t >= 4 and then rotates it
+    clockwise (t % 4) times. Transform 0 is the identity.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self.permutations: list[tuple[int, ...]] = []
+        # move on the original board -> same move on the transformed board
+        self.moves: list[dict[MoveLiteral, MoveLiteral]] = []
+
+        indices = [[r * size + c for c in range(size)] for r in range(size)]
+        for mirrored in (False, True):
+            matrix = [row[::-1] for row in indices] if mirrored else indices
+            for rotations in range(4):
+                # Each cell of the transformed matrix holds its source index
+                self.permutations.append(tuple(idx for row in matrix for idx in row))
+                self.moves.append({
+                    move: self._transform_move(move, mirrored, rotations)
+                    for move in _MOVE_VECTORS
+                })
+                matrix = Game._rotate_cw(matrix)
+
+        self.getters: list[Callable[[bytes], tuple[int, ...]]] = [
+            operator.itemgetter(*permutation) for permutation in self.permutations
+        ]
+        # transformed move -> original move
+        self.inverse_moves: list[dict[MoveLiteral, MoveLiteral]] = [
+            {mapped: move for move, mapped in moves.items()} for moves in self.moves
+        ]
+
+    @staticmethod
+    def _transform_move(
+        move: MoveLiteral, mirrored: bool, rotations: int
+    ) -> MoveLiteral:
+        dr, dc = _MOVE_VECTORS[move]
+        if mirrored:
+            dc = -dc
+        for _ in range(rotations):
+            # A clockwise rotation sends (row, col) to (col, size - 1 - row)
+            dr, dc = dc, -dr
+        return _VECTOR_MOVES[(dr, dc)]
+
+
+@functools.cache
+def _get_tables(size: int) -> _SymmetryTables:
+    return _SymmetryTables(size)
+
+
+def transform(board: Board, transform_id: int) -> Board:
+    """Return the board under one of the 8 symmetries (see canonicalize())."""
+    if board.size == 1:
+        return board
+    getter = _get_tables(board.size).getters[transform_id]
+    return Board(board.size, bytes(getter(board.cells)))
+
+
+def canonicalize(board: Board) -> tuple[Board, int]:
+    """Return the canonical form of a board and the transform that produced it.
+
+    The canonical form is the symmetric equivalent with the smallest cells,
+    so all 8 equivalents of a position share it.
+    Use map_move()/unmap_move() to translate moves between the two frames.
+    """
+    if board.size == 1:
+        return board, 0
+
+    cells = board.cells
+    best_cells, best_id = cells, 0
+    for transform_id, getter in enumerate(_get_tables(board.size).getters):
+        candidate = bytes(getter(cells))
+        if candidate < best_cells:
+            best_cells, best_id = candidate, transform_id
+
+    if best_id == 0:
+        return board, 0
+    return Board(board.size, best_cells), best_id
+
+
+def map_move(move: MoveLiteral, transform_id: int, size: int = 4) -> MoveLiteral:
+    """Translate a move on the original board to the transformed board."""
+    return _get_tables(size).moves[transform_id][move]
+
+
+def unmap_move(move: MoveLiteral, transform_id: int, size: int = 4) -> MoveLiteral:
+    """Translate a move on the transformed board back to the original board."""
+    return _get_tables(size).inverse_moves[transform_id][move]
+
+
+class BoardPool:
+    """
+    Interning pool for long-running caches.
+    Equal boards are stored as a single shared object. The pool holds weak
+    references, so boards nobody else uses anymore are dropped automatically.
+    """
+    def __init__(self):
+        # Keyed by the contents, since a Board key would keep its board alive.
+        self._boards: weakref.WeakValueDictionary[tuple[int, bytes], Board] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def intern(self, board: Board) -> Board:
+        """Return the pooled board equal to the given one, adding it if needed."""
+        return self._boards.setdefault((board.size, board.cells), board)
+
+    def canonical(self, board: Board) -> tuple[Board, int]:
+        """Canonicalize a board and intern the result.
+
+        Return the shared canonical board and the transform that produced it.
+        """
+        canonical, transform_id = canonicalize(board)
+        return self.intern(canonical), transform_id
+
+    def __len__(self):
+        return len(self._boards)
+
+    def __contains__(self, board: Board):
+        return (board.size, board.cells) in self._boards
@@ -0,0 +1,370 @@
+import itertools
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+from game.core.rules import STANDARD, Rules
+from game.core.types import MoveLiteral
+
+CACHE_VERSION = 2
+"""Bump whenever the table layout or the shift semantics change."""
+
+MAX_TABLE_ROWS = 1 << 22
+"""Upper bound on rows per table, used to pick the default exponent base."""
+
+_MAGIC = b"2048ROWS"
+_BYTE_ORDER_MARK = 0x01020304
+# magic, version, byte order mark, size, base, rows; padded to 32 bytes.
+_HEADER = struct.Struct("=8sIIIII4x")
+
+
+def shift_exponents(cells: tuple[int, ...] | list[int]
+) -> tuple[list[int], list[int], int]:
+    """Shift a line of exponents towards index 0 with merge logic.
+
+    Return new exponents, per-cell displacement (bias row) and merge score.
+
+    Example:
+        (1, 1, 0, 2) -> ([2, 2, 0, 0], [0, 1, 0, 2], 4)
+    """
+    new_cells: list[int] = []
+    bias = [0] * len(cells)
+    score = 0
+    mergeable = False
+    for idx, exp in enumerate(cells):
+        if exp == 0:
+            continue
+        if mergeable and new_cells[-1] == exp:
+            new_cells[-1] = exp + 1
+            score += 1 << (exp + 1)
+            mergeable = False
+        else:
+            new_cells.append(exp)
+            mergeable = True
+        bias[idx] = idx - (len(new_cells) - 1)
+
+    new_cells += [0] * (len(cells) - len(new_cells))
+    return new_cells, bias, score
+
+
+def default_base(size: int) -> int:
+    """Return the largest exponent base (up to 16) that keeps a table bounded."""
+    base = 16
+    while base > 2 and base ** size > MAX_TABLE_ROWS:
+        base -= 1
+    return base
+
+
+def default_cache_dir() -> Path:
+    """Return the table cache directory.
+
+    Overridable through the GAME2048_CACHE_DIR environment variable.
+    """
+    if env_dir := os.environ.get("GAME2048_CACHE_DIR"):
+        return Path(env_dir)
+    return Path.home() / ".cache" / "2048-game"
+
+
+class RowTable:
+    """
+    Left-shift transitions for every row of one board size.
+    A row of exponents (e0, e1, ..., e[n-1]), each below `base`, is encoded as
+    the base-k index ((e0 * base + e1) * base + ...) and looks up the shifted
+    exponents, the bias row and the merge score.
+    """
+    def __init__(self, buffer: bytes | bytearray | mmap.mmap | memoryview):
+        """
+        :param buffer: Serialized table, as produced by build_row_table()
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Truncated row table buffer.")
+        magic, version, mark, size, base, rows = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != CACHE_VERSION or mark != _BYTE_ORDER_MARK:
+            raise ValueError("Incompatible row table buffer.")
+        if len(buffer) != _table_nbytes(size, rows):
+            raise ValueError("Truncated row table buffer.")
+
+        self.size: int = size
+        self.base: int = base
+        self.rows: int = rows
+        # Keep the underlying buffer (e.g. an mmap) alive with the views.
+        self._buffer = buffer
+
+        view = memoryview(buffer)
+        offset = _HEADER.size
+        self.score = view[offset : offset + 4 * rows].cast("I")
+        offset += 4 * rows
+        self.shifted = view[offset : offset + size * rows]
+        offset += size * rows
+        self.bias = view[offset : offset + size * rows]
+
+    @property
+    def buffer(self) -> bytes | bytearray | mmap.mmap | memoryview:
+        """Serialized table the views read from."""
+        return self._buffer
+
+
+def _table_nbytes(size: int, rows: int) -> int:
+    return _HEADER.size + 4 * rows + 2 * size * rows
+
+
+def build_row_table(size: int, base: int, rules: Rules = STANDARD) -> bytearray:
+    """Build and serialize the row table for the given size, base and rules."""
+    rows = base ** size
+    buffer = bytearray(_table_nbytes(size, rows))
+    _HEADER.pack_into(
+        buffer, 0, _MAGIC, CACHE_VERSION, _BYTE_ORDER_MARK, size, base, rows
+    )
+
+    score = array("I", bytes(4 * rows))
+    shifted = bytearray(size * rows)
+    bias = bytearray(size * rows)
+    # product() enumerates rows in exactly the order of their base-k index.
+    for idx, cells in enumerate(itertools.product(range(base), repeat=size)):
+        new_cells, bias_row, row_score = rules.shift_line(cells)
+        offset = idx * size
+        shifted[offset : offset + size] = bytes(new_cells)
+        if row_score:
+            score[idx] = row_score
+        if any(bias_row):
+            bias[offset : offset + size] = bytes(bias_row)
+
+    offset = _HEADER.size
+    buffer[offset : offset + 4 * rows] = score.tobytes()
+    offset += 4 * rows
+    buffer[offset : offset + size * rows] = shifted
+    offset += size * rows
+    buffer[offset : offset + size * rows] = bias
+    return buffer
+
+
+def load_row_table(
+    size: int,
+    base: int,
+    cache_dir: str | os.PathLike[str] | None = None,
+    rules: Rules = STANDARD,
+) -> RowTable:
+    """Load the row table from the cache file, building and persisting it if needed.
+
+    The cache file is mapped with a single read-only mmap. If the cache directory
+    is not writable the freshly built table is kept in memory only.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    path = cache_dir / (
+        f"rows-v{CACHE_VERSION}-{sys.byteorder}-n{size}-b{base}-{rules.key}.bin"
+    )
+
+    try:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Missing or empty cache file
+        mapped = None
+
+    if mapped is not None:
+        try:
+            table = RowTable(mapped)
+        except ValueError:
+            mapped.close()
+        else:
+            if (table.size, table.base) == (size, base):
+                return table
+            # A stale or misplaced file; drop its views before unmapping it
+            del table
+            mapped.close()
+
+    buffer = build_row_table(size, base, rules)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see
+        # a partially written table.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(buffer)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+    return RowTable(buffer)
+
+
+_row_tables: dict[tuple[int, int, str], RowTable] = {}
+
+
+def get_row_table(
+    size: int,
+    base: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    rules: Rules = STANDARD,
+) -> RowTable:
+    """Return the row table for a board size and rules, loading it once per process."""
+    base = base if base is not None else default_base(size)
+    key = (size, base, rules.key)
+    if key not in _row_tables:
+        _row_tables[key] = load_row_table(size, base, cache_dir, rules)
+    return _row_tables[key]
+
+
+class TableGame:
+    """
+    Size-generic 2048 engine driven by precomputed row tables.
+    Stores the grid as a flat list of log2 exponents and resolves every line
+    with a single table lookup. Lines holding an exponent outside the table
+    fall back to the shift of the rules. Exposes the same contract as Game.
+    Rule variants (see game.core.rules) are compiled into their own tables.
+    """
+    def __init__(
+        self,
+        size: int = 4,
+        base: int | None = None,
+        cache_dir: str | os.PathLike[str] | None = None,
+        rules: Rules = STANDARD,
+    ):
+        """
+        :param size: Grid dimension (size x size)
+        :param base: Exponent base of the row table (see default_base())
+        :param cache_dir: Directory of the table cache (see default_cache_dir())
+        :param rules: Rule variant the tables are compiled for
+        """
+        self.size = size
+        self.score = 0
+        self.rules = rules
+        self._cells: list[int] = [0] * (size * size)
+        self._table = get_row_table(size, base, cache_dir, rules)
+
+        # Flat cell indices of every line, listed in the direction of the move.
+        rows = [[r * size + c for c in range(size)] for r in range(size)]
+        cols = [[r * size + c for r in range(size)] for c in range(size)]
+        self._lines: dict[MoveLiteral, list[list[int]]] = {
+            "l": rows,
+            "r": [row[::-1] for row in rows],
+            "u": cols,
+            "d": [col[::-1] for col in cols],
+        }
+
+    @property
+    def grid(self) -> list[list[int]]:
+        """Return the board as tile values (list[list[int]])."""
+        values = [self.rules.value(exp) for exp in self._cells]
+        return [values[r * self.size : (r + 1) * self.size] for r in range(self.size)]
+
+    @grid.setter
+    def grid(self, grid: list[list[int]]) -> None:
+        self._cells = [self.rules.exponent(value) for row in grid for value in row]
+
+    def insert_new_tile(self) -> tuple[int, int, int]:
+        """Create new tile (2 or 4 by default, see Rules.spawns) in random empty cell.
+
+        Return the value and coordinates of the inserted tile as (value, row, col).
+        """
+        empty_cells = [idx for idx, exp in enumerate(self._cells) if exp == 0]
+        idx = random.choice(empty_cells)
+        self._cells[idx] = self.rules.draw_spawn()
+        return (self.rules.value(self._cells[idx]), *divmod(idx, self.size))
+
+    def can_move(self) -> bool:
+        """Return True if at least one move is possible.
+
+        A move is possible if there is an empty cell
+        or two adjacent tiles with the same value.
+        """
+        if 0 in self._cells:
+            return True
+
+        # Without empty cells a line changes in one direction
+        # exactly when it changes in the opposite one.
+        return any(
+            any(self._lookup(line)[1])
+            for line in self._lines["l"] + self._lines["u"]
+        )
+
+    def check_victory(self) -> bool:
+        """Return True if the victory condition is reached.
+
+        Victory is achieved when at least one tile with value 2048
+        (the victory tile of the rules) exists in the grid.
+        """
+        return self.rules.victory_exponent in self._cells
+
+    def get_score(self) -> int:
+        """Return the current game score.
+
+        The score is defined as the maximum tile value currently present on the grid.
+        """
+        return self.rules.value(max(self._cells))
+
+    def move_left(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the left.
+
+        Return changed, bias_matrix and move type.
+        """
+        return self._move("l")
+
+    def move_right(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles to the right.
+
+        Return changed, bias_matrix and move type.
+        """
+        return self._move("r")
+
+    def move_up(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles upward.
+
+        Return changed, bias_matrix and move type.
+        """
+        return self._move("u")
+
+    def move_down(self) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift tiles downward.
+
+        Return changed, bias_matrix and move type.
+        """
+        return self._move("d")
+
+    def _move(
+        self, move: MoveLiteral
+    ) -> tuple[bool, list[list[int]], MoveLiteral]:
+        """Shift every line in the direction of the move via table lookups."""
+        cells = self._cells
+        bias_flat = [0] * (self.size * self.size)
+        changed = False
+
+        for line in self._lines[move]:
+            new_cells, bias_row, score = self._lookup(line)
+            if not any(bias_row):
+                continue
+
+            changed = True
+            self.score += score
+            for idx, exp, bias in zip(line, new_cells, bias_row, strict=True):
+                cells[idx] = exp
+                bias_flat[idx] = bias
+
+        size = self.size
+        bias_matrix = [bias_flat[r * size : (r + 1) * size] for r in range(size)]
+        return changed, bias_matrix, move
+
+    def _lookup(
+        self, line: list[int]
+    ) -> tuple[bytes | list[int], bytes | list[int], int]:
+        """Return shifted exponents, bias row and merge score of a line."""
+        table = self._table
+        base = table.base
+        idx = 0
+        for cell in line:
+            exp = self._cells[cell]
+            if exp >= base:
+                return self.rules.shift_line([self._cells[cell] for cell in line])
+            idx = idx * base + exp
+
+        offset = idx * self.size
+        return (
+            table.shifted[offset : offset + self.size].tobytes(),
+            table.bias[offset : offset + self.size].tobytes(),
+            table.score[idx],
+        )
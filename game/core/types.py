@@ -1,3 +1,36 @@
-from typing import Literal
+from enum import IntFlag
+from typing import Literal, NamedTuple
 
 MoveLiteral = Literal['l', 'r', 'u', 'd']
+
+VICTORY_TILE = 2048
+
+
+class MoveMask(IntFlag):
+    """Direction flags of the 4-bit mask returned by Game.legal_moves()."""
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+
+
+MOVE_MASKS: dict[MoveLiteral, MoveMask] = {
+    'l': MoveMask.LEFT,
+    'r': MoveMask.RIGHT,
+    'u': MoveMask.UP,
+    'd': MoveMask.DOWN,
+}
+
+
+class MoveEvent(NamedTuple):
+    """A tile sliding from one cell to another during a move.
+
+    If merged, the tile merges into the tile already at the destination,
+    which then holds value * 2.
+    """
+    from_row: int
+    from_col: int
+    to_row: int
+    to_col: int
+    value: int
+    merged: bool = False
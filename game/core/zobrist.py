@@ -0,0 +1,31 @@
+import functools
+import random
+
+ZOBRIST_SEED = 0x2048_2048
+"""Fixed seed, so hashes are stable across processes and runs."""
+
+ZOBRIST_SLOTS = 64
+"""Keys per cell, indexed by value.bit_length(); covers tiles up to 2 ** 63."""
+
+
+@functools.cache
+def get_zobrist_table(size: int) -> tuple[int, ...]:
+    """Return the 64-bit Zobrist keys for a board size.
+
+    The key of a tile with value v at flat cell index i is
+    table[i * ZOBRIST_SLOTS + v.bit_length()].
+    """
+    rng = random.Random(ZOBRIST_SEED + size)
+    return tuple(rng.getrandbits(64) for _ in range(size * size * ZOBRIST_SLOTS))
+
+
+def zobrist_hash(grid: list[list[int]]) -> int:
+    """Compute the Zobrist hash of a grid from scratch."""
+    size = len(grid)
+    table = get_zobrist_table(size)
+    result = 0
+    for r, row in enumerate(grid):
+        for c, value in enumerate(row):
+            if value:
+                result ^= table[(r * size + c) * ZOBRIST_SLOTS + value.bit_length()]
+    return result
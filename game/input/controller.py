@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pygame
 from pygame.event import Event
 
@@ -6,6 +8,15 @@ from game.core.states import GameState
 from game.core.types import MoveLiteral
 from game.rendering.renderer import Renderer
 
+MOVE_KEYS: dict[int, MoveLiteral] = {
+    pygame.K_LEFT: "l",
+    pygame.K_RIGHT: "r",
+    pygame.K_UP: "u",
+    pygame.K_DOWN: "d",
+}
+UNDO_KEYS = (pygame.K_z, pygame.K_BACKSPACE)
+REDO_KEYS = (pygame.K_y,)
+
 
 class Controller:
     """Interprets player input and requests state changes from Game."""
@@ -56,15 +67,20 @@ class Controller:
 
     def _handle_keydown(self, event: Event) -> GameState:
         """Handle a key press event and update the game state accordingly."""
-        results = self._get_game_move_results(event)
-        if results is None:
+        if event.key in UNDO_KEYS:
+            return self._handle_history(self.game.undo)
+        if event.key in REDO_KEYS:
+            return self._handle_history(self.game.redo)
+
+        move = MOVE_KEYS.get(event.key)
+        if move is None:
             return GameState.PLAYING
 
-        changed, bias_matrix, move = results
+        changed, events, _ = self.game.move(move)
         if not changed:
             return GameState.PLAYING
 
-        self.tile_manager.append_new_move(bias_matrix, move)
+        self.tile_manager.append_move_events(events)
 
         # Check Victory after new move
         if self.game.check_victory():
@@ -81,15 +97,8 @@ class Controller:
         return GameState.PLAYING
 
 
-    def _get_game_move_results(self, event: pygame.event.Event
-) -> tuple[bool, list[list[int]], MoveLiteral] | None:
-        if event.key == pygame.K_LEFT:
-            return self.game.move_left()
-        elif event.key == pygame.K_RIGHT:
-            return self.game.move_right()
-        elif event.key == pygame.K_UP:
-            return self.game.move_up()
-        elif event.key == pygame.K_DOWN:
-            return self.game.move_down()
-        else:
-            return None
+    def _handle_history(self, action: Callable[[], bool]) -> GameState:
+        """Undo or redo a move and redraw the tiles if the grid changed."""
+        if action():
+            self.tile_manager.rebuild()
+        return GameState.PLAYING
@@ -21,7 +21,7 @@ def main():
     clock = pygame.time.Clock()
 
     while True:
-        game = Game(size=3)
+        game = Game(size=3, history=True)
         renderer = Renderer(game)
         controller = Controller(game, renderer)
 
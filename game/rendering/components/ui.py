@@ -38,7 +38,7 @@ class UI:
     def render(self, width: int, height: int):
         self._render_background(width)
 
-        score = self.game.get_score()
+        score = self.game.score
         score_rect = pygame.Rect(
             width - (BOX_WIDTH + PANEL_PADDING),
             PANEL_PADDING_TOP,
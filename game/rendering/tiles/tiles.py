@@ -1,8 +1,8 @@
-from copy import copy
 from itertools import product
 from typing import Any, Literal
 
 from game.core.game import Game
+from game.core.types import MoveEvent
 from game.rendering.animations import AnimationManager, AppearAnimation, ShiftAnimation
 from game.rendering.animations.animations import MergeAnimation
 
@@ -40,10 +40,26 @@ class TileManager:
         self.grid_size = game.size
         self.anim_manager = anim_manager
 
-        self.tiles: list[Tile] = []
+        self.tiles = []
 
         self.next_tile_id = 0
 
+    @property
+    def tiles(self) -> list[Tile]:
+        """Visual tiles in creation order. Assigning it rebuilds the cell index."""
+        return list(self._tiles.values())
+
+    @tiles.setter
+    def tiles(self, tiles: list[Tile]) -> None:
+        # { tile_id: Tile }, ordered like the assigned list
+        self._tiles: dict[int, Tile] = {}
+        # { (row, col): [Tile, ...] }
+        self._cells: dict[tuple[int, int], list[Tile]] = {}
+        # Cells holding more than one tile, i.e. merges waiting for detect_merges()
+        self._crowded_cells: set[tuple[int, int]] = set()
+        for tile in tiles:
+            self._place(tile)
+
     def new_tile_id(self) -> int:
         """Returns a new unique tile ID."""
         self.next_tile_id += 1
@@ -51,10 +67,8 @@ class TileManager:
 
 
     def get_tiles_at(self, row: int, col: int) -> list[Tile]:
-        """Return the Tile object located at (row, col), or None if empty."""
-        return [
-            tile for tile in self.tiles if tile.row == row and tile.col == col
-        ]
+        """Return the tiles located at (row, col)."""
+        return list(self._cells.get((row, col), ()))
 
     def append_new_tile(self, value: int, row: int, col: int):
         """Append new logical tile from game.grid to the visual state.
@@ -65,8 +79,41 @@ class TileManager:
 
         self.anim_manager.add(tile_id, AppearAnimation())
 
-        tile = Tile(value, row, col, tile_id)
-        self.tiles.append(tile)
+        self._place(Tile(value, row, col, tile_id))
+
+
+    def rebuild(self) -> None:
+        """Replace the visual tiles with the tiles of game.grid, without animations.
+
+        Used after the grid changed outside of a move, e.g. on Game.undo().
+        """
+        self.tiles = [
+            Tile(value, r, c, self.new_tile_id())
+            for r, row in enumerate(self.game.grid)
+            for c, value in enumerate(row)
+            if value
+        ]
+
+
+    def append_move_events(self, events: list[MoveEvent]) -> None:
+        """Append new move and add shift animations for the tiles it moved.
+
+        Consumes the events of Game.move() in O(moved tiles). Merging tiles end
+        up sharing a cell until detect_merges() replaces them.
+        """
+        for event in events:
+            src = (event.from_row, event.from_col)
+            dst = (event.to_row, event.to_col)
+            tiles = self._cells.get(src)
+            if not tiles or len(tiles) != 1:
+                raise RuntimeError(
+                    f"Expected exactly one tile at {src} for a move event, "
+                    f"found {len(tiles or ())}."
+                )
+
+            tile = tiles[0]
+            self.anim_manager.add(tile.id, ShiftAnimation(src, dst))
+            self._relocate(tile, *dst)
 
 
     def append_new_move(
@@ -74,9 +121,11 @@ class TileManager:
         bias_matrix: list[list[int]],
         move_type: Literal['l', 'r', 'u', 'd'],
     ) -> None:
-        """Append new move and add shift animation for tiles based on bias matrix."""
-        new_tiles: list[Tile] = copy(self.tiles)
+        """Append new move and add shift animation for tiles based on bias matrix.
 
+        Dense counterpart of append_move_events(), kept for the bias matrices
+        returned by move_left/right/up/down.
+        """
         MOVE_OFFSET = {
             "l": (0, -1),
             "r": (0, 1),
@@ -85,6 +134,8 @@ class TileManager:
         }
         dr, dc = MOVE_OFFSET[move_type]
 
+        # Look every moving tile up before relocating any of them
+        moves: list[tuple[Tile, int, int]] = []
         for r, c in product(range(self.grid_size), range(self.grid_size)):
             bias = bias_matrix[r][c]
             if bias == 0:
@@ -102,26 +153,23 @@ class TileManager:
                         before creating a ShiftAnimation for a new move."
                 )
 
-            tile = tiles[0]
-
-            new_r = r + dr * bias
-            new_c = c + dc * bias
+            moves.append((tiles[0], r + dr * bias, c + dc * bias))
 
-            anim = ShiftAnimation((r, c), (new_r, new_c))
+        for tile, new_r, new_c in moves:
+            anim = ShiftAnimation((tile.row, tile.col), (new_r, new_c))
             self.anim_manager.add(tile.id, anim)
-
-            index = self.tiles.index(tile)
-            new_tiles[index] = Tile(tile.value, new_r, new_c, tile.id)
-
-        self.tiles = new_tiles
+            self._relocate(tile, new_r, new_c)
 
 
     def detect_merges(self):
         """Detect merged tiles in the same cell.
 
         Replace the tiles with a single upgraded tile.
+        Only the cells that received a second tile are examined.
         """
-        for r, c in product(range(self.grid_size), range(self.grid_size)):
+        crowded_cells = sorted(self._crowded_cells)
+        self._crowded_cells.clear()
+        for r, c in crowded_cells:
             tiles = self.get_tiles_at(r, c)
             if len(tiles) > 2:
                 raise RuntimeError("A single cell cannot contain more than two tiles.")
@@ -132,8 +180,39 @@ class TileManager:
                     )
                 value = tiles[0].value
                 for tile in tiles:
-                    self.tiles.remove(tile)
+                    self._remove(tile)
 
                 tile_id = self.new_tile_id()
-                self.tiles.append(Tile(value * 2, r, c, tile_id))
+                self._place(Tile(value * 2, r, c, tile_id))
                 self.anim_manager.add(tile_id, MergeAnimation())
+
+
+    def _place(self, tile: Tile) -> None:
+        """Add a tile to the visual state and the cell index."""
+        self._tiles[tile.id] = tile
+        self._index(tile)
+
+    def _remove(self, tile: Tile) -> None:
+        """Remove a tile from the visual state and the cell index."""
+        del self._tiles[tile.id]
+        self._unindex(tile)
+
+    def _relocate(self, tile: Tile, row: int, col: int) -> None:
+        """Move a tile to another cell, keeping its place in the tile order."""
+        self._unindex(tile)
+        moved = Tile(tile.value, row, col, tile.id)
+        self._tiles[tile.id] = moved
+        self._index(moved)
+
+    def _index(self, tile: Tile) -> None:
+        cell = (tile.row, tile.col)
+        tiles = self._cells.setdefault(cell, [])
+        tiles.append(tile)
+        if len(tiles) > 1:
+            self._crowded_cells.add(cell)
+
+    def _unindex(self, tile: Tile) -> None:
+        cell = (tile.row, tile.col)
+        self._cells[cell].remove(tile)
+        if not self._cells[cell]:
+            del self._cells[cell]
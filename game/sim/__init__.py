@@ -0,0 +1,25 @@
+"""
+Headless simulation of many games across a process pool.
+
+Run from the command line with python -m game.sim --help.
+"""
+
+from game.sim.policies import POLICIES, Policy, get_policy
+from game.sim.pool import warm_pool
+from game.sim.runner import (
+    GameResult,
+    SimulationSummary,
+    play_game,
+    run_simulation,
+)
+
+__all__ = [
+    "POLICIES",
+    "Policy",
+    "get_policy",
+    "GameResult",
+    "SimulationSummary",
+    "play_game",
+    "run_simulation",
+    "warm_pool",
+]
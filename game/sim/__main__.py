@@ -0,0 +1,113 @@
+"""
+Command line entry point of the headless simulator.
+
+    python -m game.sim --games 10000 --policy greedy --output results.jsonl
+
+Across machines, start a coordinator and any number of workers:
+
+    python -m game.sim --games 100000 --serve 0.0.0.0:2048 --output results.jsonl
+    python -m game.sim --connect coordinator-host:2048 --workers 8
+"""
+
+import argparse
+import os
+import sys
+
+from game.sim.cluster import parse_address, run_workers
+from game.sim.policies import POLICIES, get_policy
+from game.sim.runner import FORMATS, detect_format, load_completed, run_simulation
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m game.sim", description="Play 2048 games without a window."
+    )
+    parser.add_argument("--games", type=int, default=1000, help="number of games")
+    parser.add_argument(
+        "--policy",
+        default="random",
+        help=f"one of {', '.join(POLICIES)} or a plugin as module:function",
+    )
+    parser.add_argument("--size", type=int, default=4, help="board size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the run")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument("--output", help="per-game result file (.jsonl or .csv)")
+    parser.add_argument(
+        "--format", choices=FORMATS, help="result format (default: from --output)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip the games already in --output and append the rest",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--serve",
+        metavar="HOST:PORT",
+        help="coordinate remote workers instead of playing locally",
+    )
+    mode.add_argument(
+        "--connect",
+        metavar="HOST:PORT",
+        help="run --workers worker processes for a coordinator",
+    )
+    args = parser.parse_args(argv)
+    for name in ("serve", "connect"):
+        if getattr(args, name) is not None:
+            try:
+                setattr(args, name, parse_address(getattr(args, name)))
+            except ValueError as exc:
+                parser.error(str(exc))
+    if args.games < 0 or args.size < 2:
+        parser.error("--games must be non-negative and --size at least 2")
+    try:
+        get_policy(args.policy)
+    except (ValueError, TypeError, ImportError, AttributeError) as exc:
+        parser.error(f"--policy: {exc}")
+    if args.resume:
+        if args.output is None:
+            parser.error("--resume requires --output")
+        fmt = args.format or detect_format(args.output)
+        try:
+            load_completed(args.output, fmt, args.seed, args.policy, args.size)
+        except ValueError as exc:
+            parser.error(str(exc))
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.connect is not None:
+        workers = args.workers or os.cpu_count() or 1
+        # Late workers may find the coordinator already done; fail if none got in
+        if run_workers(args.connect, workers) == workers:
+            sys.exit(1)
+        return
+    if args.serve is not None:
+        host, port = args.serve
+        print(f"Coordinating workers on {host}:{port}", file=sys.stderr)
+
+    summary = run_simulation(
+        games=args.games,
+        policy=args.policy,
+        size=args.size,
+        seed=args.seed,
+        workers=args.workers,
+        output=args.output,
+        fmt=args.format,
+        resume=args.resume,
+        serve=args.serve,
+    )
+    print(
+        f"{summary.games} games, {summary.moves} moves in {summary.seconds:.2f}s: "
+        f"{summary.games_per_second:,.1f} games/s, "
+        f"{summary.moves_per_second:,.0f} moves/s; "
+        f"mean score {summary.mean_score:,.1f}, best tile {summary.best_tile}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+Coordinator and workers sharding a simulation across machines over TCP.
+
+Messages are JSON objects framed by a 4-byte big-endian length. A worker
+sends {"op": "results", "results": [...]} (empty at first) and the coordinator
+answers with the next batch {"op": "jobs", "jobs": [...]}, {"op": "wait"} or
+{"op": "stop"}. Workers import the policy named by the coordinator, so only
+connect them to a trusted coordinator on a trusted network.
+"""
+
+import collections
+import json
+import multiprocessing
+import queue
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from game.sim.runner import GameResult, play_game
+
+Job = tuple[int, int, str, int]
+"""Arguments of play_game(): game_id, seed, policy and size."""
+
+BATCH_SIZE = 16
+WAIT_SECONDS = 0.05
+"""Pause of a worker told to wait, while the last jobs are still running."""
+CONNECT_TIMEOUT = 10.0
+"""Seconds a worker keeps retrying to reach a coordinator not listening yet."""
+
+_LENGTH = struct.Struct("!I")
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Split "host:port" (or ":port", meaning all interfaces) into a tuple."""
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Expected an address as host:port, got {address!r}.")
+    return host.strip("[]"), int(port)
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    data = json.dumps(message, separators=(",", ":")).encode()
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any] | None:
+    """Return the next message, or None once the peer closed the connection."""
+    header = _recv_exactly(sock, _LENGTH.size)
+    if header is None:
+        return None
+    data = _recv_exactly(sock, _LENGTH.unpack(header)[0])
+    if data is None:
+        return None
+    return json.loads(data)
+
+
+def _recv_exactly(sock: socket.socket, nbytes: int) -> bytes | None:
+    chunks = []
+    while nbytes:
+        chunk = sock.recv(min(nbytes, 1 << 16))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        nbytes -= len(chunk)
+    return b"".join(chunks)
+
+
+class Coordinator:
+    """
+    Hands out batches of jobs to workers connecting over TCP, from the moment
+    it is created, and collects their results.
+    A worker that disconnects gets its unfinished jobs re-queued. Once the
+    queue runs dry, idle workers steal the unfinished jobs of the busiest
+    worker and run them again, so a straggler cannot hold up the end of the
+    run; the first result of a job wins.
+    """
+    def __init__(
+        self,
+        jobs: Sequence[Job],
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        batch_size: int = BATCH_SIZE,
+    ):
+        """
+        :param jobs: Jobs of the run, game ids must be unique
+        :param address: (host, port) to listen on, port 0 picks a free one
+        :param batch_size: Jobs sent to a worker at once
+        """
+        self.batch_size = batch_size
+        self._jobs = {job[0]: tuple(job) for job in jobs}
+        self._pending = collections.deque(self._jobs)
+        self._remaining = set(self._jobs)
+        # Game ids sent to every connected worker and not reported back yet
+        self._assigned: dict[int, set[int]] = {}
+        self._worker_ids = iter(range(1 << 62))
+        self._lock = threading.Lock()
+        self._results: queue.Queue[GameResult | None] = queue.Queue()
+        if not self._remaining:
+            self._results.put(None)
+
+        coordinator = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                coordinator._serve_worker(self.request)
+
+        self._server = socketserver.ThreadingTCPServer(
+            address, Handler, bind_and_activate=False
+        )
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Address the coordinator listens on."""
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def results(self) -> Iterator[GameResult]:
+        """Yield every job's result once, as it arrives.
+
+        Closes the coordinator when all jobs are done or the generator is closed.
+        """
+        try:
+            while (result := self._results.get()) is not None:
+                yield result
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening; connected workers see the connection drop."""
+        if self._thread.is_alive():
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+
+    def _serve_worker(self, sock: socket.socket) -> None:
+        with self._lock:
+            worker_id = next(self._worker_ids)
+            self._assigned[worker_id] = set()
+        try:
+            while (message := recv_message(sock)) is not None:
+                reply = self._handle(worker_id, message)
+                send_message(sock, reply)
+                if reply["op"] == "stop":
+                    break
+        except (OSError, ValueError, TypeError):
+            # Dropped connection or malformed message, e.g. a bad results entry
+            pass
+        finally:
+            with self._lock:
+                # Re-queue the unfinished jobs of a lost worker first
+                lost = self._assigned.pop(worker_id) & self._remaining
+                self._pending.extendleft(sorted(lost, reverse=True))
+
+    def _handle(self, worker_id: int, message: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            assigned = self._assigned[worker_id]
+            for values in message.get("results", ()):
+                result = GameResult(*values)
+                assigned.discard(result.game_id)
+                if result.game_id in self._remaining:
+                    self._remaining.remove(result.game_id)
+                    self._results.put(result)
+                    if not self._remaining:
+                        self._results.put(None)
+
+            if not self._remaining:
+                return {"op": "stop"}
+            batch = self._next_batch(worker_id)
+            if not batch:
+                return {"op": "wait"}
+            assigned.update(batch)
+            return {"op": "jobs", "jobs": [self._jobs[game_id] for game_id in batch]}
+
+    def _next_batch(self, worker_id: int) -> list[int]:
+        batch: list[int] = []
+        while self._pending and len(batch) < self.batch_size:
+            game_id = self._pending.popleft()
+            if game_id in self._remaining:
+                batch.append(game_id)
+        if batch:
+            return batch
+
+        # Steal from the worker with the most unfinished jobs
+        own = self._assigned[worker_id]
+        victims = [
+            assigned - own
+            for other_id, assigned in self._assigned.items()
+            if other_id != worker_id
+        ]
+        victim = max(victims, key=len, default=set())
+        return sorted(victim & self._remaining)[: self.batch_size]
+
+
+def _connect(address: tuple[str, int], timeout: float) -> socket.socket:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return socket.create_connection(address)
+        except ConnectionRefusedError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(WAIT_SECONDS)
+
+
+def run_worker(
+    address: tuple[str, int], connect_timeout: float = CONNECT_TIMEOUT
+) -> int:
+    """Play jobs from a coordinator until it stops or goes away.
+
+    Return the number of games played. Raise OSError (ConnectionRefusedError
+    once connect_timeout expired) if the coordinator cannot be reached.
+    """
+    played = 0
+    sock = _connect(address, connect_timeout)
+    try:
+        with sock:
+            results: list[list[Any]] = []
+            while True:
+                send_message(sock, {"op": "results", "results": results})
+                message = recv_message(sock)
+                if message is None or message["op"] == "stop":
+                    break
+                results = []
+                if message["op"] == "wait":
+                    time.sleep(WAIT_SECONDS)
+                    continue
+                for job in message["jobs"]:
+                    results.append(list(play_game(*job)))
+                played += len(results)
+    except ConnectionError:
+        pass
+    return played
+
+
+def _worker_process(address: tuple[str, int]) -> None:
+    try:
+        run_worker(address, CONNECT_TIMEOUT)
+    except OSError as exc:
+        host, port = address
+        print(f"Cannot reach the coordinator at {host}:{port}: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def run_workers(address: tuple[str, int], workers: int) -> int:
+    """Run several worker processes against one coordinator until it stops.
+
+    Return the number of workers that failed, e.g. because they could not
+    reach the coordinator.
+    """
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(address,))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return sum(process.exitcode != 0 for process in processes)
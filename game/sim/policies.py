@@ -0,0 +1,69 @@
+import functools
+import importlib
+import random
+from collections.abc import Callable
+
+from game.core.game import Game
+from game.core.types import MOVE_MASKS, MoveLiteral
+
+Policy = Callable[[Game, random.Random], MoveLiteral]
+"""Chooses the next move of a game that can still move; rng is per game."""
+
+CORNER_PRIORITY: tuple[MoveLiteral, ...] = ("d", "l", "r", "u")
+"""Move preference of the corner policy, keeping tiles in the bottom-left."""
+
+
+def _legal_moves(game: Game) -> list[MoveLiteral]:
+    legal_mask = game.legal_moves()
+    return [move for move, mask in MOVE_MASKS.items() if legal_mask & mask]
+
+
+def random_policy(game: Game, rng: random.Random) -> MoveLiteral:
+    """Play a uniformly random legal move."""
+    return rng.choice(_legal_moves(game))
+
+
+def greedy_policy(game: Game, rng: random.Random) -> MoveLiteral:
+    """Play the move with the highest merge score.
+
+    Ties go to the move leaving the most empty cells, then to a random one.
+    """
+    best: list[MoveLiteral] = []
+    best_key = (-1, -1)
+    for move, board, score in game.successors():
+        key = (score, board.cells.count(0))
+        if key > best_key:
+            best, best_key = [move], key
+        elif key == best_key:
+            best.append(move)
+    return best[0] if len(best) == 1 else rng.choice(best)
+
+
+def corner_policy(game: Game, rng: random.Random) -> MoveLiteral:
+    """Play the first legal move of CORNER_PRIORITY."""
+    legal_mask = game.legal_moves()
+    return next(move for move in CORNER_PRIORITY if legal_mask & MOVE_MASKS[move])
+
+
+POLICIES: dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "corner": corner_policy,
+}
+
+
+@functools.cache
+def get_policy(name: str) -> Policy:
+    """Return a built-in policy by name, or a plugin given as "module:function"."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, sep, attr = name.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(
+            f"Unknown policy {name!r}; expected one of {sorted(POLICIES)} "
+            "or a plugin as 'module:function'."
+        )
+    policy = getattr(importlib.import_module(module_name), attr)
+    if not callable(policy):
+        raise TypeError(f"Policy plugin {name!r} is not callable.")
+    return policy
@@ -0,0 +1,34 @@
+import multiprocessing
+import multiprocessing.pool
+from collections.abc import Iterable
+
+from game.core.codegen import get_step_functions
+from game.core.registry import TableHandle, attach_tables
+from game.core.zobrist import get_zobrist_table
+
+
+def warm_up(sizes: Iterable[int] = (4,), tables: Iterable[TableHandle] = ()) -> None:
+    """Prepare a worker process before its first job.
+
+    Importing this module imports game.core; then the shared tables are
+    attached and the per-size step functions and Zobrist keys are built.
+    """
+    attach_tables(tables)
+    for size in sizes:
+        get_step_functions(size)
+        get_zobrist_table(size)
+
+
+def warm_pool(
+    workers: int | None = None,
+    sizes: Iterable[int] = (4,),
+    tables: Iterable[TableHandle] = (),
+) -> multiprocessing.pool.Pool:
+    """Return a process pool whose workers run warm_up() as soon as they start.
+
+    The workers start right away, so they warm up while the caller is still
+    preparing the jobs. Reuse one pool across runs to pay the startup once.
+    """
+    return multiprocessing.Pool(
+        workers, initializer=warm_up, initargs=(tuple(sizes), tuple(tables))
+    )
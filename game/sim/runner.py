@@ -0,0 +1,267 @@
+import csv
+import json
+import multiprocessing
+import multiprocessing.pool
+import os
+import random
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import NamedTuple, TextIO
+
+from game.core.game import Game
+from game.core.registry import TableHandle
+from game.core.rng import RandomStreams
+from game.sim.policies import get_policy
+from game.sim.pool import warm_pool
+
+FORMATS = ("jsonl", "csv")
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game; duration is in seconds."""
+    game_id: int
+    seed: int
+    policy: str
+    size: int
+    moves: int
+    max_tile: int
+    score: int
+    duration: float
+
+
+class SimulationSummary(NamedTuple):
+    """Totals of the games played by one run_simulation() call."""
+    games: int
+    moves: int
+    seconds: float
+    best_tile: int
+    mean_score: float
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.moves / self.seconds if self.seconds else 0.0
+
+
+def game_seed(seed: int, game_id: int) -> str:
+    """Return the seed of one game's policy generator.
+
+    Its spawns draw from RandomStreams(seed).stream(game_id), so
+    Game.replay(seed, game_id, moves) rebuilds the game.
+    """
+    return f"{seed}/{game_id}"
+
+
+def play_game(game_id: int, seed: int, policy: str, size: int = 4) -> GameResult:
+    """Play one game with a policy until no move is possible.
+
+    Spawns draw from stream game_id of the run seed and the policy from its
+    own generator seeded by (seed, game_id), so a game is reproducible on any
+    worker.
+    """
+    choose_move = get_policy(policy)
+    game = Game(size, rng=RandomStreams(seed).stream(game_id))
+    rng = random.Random(f"{game_seed(seed, game_id)}/policy")
+
+    start = time.perf_counter()
+    game.insert_new_tile()
+    moves = 0
+    while game.can_move():
+        move = choose_move(game, rng)
+        if not game.step(move)[0]:
+            raise ValueError(f"Policy {policy!r} chose the illegal move {move!r}.")
+        game.insert_new_tile()
+        moves += 1
+    duration = time.perf_counter() - start
+
+    return GameResult(
+        game_id, seed, policy, size, moves, game.max_tile, game.score, duration
+    )
+
+
+def _play_task(task: tuple[int, int, str, int]) -> GameResult:
+    return play_game(*task)
+
+
+def detect_format(path: str | os.PathLike[str]) -> str:
+    """Return the result format implied by a file name (csv, else jsonl)."""
+    return "csv" if Path(path).suffix.lower() == ".csv" else "jsonl"
+
+
+def load_completed(
+    path: str | os.PathLike[str],
+    fmt: str,
+    seed: int | None = None,
+    policy: str | None = None,
+    size: int | None = None,
+) -> set[int]:
+    """Return the ids of the games already stored in a result file.
+
+    A trailing line cut short by an interrupted run is removed from the file,
+    so appending to it afterwards keeps the file well-formed. Every stored
+    game must match the seed, policy and size given (unless None), otherwise
+    the file belongs to another run and ValueError is raised.
+    """
+    path = Path(path)
+    if not path.exists():
+        return set()
+
+    with open(path, "rb+") as file:
+        data = file.read()
+        complete = data.rfind(b"\n") + 1
+        if complete != len(data):
+            file.truncate(complete)
+    lines = data[:complete].decode().splitlines()
+
+    if fmt == "csv":
+        rows = list(csv.DictReader(lines))
+    else:
+        rows = [json.loads(line) for line in lines if line.strip()]
+
+    expected = {"seed": seed, "policy": policy, "size": size}
+    for row in rows:
+        for name, value in expected.items():
+            # CSV fields are strings, compare in that form
+            if value is not None and str(row[name]) != str(value):
+                raise ValueError(
+                    f"Cannot resume {path}: it holds games played with "
+                    f"{name}={row[name]!r}, not {value!r}."
+                )
+    return {int(row["game_id"]) for row in rows}
+
+
+class ResultWriter:
+    """
+    Writes GameResults to a JSONL or CSV file as they arrive.
+    Every result is flushed right away, so the file doubles as the checkpoint
+    of an interrupted run (see load_completed()).
+    """
+    def __init__(self, path: str | os.PathLike[str], fmt: str, append: bool = False):
+        """
+        :param path: Result file
+        :param fmt: "jsonl" or "csv"
+        :param append: Keep the results already in the file
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown result format {fmt!r}.")
+        self.fmt = fmt
+        # Closed by close(), the writer is a context manager itself
+        self._file: TextIO = open(path, "a" if append else "w", newline="")  # noqa: SIM115
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.writer(self._file)
+            if self._file.tell() == 0:
+                self._csv.writerow(GameResult._fields)
+
+    def write(self, result: GameResult) -> None:
+        if self._csv is not None:
+            self._csv.writerow(result)
+        else:
+            self._file.write(json.dumps(result._asdict()) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _play_all(
+    tasks: list[tuple[int, int, str, int]],
+    workers: int,
+    pool: multiprocessing.pool.Pool | None = None,
+    tables: Sequence[TableHandle] = (),
+) -> Iterator[GameResult]:
+    """Yield the results of the tasks in completion order."""
+    if pool is None and workers == 1:
+        yield from map(_play_task, tasks)
+        return
+
+    # Several chunks per worker keep the pool busy until the very end
+    chunksize = max(1, min(64, len(tasks) // (workers * 8)))
+    if pool is not None:
+        yield from pool.imap_unordered(_play_task, tasks, chunksize)
+        return
+    sizes = {size for *_, size in tasks}
+    with warm_pool(workers, sizes, tables) as pool:
+        yield from pool.imap_unordered(_play_task, tasks, chunksize)
+
+
+def run_simulation(
+    games: int,
+    policy: str = "random",
+    size: int = 4,
+    seed: int = 0,
+    workers: int | None = None,
+    output: str | os.PathLike[str] | None = None,
+    fmt: str | None = None,
+    resume: bool = False,
+    serve: tuple[str, int] | None = None,
+    pool: multiprocessing.pool.Pool | None = None,
+    tables: Sequence[TableHandle] = (),
+) -> SimulationSummary:
+    """Play games 0..games-1 across a process pool and store their results.
+
+    :param games: Number of games of the whole run
+    :param policy: Policy name or "module:function" plugin (see policies)
+    :param size: Board size
+    :param seed: Seed of the run; game i is seeded by (seed, i)
+    :param workers: Worker processes, os.cpu_count() if None
+    :param output: Result file, none if None
+    :param fmt: "jsonl" or "csv", detected from the output name if None
+    :param resume: Skip the games already stored in output and append to it;
+        they must have been played with the same seed, policy and size
+    :param serve: Listen on this (host, port) and let remote workers play the
+        games (see game.sim.cluster) instead of a local process pool
+    :param pool: Process pool to reuse, e.g. from warm_pool(); a warm pool of
+        workers processes is created for the run if None
+    :param tables: Shared tables the workers of a new pool attach to
+    """
+    get_policy(policy)
+    workers = workers or os.cpu_count() or 1
+    fmt = fmt or (detect_format(output) if output is not None else "jsonl")
+
+    done: set[int] = set()
+    if resume and output is not None:
+        done = load_completed(output, fmt, seed, policy, size)
+    tasks = [
+        (game_id, seed, policy, size) for game_id in range(games) if game_id not in done
+    ]
+
+    writer = ResultWriter(output, fmt, append=resume) if output is not None else None
+    played = moves = best_tile = score_sum = 0
+    start = time.perf_counter()
+    try:
+        if serve is not None:
+            from game.sim.cluster import Coordinator
+
+            results = Coordinator(tasks, serve).results()
+        else:
+            workers = min(workers, max(len(tasks), 1))
+            results = _play_all(tasks, workers, pool, tables)
+        for result in results:
+            if writer is not None:
+                writer.write(result)
+            played += 1
+            moves += result.moves
+            best_tile = max(best_tile, result.max_tile)
+            score_sum += result.score
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return SimulationSummary(
+        played,
+        moves,
+        time.perf_counter() - start,
+        best_tile,
+        score_sum / played if played else 0.0,
+    )
@@ -0,0 +1,279 @@
+"""
+Gym-style vectorized environment stepping Game objects in worker processes.
+
+Requires the optional numpy dependency (pip install .[numpy]).
+"""
+
+import contextlib
+import multiprocessing
+import os
+from collections.abc import Sequence
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from game.core.batch import MOVES
+from game.core.game import Game
+from game.core.registry import SharedBlock, TableHandle
+from game.core.rng import RandomStreams
+from game.sim.pool import warm_up
+
+_STEP = b"step"
+_RESET = b"reset"
+_CLOSE = b"close"
+_OK = b"ok"
+
+
+class _SharedArrays:
+    """
+    Layout of the shared memory block of a SubprocVecEnv.
+    The int64 arrays come first so that every array is aligned.
+    """
+    def __init__(self, buffer: memoryview, num_envs: int, size: int):
+        cells = size * size
+        offset = 0
+
+        def take(nbytes: int, fmt: str) -> memoryview:
+            nonlocal offset
+            view = buffer[offset : offset + nbytes].cast(fmt)
+            offset += nbytes
+            return view
+
+        self.rewards = take(8 * num_envs, "q")
+        self.final_scores = take(8 * num_envs, "q")
+        self.final_max_tiles = take(8 * num_envs, "q")
+        self.observations = take(cells * num_envs, "B")
+        self.actions = take(num_envs, "B")
+        self.changed = take(num_envs, "B")
+        self.dones = take(num_envs, "B")
+
+    @staticmethod
+    def nbytes(num_envs: int, size: int) -> int:
+        return num_envs * (3 * 8 + size * size + 3)
+
+    def release(self) -> None:
+        for view in vars(self).values():
+            view.release()
+
+
+def _reset_env(shared: _SharedArrays, idx: int, game: Game, size: int) -> Game:
+    """Start a new episode in env idx on the generator of the previous one."""
+    game = Game(size, rng=game.rng)
+    game.insert_new_tile()
+    cells = size * size
+    shared.observations[idx * cells : (idx + 1) * cells] = game.board.cells
+    return game
+
+
+def _worker(
+    conn: Connection,
+    shm_name: str,
+    num_envs: int,
+    size: int,
+    env_ids: range,
+    streams: list[tuple[Any, int]],
+    tables: tuple[TableHandle, ...],
+) -> None:
+    """Step the envs of env_ids on every command until asked to close."""
+    warm_up((size,), tables)
+    # Attach anew: a forked copy of the parent's block is pinned by its arrays
+    shm = SharedMemory(shm_name)
+    shared = _SharedArrays(shm.buf, num_envs, size)
+    cells = size * size
+    try:
+        games = {}
+        for idx, (seed, stream_id) in zip(env_ids, streams, strict=True):
+            game = Game(size, rng=RandomStreams(seed).stream(stream_id))
+            games[idx] = _reset_env(shared, idx, game, size)
+        # Tell the parent the first episodes are ready
+        conn.send_bytes(_OK)
+
+        while (command := conn.recv_bytes()) != _CLOSE:
+            try:
+                if command == _RESET:
+                    for idx, game in games.items():
+                        games[idx] = _reset_env(shared, idx, game, size)
+                        shared.dones[idx] = 0
+                    conn.send_bytes(_OK)
+                    continue
+
+                for idx, game in games.items():
+                    changed, score = game.step(MOVES[shared.actions[idx]])
+                    if changed:
+                        game.insert_new_tile()
+                        shared.observations[idx * cells : (idx + 1) * cells] = (
+                            game.board.cells
+                        )
+                    shared.rewards[idx] = score
+                    shared.changed[idx] = changed
+                    done = not game.can_move()
+                    shared.dones[idx] = done
+                    if done:
+                        shared.final_scores[idx] = game.score
+                        shared.final_max_tiles[idx] = game.max_tile
+                        games[idx] = _reset_env(shared, idx, game, size)
+                    else:
+                        shared.final_scores[idx] = 0
+                        shared.final_max_tiles[idx] = 0
+                conn.send_bytes(_OK)
+            except Exception as exc:
+                conn.send_bytes(f"{type(exc).__name__}: {exc}".encode())
+    finally:
+        shared.release()
+        shm.close()
+
+
+class SubprocVecEnv:
+    """
+    num_envs independent 2048 games stepped by worker processes.
+    Every worker owns a contiguous slice of the envs. Actions, observations
+    (tile exponents), rewards and done flags live in one shared memory block,
+    so a step only sends a few bytes of command per worker over its pipe.
+    Every env starts its first episode right away. Finished games are reset
+    automatically; the returned observation of a done env is the first one
+    of its next episode.
+    """
+    def __init__(
+        self,
+        num_envs: int,
+        size: int = 4,
+        workers: int | None = None,
+        seed: int = 0,
+        seeds: Sequence[Any] | None = None,
+        tables: Sequence[TableHandle] = (),
+    ):
+        """
+        :param num_envs: Number of environments
+        :param size: Grid dimension (size x size)
+        :param workers: Worker processes, min(os.cpu_count(), num_envs) if None
+        :param seed: Seed of the run; env i draws from its stream i, like game i
+            of game.sim
+        :param seeds: Explicit seed of every env (its stream 0), overriding seed
+        :param tables: Shared tables (see game.core.registry) the workers attach
+        """
+        if seeds is None:
+            streams = [(seed, idx) for idx in range(num_envs)]
+        elif len(seeds) != num_envs:
+            raise ValueError(f"Expected {num_envs} seeds, got {len(seeds)}.")
+        else:
+            streams = [(env_seed, 0) for env_seed in seeds]
+        workers = min(workers or os.cpu_count() or 1, num_envs)
+
+        self.num_envs = num_envs
+        self.size = size
+        self._closed = False
+        self._shm = SharedBlock(
+            create=True, size=_SharedArrays.nbytes(num_envs, size)
+        )
+        self._shared = _SharedArrays(self._shm.buf, num_envs, size)
+        self.observations = np.asarray(self._shared.observations).reshape(
+            num_envs, size, size
+        )
+        self._actions = np.asarray(self._shared.actions)
+        self._rewards = np.asarray(self._shared.rewards)
+        self._changed = np.asarray(self._shared.changed).view(bool)
+        self._dones = np.asarray(self._shared.dones).view(bool)
+        self._final_scores = np.asarray(self._shared.final_scores)
+        self._final_max_tiles = np.asarray(self._shared.final_max_tiles)
+
+        self._conns: list[Connection] = []
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+        for lo, hi in zip(bounds[:-1], bounds[1:], strict=True):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker,
+                args=(
+                    child_conn,
+                    self._shm.name,
+                    num_envs,
+                    size,
+                    range(lo, hi),
+                    streams[lo:hi],
+                    tuple(tables),
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+        self._wait()
+
+    def reset(self) -> np.ndarray:
+        """Start a new episode in every env and return the observations.
+
+        The observations are a view of the shared block, overwritten by the
+        next step() or reset(); copy them to keep them.
+        """
+        self._broadcast(_RESET)
+        return self.observations
+
+    def step(
+        self, actions: np.ndarray | Sequence[int] | str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Apply one action per env, an index into MOVES or a move literal.
+
+        Return observations, rewards (merge score), dones and infos holding the
+        arrays changed, final_score and final_max_tile (0 unless done). All of
+        them are views of the shared block, valid until the next call.
+        """
+        if isinstance(actions, str):
+            actions = [MOVES.index(move) for move in actions]
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected one action per env ({self.num_envs}).")
+        if actions.size and not ((actions >= 0) & (actions < len(MOVES))).all():
+            raise ValueError(f"Actions must be between 0 and {len(MOVES) - 1}.")
+
+        self._actions[:] = actions
+        self._broadcast(_STEP)
+        infos = {
+            "changed": self._changed,
+            "final_score": self._final_scores,
+            "final_max_tile": self._final_max_tiles,
+        }
+        return self.observations, self._rewards, self._dones, infos
+
+    def close(self) -> None:
+        """Stop the workers and free the shared memory block."""
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._conns:
+            with contextlib.suppress(OSError):
+                conn.send_bytes(_CLOSE)
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+        # Drop the views of the block; closing fails while any of them is alive
+        self.observations = self._actions = self._rewards = None
+        self._changed = self._dones = None
+        self._final_scores = self._final_max_tiles = None
+        self._shared.release()
+        self._shm.close()
+        self._shm.unlink()
+
+    def _broadcast(self, command: bytes) -> None:
+        if self._closed:
+            raise RuntimeError("The environment is closed.")
+        for conn in self._conns:
+            conn.send_bytes(command)
+        self._wait()
+
+    def _wait(self) -> None:
+        """Wait until every worker has answered the last command."""
+        errors = [reply for conn in self._conns if (reply := conn.recv_bytes()) != _OK]
+        if errors:
+            raise RuntimeError(f"Worker failed: {errors[0].decode()}")
+
+    def __enter__(self) -> "SubprocVecEnv":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,27 @@
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from game.core import tables
+
+
+@pytest.fixture
+def isolated_tables(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Keep the per-process table registry and the cache directory per test."""
+    monkeypatch.setattr(tables, "_row_tables", {})
+    monkeypatch.setenv("GAME2048_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def random_grid() -> Callable[..., list[list[int]]]:
+    """Return a function drawing a size x size grid of the given tile values."""
+    def draw(
+        rng: random.Random,
+        size: int,
+        values: tuple[int, ...] = (0, 0, 0, 2, 2, 4, 8, 16, 2048),
+    ) -> list[list[int]]:
+        return [[rng.choice(values) for _ in range(size)] for _ in range(size)]
+
+    return draw
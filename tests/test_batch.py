@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from game.core.board import Board
+from game.core.game import Game
+
+np = pytest.importorskip("numpy")
+
+from game.core.batch import MOVES, BatchGame  # noqa: E402
+
+pytestmark = pytest.mark.usefixtures("isolated_tables")
+
+
+@pytest.mark.parametrize("size", [4, 5])
+def test_shift_matches_game_moves(size: int):
+    """Size 4 goes through the row table, including its fallback for 65536."""
+    rng = random.Random(size)
+    values = (0, 0, 2, 2, 4, 8, 2048, 65536)
+    boards = [
+        Board.from_grid(
+            [[rng.choice(values) for _ in range(size)] for _ in range(size)]
+        )
+        for _ in range(300)
+    ]
+    moves = [rng.choice(MOVES) for _ in boards]
+    batch = BatchGame(len(boards), size, initial_tiles=0)
+    for idx, board in enumerate(boards):
+        batch.set_board(idx, board)
+
+    changed, rewards = batch.shift(moves)
+
+    for idx, (board, move) in enumerate(zip(boards, moves, strict=True)):
+        game = Game(size)
+        game.board = board
+        assert (bool(changed[idx]), int(rewards[idx])) == game.step(move)
+        assert batch.board(idx) == game.board
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 6])
+def test_play_matches_game_given_same_draws(size: int):
+    count = 16
+    games = [Game(size, rng=random.Random(idx)) for idx in range(count)]
+    # Independent copies of the games' generators, producing the same draws
+    draws = [random.Random(idx) for idx in range(count)]
+    batch = BatchGame(count, size, initial_tiles=0, auto_reset=False)
+    policy = random.Random(size)
+
+    def spawn(selected: list[int]) -> None:
+        empty = (batch.cells == 0).sum(axis=(1, 2))
+        ranks = [draws[idx].randrange(int(empty[idx])) for idx in selected]
+        values = [draws[idx].random() for idx in selected]
+        batch.place_tiles(np.array(selected), np.array(ranks), np.array(values))
+        for idx in selected:
+            games[idx].insert_new_tile()
+
+    spawn(list(range(count)))
+    for _ in range(200):
+        moves = [policy.choice(MOVES) for _ in range(count)]
+        changed, _ = batch.shift(moves)
+        for game, move, batch_changed in zip(games, moves, changed, strict=True):
+            assert game.step(move)[0] == batch_changed
+        spawn([idx for idx in range(count) if changed[idx]])
+
+        assert [batch.board(idx) for idx in range(count)] == [g.board for g in games]
+        assert batch.scores.tolist() == [game.score for game in games]
+        assert batch.can_move().tolist() == [game.can_move() for game in games]
+        assert batch.max_tiles.tolist() == [game.max_tile for game in games]
+
+
+def test_step_resets_finished_boards():
+    batch = BatchGame(2, 2, rng=3)
+    full = Board.from_grid([[2, 4], [8, 4]])
+    batch.set_board(0, full)
+    batch.scores[0] = 40
+
+    result = batch.step(["u", "l"])
+
+    assert result.changed.tolist()[0]
+    assert result.rewards[0] == 8
+    assert result.done.tolist()[0]
+    assert result.final_scores[0] == 48
+    assert result.final_max_tiles[0] == 8
+    assert batch.scores[0] == 0
+    assert (batch.cells[0] != 0).sum() == 1
+
+
+def test_step_spawns_on_changed_boards_only():
+    batch = BatchGame(3, 4, rng=5)
+    before = batch.cells.copy()
+
+    result = batch.step(np.array([0, 1, 2]))
+
+    tiles = (batch.cells != 0).sum(axis=(1, 2))
+    expected = (before != 0).sum(axis=(1, 2)) + result.changed
+    assert tiles.tolist() == expected.tolist()
+    assert not result.done.any()
+
+
+def test_rejects_wrong_move_count():
+    batch = BatchGame(3)
+
+    with pytest.raises(ValueError):
+        batch.step("lr")
+
+
+@pytest.mark.parametrize("codes", [[0, 1, 4], [-1, 0, 0]])
+def test_rejects_unknown_move_codes(codes: list[int]):
+    batch = BatchGame(3)
+    before = batch.cells.copy()
+
+    with pytest.raises(ValueError):
+        batch.step(codes)
+    assert (batch.cells == before).all()
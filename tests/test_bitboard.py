@@ -0,0 +1,90 @@
+import copy
+import random
+from collections.abc import Callable
+
+import pytest
+
+from game.core.bitboard import BitboardGame
+from game.core.game import Game
+
+
+@pytest.mark.parametrize("size", [2, 5])
+def test_unsupported_size(size: int):
+    with pytest.raises(ValueError):
+        BitboardGame(size)
+
+
+@pytest.mark.parametrize("value", [3, -2, 65536])
+def test_grid_setter_rejects_unpackable_values(value: int):
+    game = BitboardGame(3)
+
+    with pytest.raises(ValueError):
+        game.grid = [[value, 0, 0], [0, 0, 0], [0, 0, 0]]
+
+
+def test_grid_roundtrip():
+    grid = [
+        [2, 4, 8, 16],
+        [32, 64, 128, 256],
+        [512, 1024, 2048, 4096],
+        [8192, 16384, 32768, 0],
+    ]
+    game = BitboardGame(4)
+
+    game.grid = grid
+
+    assert game.grid == grid
+
+
+def test_insert_new_tile():
+    game = BitboardGame(3)
+
+    value, row, col = game.insert_new_tile()
+
+    assert value in (2, 4)
+    assert game.grid[row][col] == value
+    assert sum(cell != 0 for row in game.grid for cell in row) == 1
+
+
+def test_max_tiles_do_not_merge():
+    game = BitboardGame(3)
+    game.grid = [[32768, 32768, 0], [0, 0, 0], [0, 0, 0]]
+
+    changed, _, _ = game.move_left()
+
+    assert changed is False
+    assert game.grid[0] == [32768, 32768, 0]
+
+
+@pytest.mark.parametrize("size", BitboardGame.SUPPORTED_SIZES)
+@pytest.mark.parametrize("move", ["move_left", "move_right", "move_up", "move_down"])
+def test_moves_match_game(
+    size: int, move: str, random_grid: Callable[..., list[list[int]]]
+):
+    rng = random.Random(size)
+    for _ in range(200):
+        grid = random_grid(rng, size)
+        game = Game(size)
+        game.grid = copy.deepcopy(grid)
+        bitboard = BitboardGame(size)
+        bitboard.grid = grid
+
+        assert getattr(bitboard, move)() == getattr(game, move)()
+        assert bitboard.grid == game.grid
+
+
+@pytest.mark.parametrize("size", BitboardGame.SUPPORTED_SIZES)
+def test_queries_match_game(size: int, random_grid: Callable[..., list[list[int]]]):
+    rng = random.Random(size)
+    for i in range(200):
+        # Every other grid is full, so the adjacency checks are exercised too
+        values = (2, 4, 8, 16) if i % 2 else (0, 2, 4, 2048)
+        grid = random_grid(rng, size, values)
+        game = Game(size)
+        game.grid = grid
+        bitboard = BitboardGame(size)
+        bitboard.grid = grid
+
+        assert bitboard.can_move() == game.can_move()
+        assert bitboard.check_victory() == game.check_victory()
+        assert bitboard.get_score() == game.get_score()
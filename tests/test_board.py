@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+from game import Game
+from game.core.board import Board
+
+
+@pytest.fixture
+def grid() -> list[list[int]]:
+    return [
+        [2, 4, 0],
+        [0, 2048, 8],
+        [16, 0, 65536],
+    ]
+
+
+def test_grid_roundtrip(grid: list[list[int]]):
+    board = Board.from_grid(grid)
+
+    assert board.size == 3
+    assert board.cells == bytes([1, 2, 0, 0, 11, 3, 4, 0, 16])
+    assert board.to_grid() == grid
+    assert board[1, 1] == 2048
+    assert board[2, 1] == 0
+
+
+@pytest.mark.parametrize("value", [1, 3, -2])
+def test_from_grid_rejects_non_tiles(value: int):
+    with pytest.raises(ValueError):
+        Board.from_grid([[value, 0], [0, 0]])
+
+
+def test_wrong_cell_count():
+    with pytest.raises(ValueError):
+        Board(3, bytes(8))
+
+
+def test_equality_and_hash(grid: list[list[int]]):
+    board = Board.from_grid(grid)
+    same = Board.from_grid([row[:] for row in grid])
+    grid[0][0] = 4
+    other = Board.from_grid(grid)
+
+    assert board == same
+    assert hash(board) == hash(same)
+    assert board != other
+    assert board != Board(1, bytes(1))
+    assert board.__eq__(grid) is NotImplemented
+    assert {board: "cached"}[same] == "cached"
+
+
+def test_boards_of_different_sizes_differ():
+    assert Board(2, bytes(4)) != Board(1, bytes(4)[:1])
+    assert Board(2, bytes(4)) != Board(4, bytes(16))
+
+
+def test_immutable(grid: list[list[int]]):
+    board = Board.from_grid(grid)
+
+    with pytest.raises(AttributeError):
+        board.size = 4
+    with pytest.raises(AttributeError):
+        del board.cells
+
+
+def test_pickle(grid: list[list[int]]):
+    board = Board.from_grid(grid)
+
+    assert pickle.loads(pickle.dumps(board)) == board
+
+
+def test_game_board_property(grid: list[list[int]]):
+    game = Game(size=3)
+    game.board = Board.from_grid(grid)
+
+    assert game.grid == grid
+    assert game.board == Board.from_grid(grid)
+    assert game.max_tile == 65536
+
+    with pytest.raises(ValueError):
+        game.board = Board(2, bytes(4))
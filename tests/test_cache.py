@@ -0,0 +1,41 @@
+import pytest
+
+from game.core.cache import LRUCache
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_counts_hits_and_misses():
+    cache = LRUCache(4)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.clear()
+
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_zero_capacity_disables_caching():
+    cache = LRUCache(0)
+    cache.put("a", 1)
+
+    assert len(cache) == 0
+
+
+def test_rejects_negative_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(-1)
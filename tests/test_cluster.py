@@ -0,0 +1,140 @@
+import json
+import multiprocessing
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from game.sim import cluster
+from game.sim.__main__ import main
+from game.sim.cluster import (
+    Coordinator,
+    parse_address,
+    recv_message,
+    run_worker,
+    send_message,
+)
+from game.sim.runner import play_game
+
+JOBS = [(game_id, 3, "corner", 3) for game_id in range(12)]
+
+
+def expected_results() -> list[tuple]:
+    return [play_game(*job)._replace(duration=0) for job in JOBS]
+
+
+def collect(coordinator: Coordinator) -> list[tuple]:
+    return sorted(
+        result._replace(duration=0) for result in coordinator.results()
+    )
+
+
+def start_workers(address: tuple[str, int], count: int) -> list:
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(address,))
+        for _ in range(count)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def test_parse_address():
+    assert parse_address("localhost:2048") == ("localhost", 2048)
+    assert parse_address(":80") == ("", 80)
+    assert parse_address("[::1]:9000") == ("::1", 9000)
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+def test_worker_processes_play_every_job_once():
+    coordinator = Coordinator(JOBS, batch_size=2)
+    processes = start_workers(coordinator.address, 3)
+
+    results = collect(coordinator)
+
+    for process in processes:
+        process.join(timeout=10)
+    assert results == expected_results()
+
+
+def test_jobs_of_disconnected_worker_are_requeued():
+    coordinator = Coordinator(JOBS, batch_size=5)
+    with socket.create_connection(coordinator.address) as sock:
+        send_message(sock, {"op": "results", "results": []})
+        taken = recv_message(sock)["jobs"]
+    assert len(taken) == 5
+
+    processes = start_workers(coordinator.address, 1)
+    results = collect(coordinator)
+
+    processes[0].join(timeout=10)
+    assert results == expected_results()
+
+
+def test_malformed_results_drop_worker_and_requeue_its_jobs(
+    capsys: pytest.CaptureFixture[str],
+):
+    coordinator = Coordinator(JOBS, batch_size=5)
+    with socket.create_connection(coordinator.address) as sock:
+        send_message(sock, {"op": "results", "results": []})
+        assert len(recv_message(sock)["jobs"]) == 5
+        send_message(sock, {"op": "results", "results": [[0, 3]]})
+        assert recv_message(sock) is None
+
+    processes = start_workers(coordinator.address, 1)
+    results = collect(coordinator)
+
+    processes[0].join(timeout=10)
+    assert results == expected_results()
+    assert "Traceback" not in capsys.readouterr().err
+
+
+def test_worker_fails_without_coordinator(monkeypatch: pytest.MonkeyPatch):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        address = probe.getsockname()
+    monkeypatch.setattr(cluster, "CONNECT_TIMEOUT", 0.2)
+
+    with pytest.raises(ConnectionRefusedError):
+        run_worker(address, connect_timeout=0.2)
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--connect", f"127.0.0.1:{address[1]}", "--workers", "2"])
+    assert exc_info.value.code == 1
+
+
+def test_idle_worker_steals_from_straggler():
+    coordinator = Coordinator(JOBS, batch_size=4)
+    straggler = socket.create_connection(coordinator.address)
+    send_message(straggler, {"op": "results", "results": []})
+    assert len(recv_message(straggler)["jobs"]) == 4
+
+    # The straggler never reports back, the other worker finishes its jobs
+    thread = threading.Thread(target=run_worker, args=(coordinator.address,))
+    thread.start()
+    results = collect(coordinator)
+
+    thread.join(timeout=10)
+    straggler.close()
+    assert results == expected_results()
+
+
+def test_cli_serves_workers(tmp_path: Path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    output = tmp_path / "results.jsonl"
+    address = f"127.0.0.1:{port}"
+    coordinator = threading.Thread(
+        target=main,
+        args=(["--games", "6", "--size", "3", "--serve", address,
+               "--output", str(output)],),
+    )
+    coordinator.start()
+
+    main(["--connect", address, "--workers", "2"])
+    coordinator.join(timeout=10)
+
+    lines = output.read_text().splitlines()
+    assert sorted(json.loads(line)["game_id"] for line in lines) == list(range(6))
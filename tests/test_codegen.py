@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from game.core.codegen import (
+    MAX_UNROLLED_SIZE,
+    generate_step_source,
+    get_step_functions,
+)
+from game.core.game import Game
+
+
+def derived_state(game: Game) -> tuple:
+    return (
+        game.grid,
+        game.score,
+        game.max_tile,
+        game.zobrist_hash,
+        game.check_victory(),
+        game._empty_mask,
+        game.legal_moves(),
+    )
+
+
+@pytest.mark.parametrize("size", range(2, MAX_UNROLLED_SIZE + 1))
+@pytest.mark.parametrize("move", ["l", "r", "u", "d"])
+def test_unrolled_step_matches_generic_kernel(size: int, move: str):
+    rng = random.Random(size)
+    values = (0, 0, 0, 2, 2, 4, 8, 1024, 1024, 2048, 2048)
+    for _ in range(50):
+        grid = [[rng.choice(values) for _ in range(size)] for _ in range(size)]
+        unrolled = Game(size)
+        unrolled.grid = [row[:] for row in grid]
+        generic = Game(size)
+        generic.grid = grid
+
+        result = get_step_functions(size)[move](unrolled)
+        changed, _, _, score = generic._move(move, with_bias=False)
+
+        assert result == (changed, score)
+        assert derived_state(unrolled) == derived_state(generic)
+
+
+def test_source_has_no_loops():
+    source = generate_step_source(4, "u")
+
+    assert "for " not in source
+    assert "while " not in source
+
+
+@pytest.mark.parametrize("size", [1, MAX_UNROLLED_SIZE + 1])
+def test_uncovered_sizes_fall_back(size: int):
+    game = Game(size)
+    game.grid = [[2] * size for _ in range(size)]
+
+    assert get_step_functions(size) is None
+    assert game.step("l") == (size > 1, size * 4 * (size // 2))
+
+
+def test_step_functions_are_compiled_once():
+    assert get_step_functions(4) is get_step_functions(4)
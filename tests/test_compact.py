@@ -0,0 +1,149 @@
+import copy
+import random
+from collections.abc import Callable
+
+import pytest
+
+from game.core.compact import CompactGame, export_boards
+from game.core.game import Game
+
+
+def test_grid_roundtrip():
+    grid = [[2, 0, 4], [0, 2048, 0], [65536, 8, 0]]
+    game = CompactGame(3)
+
+    game.grid = grid
+
+    assert game.grid == grid
+    assert game.cells == bytearray([1, 0, 2, 0, 11, 0, 16, 3, 0])
+
+
+@pytest.mark.parametrize("size", [2, 3, 5, 8])
+@pytest.mark.parametrize("move", ["move_left", "move_right", "move_up", "move_down"])
+def test_moves_match_game(
+    size: int, move: str, random_grid: Callable[..., list[list[int]]]
+):
+    rng = random.Random(size)
+    for _ in range(100):
+        grid = random_grid(rng, size)
+        game = Game(size)
+        game.grid = copy.deepcopy(grid)
+        compact = CompactGame(size)
+        compact.grid = grid
+
+        assert getattr(compact, move)() == getattr(game, move)()
+        assert compact.grid == game.grid
+        assert compact.score == game.score
+
+
+@pytest.mark.parametrize("size", [3, 16])
+def test_play_matches_game(size: int):
+    game = Game(size)
+    compact = CompactGame(size)
+    random.seed(size)
+    game.insert_new_tile()
+    random.seed(size)
+    compact.insert_new_tile()
+
+    rng = random.Random(size)
+    for _ in range(300):
+        if not game.can_move():
+            break
+        move = rng.choice("lrud")
+        state = random.getstate()
+        changed = game.step(move)
+        assert compact.step(move) == changed
+        if changed[0]:
+            game.insert_new_tile()
+            random.setstate(state)
+            compact.insert_new_tile()
+        assert compact.grid == game.grid
+        assert compact.can_move() == game.can_move()
+        assert compact.check_victory() == game.check_victory()
+        assert compact.get_score() == game.get_score()
+
+
+def test_stable_lines_are_skipped():
+    game = CompactGame(4)
+    game.grid = [[2, 4, 0, 0], [0, 0, 0, 2], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+    game.step("l")
+    first_flags = bytes(game._stable_rows)
+    changed, _ = game.step("l")
+
+    assert changed is False
+    assert first_flags[0] and not first_flags[1]
+    assert all(game._stable_rows)
+
+
+def test_insert_new_tile_into_full_grid():
+    game = CompactGame(2)
+    game.grid = [[2, 4], [8, 16]]
+
+    with pytest.raises(IndexError):
+        game.insert_new_tile()
+
+
+def test_view_follows_moves_without_copying():
+    game = CompactGame(3)
+    game.grid = [[2, 2, 0], [0, 0, 0], [0, 0, 4]]
+    view = game.view()
+
+    game.move_left()
+
+    assert view.readonly
+    assert view.tolist() == [[2, 0, 0], [0, 0, 0], [2, 0, 0]]
+    with pytest.raises(TypeError):
+        view[0, 0] = 5
+
+
+def test_writable_view_requires_invalidate():
+    game = CompactGame(2)
+    game.grid = [[2, 0], [0, 0]]
+    game.move_left()
+    view = game.view(readonly=False)
+
+    view[0, 1] = 1
+    game.invalidate()
+
+    assert game.move_left()[0]
+    assert game.grid == [[4, 0], [0, 0]]
+
+
+def test_numpy_views_storage():
+    np = pytest.importorskip("numpy")
+    game = CompactGame(2)
+    game.grid = [[2, 4], [0, 8]]
+
+    view = np.asarray(game)
+    copy = np.array(game, dtype=np.int64)
+    game.move_up()
+
+    assert not view.flags.writeable
+    assert view.tolist() == [[1, 2], [0, 3]]
+    assert copy.flags.writeable
+    assert copy.tolist() == [[1, 2], [0, 3]]
+    with pytest.raises(ValueError):
+        np.asarray(game, dtype=np.int64, copy=False)
+
+
+def test_export_boards_into_preallocated_array(
+    random_grid: Callable[..., list[list[int]]]
+):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(19)
+    games = []
+    for _ in range(5):
+        game = CompactGame(4)
+        game.grid = random_grid(rng, 4)
+        games.append(game)
+    boards = [game.board for game in games[:2]] + games[2:]
+    out = np.zeros((5, 4, 4), dtype=np.uint8)
+
+    assert export_boards(boards, out) is out
+    assert out.tolist() == [np.asarray(game).tolist() for game in games]
+    assert export_boards(games).tolist() == out.tolist()
+    with pytest.raises(ValueError):
+        export_boards(games, np.zeros((4, 4, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        export_boards([CompactGame(3), CompactGame(4)])
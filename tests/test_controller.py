@@ -4,6 +4,7 @@ import pygame
 import pytest
 
 from game import Controller, Game, GameState
+from game.core.types import MoveEvent
 from game.rendering import UI, AnimationManager, Renderer, TileManager
 
 
@@ -161,12 +162,12 @@ def test_process_event_restart_click(mock_game: Mock, mock_renderer: Mock,
 
 
 @pytest.mark.parametrize(
-    "event_fixture, move_method_name",
+    "event_fixture, move_str",
     [
-        ("mock_event_key_down_left", "move_left"),
-        ("mock_event_key_down_right", "move_right"),
-        ("mock_event_key_down_up", "move_up"),
-        ("mock_event_key_down_down", "move_down"),
+        ("mock_event_key_down_left", "l"),
+        ("mock_event_key_down_right", "r"),
+        ("mock_event_key_down_up", "u"),
+        ("mock_event_key_down_down", "d"),
     ],
     ids=["left", "right", "up", "down"]
 )
@@ -175,26 +176,27 @@ def test_process_event_key_move_no_change(
     mock_renderer: Mock,
     request: pytest.FixtureRequest,
     event_fixture: str,
-    move_method_name: str,
+    move_str: str,
 ):
     """Test that key press with no grid changes returns PLAYING state."""
     event = request.getfixturevalue(event_fixture)
     controller = Controller(mock_game, mock_renderer)
 
-    move_method = getattr(mock_game, move_method_name)
-    move_method.return_value = False, [], []
+    mock_game.move.return_value = False, [], 0
 
     state = controller.process_event(event)
+    mock_game.move.assert_called_once_with(move_str)
+    mock_renderer.tile_manager.append_move_events.assert_not_called()
     assert state == GameState.PLAYING
 
 
 @pytest.mark.parametrize(
-    "event_fixture, move_method_name, move_str",
+    "event_fixture, move_str",
     [
-        ("mock_event_key_down_left", "move_left", "l"),
-        ("mock_event_key_down_right", "move_right", "r"),
-        ("mock_event_key_down_up", "move_up", "u"),
-        ("mock_event_key_down_down", "move_down", "d"),
+        ("mock_event_key_down_left", "l"),
+        ("mock_event_key_down_right", "r"),
+        ("mock_event_key_down_up", "u"),
+        ("mock_event_key_down_down", "d"),
     ],
     ids=["left", "right", "up", "down"]
 )
@@ -203,7 +205,6 @@ def test_process_event_key_move_with_change(
     mock_renderer: Mock,
     request: pytest.FixtureRequest,
     event_fixture: str,
-    move_method_name: str,
     move_str: str
 ):
     """Test that key press with grid changes processes move correctly."""
@@ -212,10 +213,9 @@ def test_process_event_key_move_with_change(
     mock_game.insert_new_tile.reset_mock()
 
     # Setup move method and other dependencies
-    bias_matrix = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]
+    events = [MoveEvent(0, 1, 0, 0, 2), MoveEvent(0, 3, 0, 0, 2, merged=True)]
 
-    move_method = getattr(mock_game, move_method_name)
-    move_method.return_value = True, bias_matrix, move_str
+    mock_game.move.return_value = True, events, 4
     mock_game.check_victory.return_value = False
     mock_game.can_move.return_value = True
 
@@ -223,9 +223,8 @@ def test_process_event_key_move_with_change(
     state = controller.process_event(event)
 
     # Verify
-    mock_renderer.tile_manager.append_new_move.assert_called_with(
-        bias_matrix, move_str
-    )
+    mock_game.move.assert_called_once_with(move_str)
+    mock_renderer.tile_manager.append_move_events.assert_called_with(events)
     mock_game.insert_new_tile.assert_called_once()
     mock_renderer.tile_manager.append_new_tile.assert_called_with(2, 0, 0)
     mock_game.check_victory.assert_called_once()
@@ -243,10 +242,9 @@ def test_process_event_key_move_victory(
 
     # Setup move method and other dependencies
     prev_grid = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-    bias_matrix = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]
-    merge_matrix = [[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0]]
+    events = [MoveEvent(0, 1, 0, 0, 1024, merged=True)]
 
-    mock_game.move_left.return_value = True, bias_matrix, merge_matrix
+    mock_game.move.return_value = True, events, 2048
     mock_game.check_victory.return_value = True
     mock_game.grid = prev_grid
     mock_renderer.current_time = 0
@@ -269,10 +267,9 @@ def test_process_event_key_move_game_over(
 
     # Setup move method and other dependencies
     prev_grid = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-    bias_matrix = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]
-    merge_matrix = [[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0]]
+    events = [MoveEvent(0, 1, 0, 0, 1024, merged=True)]
 
-    mock_game.move_left.return_value = True, bias_matrix, merge_matrix
+    mock_game.move.return_value = True, events, 2048
     mock_game.check_victory.return_value = False
     mock_game.can_move.return_value = False
     mock_game.grid = prev_grid
@@ -310,3 +307,27 @@ def test_process_event_other_event(
 
     state = controller.process_event(mock_event)
     assert state == GameState.PLAYING
+
+
+@pytest.mark.parametrize(
+    "key, action_name",
+    [(pygame.K_z, "undo"), (pygame.K_BACKSPACE, "undo"), (pygame.K_y, "redo")],
+    ids=["undo", "undo_backspace", "redo"],
+)
+@pytest.mark.parametrize("applied", [True, False])
+def test_process_event_history_keys(
+    mock_game: Mock, mock_renderer: Mock, key: int, action_name: str, applied: bool
+):
+    """Test that undo/redo keys revert the game and redraw the tiles."""
+    controller = Controller(mock_game, mock_renderer)
+    getattr(mock_game, action_name).return_value = applied
+    event = Mock(spec=pygame.event.Event)
+    event.type = pygame.KEYDOWN
+    event.key = key
+
+    state = controller.process_event(event)
+
+    getattr(mock_game, action_name).assert_called_once()
+    assert mock_renderer.tile_manager.rebuild.called is applied
+    mock_game.insert_new_tile.assert_called_once()  # only the initial tile
+    assert state == GameState.PLAYING
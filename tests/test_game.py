@@ -1,6 +1,11 @@
+import itertools
+import random
+
 import pytest
 
 from game import Game
+from game.core.bitboard import BitboardGame
+from game.core.types import MOVE_MASKS, MoveEvent, MoveLiteral, MoveMask
 
 
 @pytest.fixture
@@ -53,6 +58,40 @@ def test_insert_new_tile_smaller_grid(game_2x2: Game):
     assert 0 <= col < 2, "Column value must be within bounds of 2x2 grid"
 
 
+def test_insert_new_tile_full_grid(game_full_grid: Game):
+    with pytest.raises(IndexError):
+        game_full_grid.insert_new_tile()
+
+
+def test_insert_new_tile_fills_every_empty_cell(game_2x2: Game):
+    game_2x2.grid = [[0, 8], [0, 0]]
+
+    cells = {game_2x2.insert_new_tile()[1:] for _ in range(3)}
+
+    assert cells == {(0, 0), (1, 0), (1, 1)}
+    assert all(value != 0 for row in game_2x2.grid for value in row)
+
+
+def test_insert_new_tile_after_moves_matches_random_choice(game: Game):
+    """Spawns draw the same numbers as random.choice over the empty cells."""
+    reference = random.Random(2048)
+    random.seed(2048)
+    moves = ["move_left", "move_up", "move_right", "move_down"]
+
+    for i in range(40):
+        empty_cells = [
+            (r, c) for r in range(game.size) for c in range(game.size)
+            if game.grid[r][c] == 0
+        ]
+        if not empty_cells:
+            break
+        y, x = reference.choice(empty_cells)
+        expected_value = 2 if reference.random() < 0.9 else 4
+
+        assert game.insert_new_tile() == (expected_value, y, x)
+        getattr(game, moves[i % 4])()
+
+
 #===============================
 # Can move tests
 #===============================
@@ -110,6 +149,84 @@ def test_can_move(game: Game, grid: list[list[int]], expected_result: bool):
     assert result == expected_result
 
 
+#===============================
+# Legal moves tests
+#===============================
+
+@pytest.mark.parametrize(
+    "grid, expected_mask",
+    [
+        pytest.param(
+            [
+                [2, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0]
+            ],
+            MoveMask.RIGHT | MoveMask.DOWN,
+            id="top_left_corner"
+        ),
+        pytest.param(
+            [
+                [2, 4, 2, 4],
+                [4, 2, 4, 2],
+                [2, 4, 2, 4],
+                [4, 2, 4, 8]
+            ],
+            MoveMask(0),
+            id="no_moves_available"
+        ),
+        pytest.param(
+            [
+                [2, 2, 4, 8],
+                [4, 8, 2, 4],
+                [2, 4, 8, 2],
+                [4, 2, 4, 8]
+            ],
+            MoveMask.LEFT | MoveMask.RIGHT,
+            id="horizontal_merge"
+        ),
+        pytest.param(
+            [
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0]
+            ],
+            MoveMask(0),
+            id="empty_grid"
+        ),
+    ]
+)
+def test_legal_moves(game: Game, grid: list[list[int]], expected_mask: MoveMask):
+    game.grid = grid
+
+    assert game.legal_moves() == expected_mask
+
+
+def test_legal_moves_kept_up_to_date(game: Game):
+    """The incremental mask matches trying every move on an independent engine."""
+    rng = random.Random(6)
+    game.rng = random.Random(6)
+    moves: list[MoveLiteral] = ["l", "r", "u", "d"]
+    probe = BitboardGame(size=game.size)
+
+    game.insert_new_tile()
+    while game.can_move():
+        expected_mask = MoveMask(0)
+        for move, method in zip(
+            moves, ["move_left", "move_right", "move_up", "move_down"], strict=True
+        ):
+            probe.grid = game.grid
+            if getattr(probe, method)()[0]:
+                expected_mask |= MOVE_MASKS[move]
+        assert game.legal_moves() == expected_mask
+
+        changed, _ = game.step(rng.choice(moves))
+        if changed:
+            game.insert_new_tile()
+
+
 #===============================
 # Check victory tests
 #===============================
@@ -194,6 +311,39 @@ def test_get_score(game: Game, grid: list[list[int]], expected_result: int):
     assert result == expected_result
 
 
+def test_score_and_max_tile_track_merges(game: Game):
+    game.grid = [
+        [2, 2, 4, 4],
+        [8, 0, 8, 0],
+        [16, 0, 0, 0],
+        [0, 0, 0, 2]
+    ]
+
+    game.move_left()
+    game.move_down()
+
+    assert game.score == (4 + 8 + 16) + 32
+    assert game.max_tile == game.get_score() == 32
+
+
+@pytest.mark.parametrize(
+    "row, expected_victory",
+    [
+        pytest.param([1024, 1024, 0, 0], True, id="2048_created"),
+        pytest.param([2048, 2048, 0, 0], False, id="2048_tiles_merged"),
+        pytest.param([2048, 2048, 2048, 0], True, id="2048_tile_left"),
+    ]
+)
+def test_check_victory_after_move(
+    game: Game, row: list[int], expected_victory: bool
+):
+    game.grid = [row, [0] * 4, [0] * 4, [0] * 4]
+
+    game.move_left()
+
+    assert game.check_victory() == expected_victory
+
+
 #===============================
 # Move left tests
 #===============================
@@ -798,3 +948,268 @@ def test_move_down(
     assert changed == expected_changed
     assert bias_matrix == expected_bias_matrix
     assert move_type == 'd'
+
+
+@pytest.mark.parametrize("move", ["move_left", "move_right", "move_up", "move_down"])
+def test_move_updates_grid_in_place(game: Game, move: str):
+    game.grid = [
+        [2, 2, 0, 4],
+        [0, 4, 0, 4],
+        [8, 0, 8, 0],
+        [0, 0, 0, 2]
+    ]
+    rows = list(game.grid)
+
+    getattr(game, move)()
+
+    assert all(row is old_row for row, old_row in zip(game.grid, rows, strict=True))
+
+
+#===============================
+# Step (logic-only move) tests
+#===============================
+
+@pytest.mark.parametrize(
+    "move, method",
+    [("l", "move_left"), ("r", "move_right"), ("u", "move_up"), ("d", "move_down")]
+)
+def test_step_matches_move(move: MoveLiteral, method: str):
+    grid = [
+        [2, 2, 0, 4],
+        [0, 4, 0, 4],
+        [8, 0, 8, 0],
+        [0, 0, 0, 2]
+    ]
+    game, reference = Game(size=4), Game(size=4)
+    game.grid = [row[:] for row in grid]
+    reference.grid = [row[:] for row in grid]
+
+    changed, _ = game.step(move)
+    expected_changed, _, _ = getattr(reference, method)()
+
+    assert changed == expected_changed
+    assert game.grid == reference.grid
+
+
+@pytest.mark.parametrize(
+    "grid, expected_changed, expected_score",
+    [
+        pytest.param(
+            [
+                [2, 2, 4, 4],
+                [8, 0, 8, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 2]
+            ],
+            True,
+            4 + 8 + 16,
+            id="merges"
+        ),
+        pytest.param(
+            [
+                [2, 0, 0, 0],
+                [4, 8, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0]
+            ],
+            False,
+            0,
+            id="unchanged"
+        ),
+    ]
+)
+def test_step_score(
+    game: Game, grid: list[list[int]], expected_changed: bool, expected_score: int
+):
+    game.grid = grid
+
+    assert game.step("l") == (expected_changed, expected_score)
+
+
+@pytest.mark.parametrize("move", ["l", "r", "u", "d"])
+def test_preview_matches_move_without_mutating(move: MoveLiteral):
+    rng = random.Random(11)
+    for _ in range(50):
+        grid = [[rng.choice([0, 0, 2, 2, 4, 8]) for _ in range(4)] for _ in range(4)]
+        game = Game(4)
+        game.grid = [row[:] for row in grid]
+        hash_before = game.zobrist_hash
+
+        board, changed, score, bias = game.preview(move)
+
+        assert game.grid == grid
+        assert game.zobrist_hash == hash_before
+        assert game.score == 0
+
+        expected_changed, expected_bias, _, expected_score = game._move(move)
+        assert board == game.board
+        assert (changed, score) == (expected_changed, expected_score)
+        assert bias == tuple(map(tuple, expected_bias))
+
+
+def test_preview_is_memoized(game: Game):
+    game.grid = [[2, 2, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+    first = game.preview("l")
+    second = game.preview("l")
+    game.preview("r")
+
+    assert first is second
+    assert (game.preview_cache.hits, game.preview_cache.misses) == (1, 2)
+
+
+def test_preview_cache_is_bounded():
+    game = Game(2, preview_cache_size=2)
+
+    for move in ("l", "r", "u", "d"):
+        game.preview(move)
+
+    assert len(game.preview_cache) == 2
+    assert (game.zobrist_hash, "d") in game.preview_cache
+    assert (game.zobrist_hash, "l") not in game.preview_cache
+
+
+def test_successors_match_moves():
+    rng = random.Random(12)
+    for _ in range(50):
+        grid = [[rng.choice([0, 2, 2, 4, 8]) for _ in range(4)] for _ in range(4)]
+        game = Game(4)
+        game.grid = grid
+
+        expected = []
+        for move in ("l", "r", "u", "d"):
+            clone = Game(4)
+            clone.grid = [row[:] for row in grid]
+            changed, score = clone.step(move)
+            if changed:
+                expected.append((move, clone.board, score))
+
+        assert list(game.successors()) == expected
+        assert list(game.successors(game.board)) == expected
+
+
+def test_successors_of_stuck_grid(game: Game):
+    game.grid = [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]]
+
+    assert list(game.successors()) == []
+
+
+def test_spawn_outcomes(game_2x2: Game):
+    game_2x2.grid = [[2, 0], [4, 0]]
+
+    outcomes = list(game_2x2.spawn_outcomes())
+
+    assert [tile for _, _, tile in outcomes] == [
+        (2, 0, 1), (4, 0, 1), (2, 1, 1), (4, 1, 1)
+    ]
+    assert [probability for _, probability, _ in outcomes] == pytest.approx(
+        [0.45, 0.05, 0.45, 0.05]
+    )
+    assert outcomes[1][0].to_grid() == [[2, 4], [4, 0]]
+    assert game_2x2.grid == [[2, 0], [4, 0]]
+
+
+def test_spawn_outcomes_of_full_grid(game_2x2: Game):
+    game_2x2.grid = [[2, 4], [4, 2]]
+
+    assert list(game_2x2.spawn_outcomes()) == []
+
+
+def test_undo_redo_restores_state():
+    game = Game(4, history=True, rng=random.Random(13))
+    game.insert_new_tile()
+    snapshots = [(game.board, game.score, game.max_tile, game.zobrist_hash)]
+    for move in itertools.islice(itertools.cycle("ldru"), 60):
+        if game.step(move)[0]:
+            game.insert_new_tile()
+            snapshots.append(
+                (game.board, game.score, game.max_tile, game.zobrist_hash)
+            )
+
+    for expected in reversed(snapshots[:-1]):
+        assert game.undo()
+        assert (game.board, game.score, game.max_tile, game.zobrist_hash) == expected
+    assert not game.undo()
+
+    for expected in snapshots[1:]:
+        assert game.redo()
+        assert (game.board, game.score, game.max_tile, game.zobrist_hash) == expected
+    assert not game.redo()
+
+
+def test_undo_keeps_derived_state():
+    game = Game(2, history=True)
+    game.grid = [[1024, 1024], [0, 0]]
+    game.step("l")
+    assert game.check_victory()
+
+    game.undo()
+
+    assert game.grid == [[1024, 1024], [0, 0]]
+    assert not game.check_victory()
+    assert game.legal_moves() == MoveMask.LEFT | MoveMask.RIGHT | MoveMask.DOWN
+    game.insert_new_tile()
+    assert game.grid[1].count(0) == 1
+
+
+def test_new_move_clears_redo():
+    game = Game(2, history=True)
+    game.grid = [[2, 0], [0, 0]]
+    game.step("r")
+    game.undo()
+
+    game.step("d")
+
+    assert not game.redo()
+    assert game.grid == [[0, 0], [2, 0]]
+
+
+def test_history_is_disabled_by_default(game: Game):
+    game.grid = [[2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+    game.step("r")
+
+    assert not game.undo()
+    assert game.grid[0] == [0, 0, 0, 2]
+
+
+def test_move_events(game: Game):
+    game.grid = [[2, 2, 4, 0], [0, 0, 0, 8], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+    changed, events, score = game.move("r")
+
+    assert changed is True
+    assert score == 4
+    assert events == [
+        MoveEvent(0, 2, 0, 3, 4),
+        MoveEvent(0, 1, 0, 2, 2),
+        MoveEvent(0, 0, 0, 2, 2, merged=True),
+    ]
+    assert game.grid[0] == [0, 0, 4, 4]
+
+
+@pytest.mark.parametrize(
+    "move, method",
+    [("l", "move_left"), ("r", "move_right"), ("u", "move_up"), ("d", "move_down")],
+)
+def test_move_events_match_bias_matrix(move: MoveLiteral, method: str):
+    rng = random.Random(14)
+    for _ in range(25):
+        grid = [[rng.choice([0, 0, 2, 2, 4]) for _ in range(4)] for _ in range(4)]
+        game = Game(4)
+        game.grid = [row[:] for row in grid]
+        _, bias_matrix, _ = getattr(game, method)()
+        game.grid = grid
+
+        _, events, _ = game.move(move)
+
+        assert {
+            (event.from_row, event.from_col): abs(
+                event.to_row - event.from_row + event.to_col - event.from_col
+            )
+            for event in events
+        } == {
+            (r, c): bias
+            for r, row in enumerate(bias_matrix)
+            for c, bias in enumerate(row)
+            if bias
+        }
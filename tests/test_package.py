@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+import game
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["from game.core.game import Game", "import game", "from game import Game"],
+)
+def test_headless_imports_do_not_load_pygame(statement: str):
+    code = f"{statement}\nimport sys\nprint('pygame' in sys.modules)"
+
+    assert run_python(code) == "False"
+
+
+def test_exports_resolve_lazily():
+    from game.core.game import Game
+    from game.rendering.renderer import Renderer
+
+    assert game.Game is Game
+    assert game.Renderer is Renderer
+    assert set(game.__all__) <= set(dir(game))
+    with pytest.raises(AttributeError):
+        _ = game.Missing
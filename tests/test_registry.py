@@ -0,0 +1,75 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from game.core import registry, tables
+from game.core.codegen import get_step_functions
+from game.core.registry import TableRegistry, attach_tables
+from game.core.rules import TRIPLE_MERGE
+from game.core.tables import TableGame
+from game.sim.pool import warm_pool
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(isolated_tables: None, monkeypatch: pytest.MonkeyPatch):
+    """Also keep the blocks attached by this process per test."""
+    monkeypatch.setattr(registry, "_attached", {})
+
+
+def table_state(size: int, base: int) -> tuple[bool, bytes, int]:
+    """Return whether the worker's row table views shared memory, its content
+    and the number of compiled step function sets.
+    """
+    table = tables.get_row_table(size, base)
+    shared = isinstance(table.buffer, memoryview)
+    return shared, bytes(table.shifted), get_step_functions.cache_info().currsize
+
+
+def test_attached_table_matches_published():
+    with TableRegistry() as registry_:
+        handle = registry_.publish(3, base=5)
+        assert registry_.publish(3, base=5) is handle
+        original = bytes(tables.get_row_table(3, 5).shifted)
+        tables._row_tables.clear()
+
+        attach_tables(registry_.handles)
+        table = tables.get_row_table(3, 5)
+
+        assert isinstance(table.buffer, memoryview)
+        assert bytes(table.shifted) == original
+
+
+def test_table_game_uses_attached_rules_table():
+    with TableRegistry() as registry_:
+        registry_.publish(3, base=6, rules=TRIPLE_MERGE)
+        tables._row_tables.clear()
+        attach_tables(registry_.handles)
+
+        game = TableGame(3, base=6, rules=TRIPLE_MERGE)
+        game.grid = [[3, 3, 3], [0, 0, 0], [0, 0, 0]]
+        game.move_left()
+
+        assert isinstance(game._table.buffer, memoryview)
+        assert game.grid[0] == [9, 0, 0]
+
+
+def test_warm_pool_workers_attach_before_jobs():
+    with TableRegistry() as registry_:
+        registry_.publish(3, base=5)
+        with warm_pool(2, sizes=(3,), tables=registry_.handles) as pool:
+            states = pool.starmap(table_state, [(3, 5)] * 4)
+
+    expected = bytes(tables.get_row_table(3, 5).shifted)
+    assert all(shared for shared, _, _ in states)
+    assert all(shifted == expected for _, shifted, _ in states)
+    assert all(compiled >= 1 for _, _, compiled in states)
+
+
+def test_close_unlinks_blocks():
+    registry_ = TableRegistry()
+    name = registry_.publish(2, base=4).name
+    registry_.close()
+
+    assert registry_.handles == ()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
@@ -0,0 +1,115 @@
+import collections
+import pickle
+
+import pytest
+
+from game.core.game import Game
+from game.core.rng import RandomStreams, Xoshiro256
+
+
+def test_matches_reference_outputs():
+    rng = Xoshiro256(0)
+    rng._state = [1, 2, 3, 4]
+    rng._block = []
+
+    assert [rng.next64() for _ in range(4)] == [
+        11520, 0, 1509978240, 1215971899390074240,
+    ]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 256])
+def test_block_size_does_not_change_the_sequence(block_size: int):
+    expected = Xoshiro256(42)
+    rng = Xoshiro256(42, block_size)
+
+    assert [rng.next64() for _ in range(600)] == [
+        expected.next64() for _ in range(600)
+    ]
+
+
+def test_streams_are_reproducible_and_distinct():
+    streams = RandomStreams("experiment")
+    first = [streams.stream(i).random() for i in range(4)]
+    again = RandomStreams("experiment")
+
+    assert [again.stream(i).random() for i in range(3, -1, -1)] == first[::-1]
+    assert len(set(first)) == 4
+
+
+def test_jumped_hands_out_consecutive_streams():
+    rng = RandomStreams(7).stream(0)
+    first = rng.jumped()
+    second = rng.jumped()
+
+    assert first.next64() == RandomStreams(7).stream(0).next64()
+    assert second.next64() == RandomStreams(7).stream(1).next64()
+    assert rng.next64() == RandomStreams(7).stream(2).next64()
+    assert {first.next64() for _ in range(64)}.isdisjoint(
+        second.next64() for _ in range(64)
+    )
+
+
+def test_negative_seeds_differ():
+    assert Xoshiro256(-5).next64() != Xoshiro256(5).next64()
+
+
+def test_jumped_generator_skips_predrawn_outputs():
+    rng = Xoshiro256(7, block_size=4)
+    rng.random()
+    jumped = rng.jumped()
+    remaining = [rng.next64() for _ in range(3)]
+
+    assert not set(remaining) & {jumped.next64() for _ in range(64)}
+
+
+def test_state_round_trips():
+    rng = Xoshiro256(3)
+    rng.random()
+    state = rng.getstate()
+    expected = [rng.random() for _ in range(10)]
+
+    rng.setstate(state)
+    restored = pickle.loads(pickle.dumps(rng))
+
+    assert [rng.random() for _ in range(10)] == expected
+    assert [restored.random() for _ in range(10)] == expected
+
+
+def test_randrange_is_uniform():
+    rng = Xoshiro256(5)
+    counts = collections.Counter(rng.randrange(6) for _ in range(60_000))
+
+    assert sorted(counts) == list(range(6))
+    assert all(9_000 < count < 11_000 for count in counts.values())
+
+
+def test_getrandbits_returns_requested_width():
+    rng = Xoshiro256(9)
+
+    assert rng.getrandbits(0) == 0
+    assert all(rng.getrandbits(100) < 1 << 100 for _ in range(100))
+
+
+def test_game_spawns_from_its_own_rng():
+    game = Game(rng=Xoshiro256(1))
+    other = Game(rng=Xoshiro256(1))
+
+    spawns = [game.insert_new_tile() for _ in range(8)]
+
+    assert [other.insert_new_tile() for _ in range(8)] == spawns
+
+
+def test_replay_is_reproducible():
+    moves = "lurdldru" * 10
+    game = Game.replay(123, 2, moves)
+
+    assert Game.replay(123, 2, moves).grid == game.grid
+    assert Game.replay(123, 3, moves).grid != game.grid
+
+
+def test_far_stream_matches_repeated_jumps():
+    rng = Xoshiro256(11)
+    for _ in range(37):
+        rng.jumped()
+
+    assert RandomStreams(11).stream(37).next64() == rng.next64()
@@ -0,0 +1,116 @@
+import itertools
+import random
+from pathlib import Path
+
+import pytest
+
+from game.core.rules import CAPPED_2048, STANDARD, TRIPLE_MERGE, Rules
+from game.core.tables import TableGame, shift_exponents
+
+pytestmark = pytest.mark.usefixtures("isolated_tables")
+
+
+def test_standard_rules_match_shift_exponents():
+    for cells in itertools.product(range(5), repeat=4):
+        assert STANDARD.shift_line(cells) == shift_exponents(cells)
+
+
+@pytest.mark.parametrize(
+    "rules, cells, expected",
+    [
+        pytest.param(
+            CAPPED_2048, (11, 11, 10, 10), ([11, 11, 11, 0], [0, 0, 0, 1], 2048),
+            id="merge_cap",
+        ),
+        pytest.param(
+            TRIPLE_MERGE, (1, 1, 1, 1), ([2, 1, 0, 0], [0, 1, 2, 2], 9),
+            id="triple",
+        ),
+        pytest.param(
+            TRIPLE_MERGE, (1, 1, 0, 2), ([1, 1, 2, 0], [0, 0, 0, 1], 0),
+            id="triple_pair_stays",
+        ),
+        pytest.param(
+            TRIPLE_MERGE, (2, 1, 1, 1), ([2, 2, 0, 0], [0, 0, 1, 2], 9),
+            id="triple_no_chain_merge",
+        ),
+    ],
+)
+def test_shift_line(
+    rules: Rules, cells: tuple[int, ...], expected: tuple[list[int], list[int], int]
+):
+    assert rules.shift_line(cells) == expected
+
+
+def test_value_and_exponent():
+    assert TRIPLE_MERGE.value(3) == 27
+    assert TRIPLE_MERGE.exponent(27) == 3
+    assert STANDARD.exponent(0) == 0
+    with pytest.raises(ValueError):
+        TRIPLE_MERGE.exponent(6)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"merge_count": 1}, {"spawns": ((1, 0.5),)}, {"spawns": ((0, 1.0),)}],
+)
+def test_invalid_rules(kwargs: dict):
+    with pytest.raises(ValueError):
+        Rules(**kwargs)
+
+
+def test_draw_spawn_matches_game_distribution():
+    random.seed(17)
+    draws = [STANDARD.draw_spawn() for _ in range(100)]
+    random.seed(17)
+    expected = [1 if random.random() < 0.9 else 2 for _ in range(100)]
+
+    assert draws == expected
+    assert Rules(spawns=((3, 1.0),)).draw_spawn() == 3
+
+
+def test_variants_use_their_own_tables(tmp_path: Path):
+    standard = TableGame(3)
+    triple = TableGame(3, rules=TRIPLE_MERGE)
+
+    assert standard._table is not triple._table
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_tile_base_gets_its_own_table():
+    standard = TableGame(3)
+    base_three = TableGame(3, rules=Rules(tile_base=3))
+    base_three._cells = [1, 1, 0, 0, 0, 0, 0, 0, 0]
+
+    base_three.move_left()
+
+    assert base_three._table is not standard._table
+    assert base_three._cells[:3] == [2, 0, 0]
+    assert base_three.score == 9
+
+
+@pytest.mark.parametrize("rules", [CAPPED_2048, TRIPLE_MERGE])
+@pytest.mark.parametrize("move", ["move_left", "move_right", "move_up", "move_down"])
+def test_table_game_matches_rules(rules: Rules, move: str):
+    rng = random.Random(rules.merge_count)
+    for _ in range(50):
+        game = TableGame(4, base=13, rules=rules)
+        game._cells = [rng.choice([0, 0, 1, 1, 2, 10, 11, 12]) for _ in range(16)]
+        lines = [[game._cells[idx] for idx in line] for line in game._lines[move[5]]]
+
+        getattr(game, move)()
+
+        for line, cells in zip(game._lines[move[5]], lines, strict=True):
+            assert [game._cells[idx] for idx in line] == rules.shift_line(cells)[0]
+
+
+def test_triple_merge_game():
+    game = TableGame(3, rules=TRIPLE_MERGE)
+    game.grid = [[3, 3, 3], [0, 9, 0], [0, 0, 0]]
+
+    changed, _, _ = game.move_left()
+
+    assert changed is True
+    assert game.grid == [[9, 0, 0], [9, 0, 0], [0, 0, 0]]
+    assert game.score == 9
+    assert game.get_score() == 9
@@ -0,0 +1,154 @@
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from game.core.game import Game
+from game.sim import POLICIES, get_policy, play_game, run_simulation
+from game.sim.__main__ import main
+from game.sim.pool import warm_pool
+from game.sim.runner import load_completed
+
+
+def without_duration(results: list[dict]) -> list[dict]:
+    return sorted(
+        ({k: v for k, v in result.items() if k != "duration"} for result in results),
+        key=lambda result: result["game_id"],
+    )
+
+
+def read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize("policy", sorted(POLICIES))
+def test_play_game_is_reproducible(policy: str):
+    first = play_game(3, 7, policy, size=3)
+    second = play_game(3, 7, policy, size=3)
+
+    assert first._replace(duration=0) == second._replace(duration=0)
+    assert first.moves > 0
+    assert first.max_tile >= 4
+
+
+def test_game_replays_from_its_seed():
+    moves = []
+
+    def recording_policy(game, rng):
+        move = POLICIES["random"](game, rng)
+        moves.append(move)
+        return move
+
+    POLICIES["recording"] = recording_policy
+    try:
+        result = play_game(5, 1, "recording", size=3)
+    finally:
+        del POLICIES["recording"]
+        get_policy.cache_clear()
+
+    game = Game.replay(1, 5, moves, size=3)
+    assert (game.score, game.max_tile) == (result.score, result.max_tile)
+    assert not game.can_move()
+
+
+def test_plugin_policy_and_unknown_policy():
+    assert get_policy("game.sim.policies:corner_policy") is POLICIES["corner"]
+    with pytest.raises(ValueError):
+        get_policy("missing")
+
+
+def test_writes_jsonl_and_resumes(tmp_path: Path):
+    output = tmp_path / "results.jsonl"
+    run_simulation(3, "corner", size=3, workers=1, output=output)
+    # Simulate a run interrupted in the middle of writing a line
+    with open(output, "a") as file:
+        file.write('{"game_id": 3, "se')
+
+    summary = run_simulation(6, "corner", size=3, workers=1, output=output, resume=True)
+
+    results = read_jsonl(output)
+    assert summary.games == 3
+    assert [result["game_id"] for result in results] == [0, 1, 2, 3, 4, 5]
+    fresh = tmp_path / "fresh.jsonl"
+    run_simulation(6, "corner", size=3, workers=1, output=fresh)
+    assert without_duration(results) == without_duration(read_jsonl(fresh))
+
+
+def test_writes_csv(tmp_path: Path):
+    output = tmp_path / "results.csv"
+    run_simulation(4, "random", size=3, workers=1, output=output)
+    run_simulation(4, "random", size=3, workers=1, output=output, resume=True)
+
+    lines = output.read_text().splitlines()
+    assert lines[0].startswith("game_id,seed,policy,size,moves")
+    assert len(lines) == 5
+    assert load_completed(output, "csv") == {0, 1, 2, 3}
+
+
+def test_process_pool_matches_single_process(tmp_path: Path):
+    single = tmp_path / "single.jsonl"
+    pooled = tmp_path / "pooled.jsonl"
+
+    run_simulation(8, "greedy", size=3, seed=2, workers=1, output=single)
+    summary = run_simulation(8, "greedy", size=3, seed=2, workers=2, output=pooled)
+
+    assert summary.games == 8
+    assert without_duration(read_jsonl(pooled)) == without_duration(
+        read_jsonl(single)
+    )
+
+
+def test_cli_reports_throughput(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    output = tmp_path / "results.jsonl"
+
+    main(["--games", "5", "--size", "3", "--workers", "1", "--output", str(output)])
+
+    assert len(read_jsonl(output)) == 5
+    assert "games/s" in capsys.readouterr().err
+
+
+def test_cli_resume_requires_output():
+    with pytest.raises(SystemExit):
+        main(["--resume"])
+
+
+@pytest.mark.parametrize(
+    "policy", ["missing", "no_such_module:policy", "game.sim.policies:missing"]
+)
+def test_cli_rejects_unknown_policy(
+    policy: str, capsys: pytest.CaptureFixture[str]
+):
+    with pytest.raises(SystemExit):
+        main(["--games", "1", "--policy", policy])
+    assert "--policy" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("name", ["results.jsonl", "results.csv"])
+@pytest.mark.parametrize(
+    "changed", [{"seed": 1}, {"policy": "greedy"}, {"size": 4}], ids=str
+)
+def test_resume_refuses_another_run(tmp_path: Path, name: str, changed: dict):
+    output = tmp_path / name
+    params = {"policy": "corner", "size": 3, "seed": 0}
+    run_simulation(2, workers=1, output=output, **params)
+    before = output.read_text()
+
+    with pytest.raises(ValueError):
+        run_simulation(
+            4, workers=1, output=output, resume=True, **{**params, **changed}
+        )
+    args = [f"--{key}={value}" for key, value in {**params, **changed}.items()]
+    with pytest.raises(SystemExit):
+        main(["--games", "4", "--output", str(output), "--resume", *args])
+    assert output.read_text() == before
+
+
+def test_simulation_reuses_warm_pool():
+    with warm_pool(2, sizes=(3,)) as pool:
+        first = run_simulation(4, "corner", size=3, pool=pool)
+        second = run_simulation(4, "corner", size=3, pool=pool)
+
+    assert first.games == second.games == 4
+    assert first.moves == second.moves
+    assert multiprocessing.active_children() == []
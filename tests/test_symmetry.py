@@ -0,0 +1,80 @@
+import gc
+import random
+
+import pytest
+
+from game.core.board import Board
+from game.core.game import Game
+from game.core.symmetry import (
+    TRANSFORM_COUNT,
+    BoardPool,
+    canonicalize,
+    map_move,
+    transform,
+    unmap_move,
+)
+
+
+def random_board(rng: random.Random, size: int) -> Board:
+    return Board.from_grid(
+        [[rng.choice([0, 0, 2, 4, 8, 16]) for _ in range(size)] for _ in range(size)]
+    )
+
+
+def test_transforms_of_a_board():
+    board = Board.from_grid([[2, 4], [8, 16]])
+
+    assert transform(board, 0) == board
+    assert transform(board, 1).to_grid() == [[8, 2], [16, 4]]
+    assert transform(board, 4).to_grid() == [[4, 2], [16, 8]]
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5])
+def test_equivalent_boards_share_canonical_form(size: int):
+    rng = random.Random(size)
+    for _ in range(50):
+        board = random_board(rng, size)
+        canonical, transform_id = canonicalize(board)
+
+        assert transform(board, transform_id) == canonical
+        for other_id in range(TRANSFORM_COUNT):
+            assert canonicalize(transform(board, other_id))[0] == canonical
+
+
+@pytest.mark.parametrize("size", [3, 4])
+@pytest.mark.parametrize("move", ["l", "r", "u", "d"])
+def test_mapped_moves_commute_with_transforms(size: int, move: str):
+    rng = random.Random(size)
+    for _ in range(30):
+        board = random_board(rng, size)
+        for transform_id in range(TRANSFORM_COUNT):
+            game = Game(size)
+            game.board = board
+            game.step(move)
+
+            mapped = Game(size)
+            mapped.board = transform(board, transform_id)
+            mapped.step(map_move(move, transform_id, size))
+
+            mapped_move = map_move(move, transform_id, size)
+            assert mapped.board == transform(game.board, transform_id)
+            assert unmap_move(mapped_move, transform_id, size) == move
+
+
+def test_pool_interns_canonical_boards():
+    pool = BoardPool()
+    board = Board.from_grid([[2, 0], [0, 0]])
+
+    first, _ = pool.canonical(board)
+    second, _ = pool.canonical(transform(board, 3))
+
+    assert first is second
+    assert len(pool) == 1
+
+
+def test_pool_drops_unused_boards():
+    pool = BoardPool()
+    pool.intern(Board.from_grid([[2, 4], [0, 0]]))
+    gc.collect()
+
+    assert len(pool) == 0
@@ -0,0 +1,142 @@
+import copy
+import mmap
+import random
+from pathlib import Path
+
+import pytest
+
+from game.core.game import Game
+from game.core.tables import (
+    RowTable,
+    TableGame,
+    build_row_table,
+    default_base,
+    get_row_table,
+    load_row_table,
+    shift_exponents,
+)
+
+pytestmark = pytest.mark.usefixtures("isolated_tables")
+
+
+@pytest.mark.parametrize(
+    "cells, expected",
+    [
+        pytest.param((0, 0, 0), ([0, 0, 0], [0, 0, 0], 0), id="empty"),
+        pytest.param((1, 1, 0, 2), ([2, 2, 0, 0], [0, 1, 0, 2], 4), id="merge"),
+        pytest.param((1, 1, 1), ([2, 1, 0], [0, 1, 1], 4), id="no_chain_merge"),
+        pytest.param((0, 3, 0, 3), ([4, 0, 0, 0], [0, 1, 0, 3], 16), id="gap_merge"),
+    ],
+)
+def test_shift_exponents(
+    cells: tuple[int, ...], expected: tuple[list[int], list[int], int]
+):
+    assert shift_exponents(cells) == expected
+
+
+@pytest.mark.parametrize("size, expected", [(3, 16), (4, 16), (5, 16), (6, 12)])
+def test_default_base(size: int, expected: int):
+    assert default_base(size) == expected
+
+
+def test_row_table_lookup():
+    table = RowTable(build_row_table(3, 4))
+    # (1, 1, 2) in base 4
+    idx = (1 * 4 + 1) * 4 + 2
+
+    assert table.rows == 64
+    assert list(table.shifted[idx * 3 : idx * 3 + 3]) == [2, 2, 0]
+    assert list(table.bias[idx * 3 : idx * 3 + 3]) == [0, 1, 1]
+    assert table.score[idx] == 4
+
+
+def test_row_table_rejects_foreign_buffer():
+    buffer = build_row_table(2, 4)
+    buffer[8] ^= 0xFF  # corrupt the version
+
+    with pytest.raises(ValueError):
+        RowTable(buffer)
+
+
+def test_load_row_table_persists_and_maps_cache(tmp_path: Path):
+    built = load_row_table(3, 5, tmp_path)
+    cache_files = list(tmp_path.iterdir())
+
+    loaded = load_row_table(3, 5, tmp_path)
+
+    assert len(cache_files) == 1
+    assert isinstance(loaded._buffer, mmap.mmap)
+    assert loaded.shifted.tobytes() == built.shifted.tobytes()
+    assert loaded.bias.tobytes() == built.bias.tobytes()
+    assert loaded.score.tolist() == built.score.tolist()
+
+
+def test_load_row_table_rebuilds_corrupted_cache(tmp_path: Path):
+    load_row_table(2, 4, tmp_path)
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_bytes(b"garbage")
+
+    table = load_row_table(2, 4, tmp_path)
+
+    assert table.rows == 16
+    assert cache_file.read_bytes() == build_row_table(2, 4)
+
+
+def test_load_row_table_rebuilds_cache_of_another_table(tmp_path: Path):
+    load_row_table(2, 4, tmp_path)
+    (other_file,) = tmp_path.iterdir()
+    cache_file = tmp_path / other_file.name.replace("-b4-", "-b5-")
+    cache_file.write_bytes(other_file.read_bytes())
+
+    table = load_row_table(2, 5, tmp_path)
+
+    assert (table.size, table.base, table.rows) == (2, 5, 25)
+    assert cache_file.read_bytes() == build_row_table(2, 5)
+
+
+def test_get_row_table_is_loaded_once():
+    assert get_row_table(3, 4) is get_row_table(3, 4)
+
+
+def test_insert_new_tile():
+    game = TableGame(3)
+
+    value, row, col = game.insert_new_tile()
+
+    assert value in (2, 4)
+    assert game.grid[row][col] == value
+
+
+def test_score_accumulates_merges():
+    game = TableGame(3)
+    game.grid = [[2, 2, 4], [8, 0, 8], [0, 0, 0]]
+
+    game.move_left()
+
+    assert game.score == 4 + 16
+
+
+@pytest.mark.parametrize(
+    "size, base",
+    [
+        pytest.param(2, None, id="2x2"),
+        pytest.param(3, None, id="3x3"),
+        pytest.param(5, 4, id="5x5_with_fallback"),
+    ],
+)
+@pytest.mark.parametrize("move", ["move_left", "move_right", "move_up", "move_down"])
+def test_moves_match_game(size: int, base: int | None, move: str):
+    rng = random.Random(size)
+    for _ in range(100):
+        grid = [
+            [rng.choice([0, 0, 2, 2, 4, 8, 16, 2048]) for _ in range(size)]
+            for _ in range(size)
+        ]
+        game = Game(size)
+        game.grid = copy.deepcopy(grid)
+        table_game = TableGame(size, base)
+        table_game.grid = grid
+
+        assert getattr(table_game, move)() == getattr(game, move)()
+        assert table_game.grid == game.grid
+        assert table_game.can_move() == game.can_move()
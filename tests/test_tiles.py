@@ -4,9 +4,13 @@ from unittest.mock import Mock
 import pytest
 
 from game.core.game import Game
-from game.core.types import MoveLiteral
+from game.core.types import MoveEvent, MoveLiteral
 from game.rendering.animations.animation_manager import AnimationManager
-from game.rendering.animations.animations import AppearAnimation, MergeAnimation
+from game.rendering.animations.animations import (
+    AppearAnimation,
+    MergeAnimation,
+    ShiftAnimation,
+)
 from game.rendering.tiles import Tile
 from game.rendering.tiles.tiles import TileManager
 
@@ -293,3 +297,70 @@ def test_detect_merges_error(
 
     with pytest.raises(expected_exception):
         tile_manager.detect_merges()
+
+
+def test_rebuild(tile_manager: TileManager):
+    tile_manager.tiles = [Tile(2, 0, 0, 0)]
+    tile_manager.next_tile_id = 1
+    tile_manager.game.grid = [
+        [0, 4, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 2],
+    ]
+
+    tile_manager.rebuild()
+
+    assert tile_manager.tiles == [Tile(4, 0, 1, 1), Tile(2, 3, 3, 2)]
+    tile_manager.anim_manager.add.assert_not_called()
+
+
+def test_append_move_events(tile_manager: TileManager):
+    # Row [2, 2, 4, 0] moved right: 4 slides, then the 2s merge behind it
+    tile_manager.tiles = [Tile(2, 0, 0, 0), Tile(2, 0, 1, 1), Tile(4, 0, 2, 2)]
+    tile_manager.next_tile_id = 3
+    tile_manager.anim_manager = Mock(spec=AnimationManager)
+    events = [
+        MoveEvent(0, 2, 0, 3, 4),
+        MoveEvent(0, 1, 0, 2, 2),
+        MoveEvent(0, 0, 0, 2, 2, merged=True),
+    ]
+
+    tile_manager.append_move_events(events)
+
+    assert tile_manager.tiles == [Tile(2, 0, 2, 0), Tile(2, 0, 2, 1), Tile(4, 0, 3, 2)]
+    shifts = [call.args for call in tile_manager.anim_manager.add.call_args_list]
+    assert [tile_id for tile_id, _ in shifts] == [2, 1, 0]
+    assert all(isinstance(anim, ShiftAnimation) for _, anim in shifts)
+
+    tile_manager.detect_merges()
+
+    assert tile_manager.tiles == [Tile(4, 0, 3, 2), Tile(4, 0, 2, 3)]
+
+
+def test_append_move_events_requires_a_tile(tile_manager: TileManager):
+    tile_manager.tiles = [Tile(2, 0, 3, 0)]
+
+    with pytest.raises(RuntimeError):
+        tile_manager.append_move_events([MoveEvent(0, 2, 0, 0, 2)])
+
+
+def test_move_events_keep_tiles_in_sync_with_game():
+    game = Game(4)
+    game.grid = [[2, 2, 4, 0], [0, 4, 0, 4], [8, 0, 8, 8], [2, 0, 0, 2]]
+    tile_manager = TileManager(game, Mock(AnimationManager))
+    tile_manager.rebuild()
+
+    for move in ("r", "d", "l", "u"):
+        _, events, _ = game.move(move)
+        tile_manager.append_move_events(events)
+        tile_manager.detect_merges()
+
+        tiles = {(tile.row, tile.col): tile.value for tile in tile_manager.tiles}
+        assert len(tiles) == len(tile_manager.tiles)
+        assert tiles == {
+            (r, c): value
+            for r, row in enumerate(game.grid)
+            for c, value in enumerate(row)
+            if value
+        }
@@ -0,0 +1,84 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from game.core.game import Game
+from game.core.rng import RandomStreams
+
+np = pytest.importorskip("numpy")
+
+from game.core.batch import MOVES  # noqa: E402
+from game.sim.vec_env import SubprocVecEnv  # noqa: E402
+
+
+def new_game(size: int, seed: int, stream_id: int = 0, rng=None) -> Game:
+    game = Game(size, rng=rng or RandomStreams(seed).stream(stream_id))
+    game.insert_new_tile()
+    return game
+
+
+def test_matches_games_stepped_in_process():
+    num_envs, size = 5, 3
+    games = [new_game(size, 4, idx) for idx in range(num_envs)]
+    policy = np.random.default_rng(0)
+
+    with SubprocVecEnv(num_envs, size, workers=2, seed=4) as env:
+        observations = env.observations
+        assert [bytes(obs) for obs in observations] == [g.board.cells for g in games]
+
+        for _ in range(300):
+            actions = policy.integers(0, len(MOVES), num_envs)
+            observations, rewards, dones, infos = env.step(actions)
+
+            for idx, game in enumerate(games):
+                changed, score = game.step(MOVES[actions[idx]])
+                if changed:
+                    game.insert_new_tile()
+                assert infos["changed"][idx] == changed
+                assert rewards[idx] == score
+                assert dones[idx] == (not game.can_move())
+                if dones[idx]:
+                    assert infos["final_score"][idx] == game.score
+                    assert infos["final_max_tile"][idx] == game.max_tile
+                    games[idx] = game = new_game(size, 0, rng=game.rng)
+                assert bytes(observations[idx]) == game.board.cells
+        assert dones.dtype == bool
+
+
+def test_explicit_seeds_reproduce_episodes():
+    actions = "lrud" * 50
+
+    def play() -> list[bytes]:
+        with SubprocVecEnv(3, 2, workers=3, seeds=["a", "b", "a"]) as env:
+            env.reset()
+            boards = []
+            for move in actions:
+                observations, *_ = env.step(move * 3)
+                boards.append(observations.tobytes())
+            return boards
+
+    boards = play()
+
+    assert boards == play()
+    # Envs 0 and 2 share a seed, so they evolve identically
+    assert all(board[:4] == board[8:] for board in boards)
+
+
+def test_validates_actions():
+    with SubprocVecEnv(2, 2, workers=1) as env:
+        with pytest.raises(ValueError):
+            env.step([0])
+        with pytest.raises(ValueError):
+            env.step([0, 4])
+
+
+def test_close_frees_shared_memory():
+    env = SubprocVecEnv(2, 2, workers=2)
+    name = env._shm.name
+    env.close()
+
+    assert all(not process.is_alive() for process in env._processes)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
+    with pytest.raises(RuntimeError):
+        env.reset()
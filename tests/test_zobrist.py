@@ -0,0 +1,56 @@
+import random
+import subprocess
+import sys
+
+from game import Game
+from game.core.types import MoveLiteral
+from game.core.zobrist import get_zobrist_table, zobrist_hash
+
+
+def test_table_is_deterministic_per_size():
+    assert get_zobrist_table(4) == get_zobrist_table(4)
+    assert get_zobrist_table(3)[:9] != get_zobrist_table(4)[:9]
+
+
+def test_hash_is_stable_across_processes():
+    grid = [[2, 4, 0], [0, 8, 0], [0, 0, 2048]]
+    code = (
+        "from game.core.zobrist import zobrist_hash;"
+        f"print(zobrist_hash({grid!r}))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert int(output.splitlines()[-1]) == zobrist_hash(grid)
+
+
+def test_empty_grid_hash_is_zero():
+    assert Game(size=4).zobrist_hash == 0
+
+
+def test_hash_follows_moves_and_spawns():
+    """The incremental hash always equals the hash computed from scratch."""
+    game = Game(size=4, rng=random.Random(9))
+    rng = random.Random(9)
+    moves: list[MoveLiteral] = ["l", "r", "u", "d"]
+
+    game.insert_new_tile()
+    while game.can_move():
+        changed, _ = game.step(rng.choice(moves))
+        assert game.zobrist_hash == zobrist_hash(game.grid)
+        if changed:
+            game.insert_new_tile()
+            assert game.zobrist_hash == zobrist_hash(game.grid)
+
+
+def test_equal_grids_share_hash():
+    game = Game(size=3)
+    game.grid = [[2, 2, 0], [0, 0, 0], [0, 0, 4]]
+    other = Game(size=3)
+    other.grid = [[0, 0, 4], [0, 0, 0], [0, 0, 4]]
+
+    game.move_right()
+
+    assert game.grid == other.grid
+    assert game.zobrist_hash == other.zobrist_hash